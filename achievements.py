@@ -0,0 +1,61 @@
+import functools
+from collections import namedtuple
+
+import streamlit as st
+
+from learner_progress import CHAPTERS, GAME_XP, subscribe
+
+# --- Achievement Rules ---
+# Each rule unlocks once the total for its event reaches `threshold`. `bit`
+# is its bit in st.session_state.achievements (and in the saved progress),
+# so never reuse or renumber one; new rules take the next free bit.
+Achievement = namedtuple("Achievement", ["bit", "name", "event", "threshold"])
+
+ACHIEVEMENTS = [
+    Achievement(0, "🎯 Beginner Explorer", CHAPTERS, 1),
+    Achievement(1, "🔐 Authentication Master", CHAPTERS, 6),
+    Achievement(2, "🧪 Testing Pro", CHAPTERS, 12),
+    Achievement(3, "🚀 Full Stack Champion", CHAPTERS, 20),
+    Achievement(4, "Backend Challenger", GAME_XP, 25),
+    Achievement(5, "Game Master", GAME_XP, 50),
+]
+
+# Rules per event, lowest threshold first, so an event only looks at its
+# own rules and stops at the first one it hasn't reached
+_rules = {}
+for _rule in sorted(ACHIEVEMENTS, key=lambda a: a.threshold):
+    _rules.setdefault(_rule.event, []).append(_rule)
+
+
+def _check_rules():
+    bits = [a.bit for a in ACHIEVEMENTS]
+    if len(set(bits)) != len(bits):
+        raise ValueError("two achievements share a bit")
+
+
+_check_rules()
+
+
+def _evaluate(event, value, announce):
+    mask = st.session_state.get("achievements", 0)
+    for rule in _rules.get(event, ()):
+        if value < rule.threshold:
+            break
+        if not mask >> rule.bit & 1:
+            mask |= 1 << rule.bit
+            if announce:
+                st.toast(f"🏅 Achievement unlocked: {rule.name}")
+    st.session_state.achievements = mask
+
+
+for _event in _rules:
+    subscribe(_event, functools.partial(_evaluate, _event))
+
+
+# Unlocked achievements, in declaration order; optionally only one event's
+def unlocked(event=None):
+    mask = st.session_state.get("achievements", 0)
+    return [
+        a for a in ACHIEVEMENTS
+        if mask >> a.bit & 1 and (event is None or a.event == event)
+    ]
@@ -0,0 +1,153 @@
+# Image assets: local sources in assets/, optimized variants in static/
+#
+#   python assets.py                      # rebuild static/ from assets/
+#   python assets.py --fetch-background   # download the background photo into assets/ first
+#
+# Every image in assets/ is resized to each of WIDTHS (never upscaled) and
+# saved as WebP and progressive JPEG under a content-hashed name, e.g.
+# static/background-1280.3f9a1c0b2e.webp. static/manifest.json maps image
+# names to their variants. Streamlit serves static/ at app/static/ (see
+# .streamlit/config.toml) and the URLs carry ?v=<hash>, which makes its
+# static handler (tornado's) send a far-future Cache-Control.
+
+import hashlib
+import io
+import json
+import os
+
+from content_cache import cached
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(APP_DIR, "assets")
+STATIC_DIR = os.path.join(APP_DIR, "static")
+MANIFEST_FILE = os.path.join(STATIC_DIR, "manifest.json")
+STATIC_URL = "app/static"
+
+WIDTHS = (640, 1280, 1920, 2560)
+FORMATS = {"webp": {"quality": 78, "method": 6}, "jpeg": {"quality": 80, "optimize": True, "progressive": True}}
+SOURCE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+BACKGROUND_URL = "https://images.unsplash.com/photo-1507842217343-583bb7270b66"
+
+
+# --- Runtime ---
+def _load_manifest():
+    try:
+        with open(MANIFEST_FILE) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def manifest():
+    return cached("assets:manifest", _load_manifest)
+
+
+# Variant URLs of an image by width, for one format; {} if it wasn't built
+def variant_urls(name, fmt):
+    variants = manifest().get(name, {}).get(fmt, {})
+    return {int(width): f"{STATIC_URL}/{entry['file']}?v={entry['hash']}" for width, entry in variants.items()}
+
+
+# URL of the smallest variant at least `width` wide (or the largest one)
+def image_url(name, width, fmt="webp"):
+    urls = variant_urls(name, fmt)
+    if not urls:
+        return None
+    fits = [w for w in urls if w >= width]
+    return urls[min(fits) if fits else max(urls)]
+
+
+# --- Build ---
+# Build-time only: the app just reads the manifest, so Pillow, urllib and
+# argparse are imported where they're used and stay out of its startup
+def _encode(image, fmt):
+    from PIL import Image
+
+    if fmt == "jpeg" and image.mode not in ("RGB", "L"):
+        background = Image.new("RGB", image.size, (0, 0, 0))
+        background.paste(image, mask=image.getchannel("A") if "A" in image.getbands() else None)
+        image = background
+    out = io.BytesIO()
+    image.save(out, format=fmt.upper(), **FORMATS[fmt])
+    return out.getvalue()
+
+
+def build_image(path, out_dir=STATIC_DIR, widths=WIDTHS):
+    from PIL import Image, ImageOps
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    with Image.open(path) as source:
+        source = ImageOps.exif_transpose(source)
+        source.load()
+    entry = {fmt: {} for fmt in FORMATS}
+    for width in sorted({min(w, source.width) for w in widths}):
+        height = round(source.height * width / source.width)
+        resized = source if width == source.width else source.resize((width, height), Image.LANCZOS)
+        for fmt in FORMATS:
+            data = _encode(resized, fmt)
+            digest = hashlib.sha256(data).hexdigest()[:10]
+            filename = f"{name}-{width}.{digest}.{'jpg' if fmt == 'jpeg' else fmt}"
+            with open(os.path.join(out_dir, filename), "wb") as f:
+                f.write(data)
+            entry[fmt][str(width)] = {"file": filename, "hash": digest, "bytes": len(data)}
+    return name, entry
+
+
+def build(assets_dir=ASSETS_DIR, out_dir=STATIC_DIR, widths=WIDTHS):
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    try:
+        with open(manifest_path) as f:
+            old = json.load(f)
+    except FileNotFoundError:
+        old = {}
+
+    built = {}
+    if os.path.isdir(assets_dir):
+        for filename in sorted(os.listdir(assets_dir)):
+            if filename.lower().endswith(SOURCE_EXTENSIONS):
+                name, entry = build_image(os.path.join(assets_dir, filename), out_dir, widths)
+                built[name] = entry
+
+    # Drop variants the new manifest no longer points at
+    keep = {v["file"] for entry in built.values() for variants in entry.values() for v in variants.values()}
+    for entry in old.values():
+        for variants in entry.values():
+            for v in variants.values():
+                if v["file"] not in keep and os.path.exists(os.path.join(out_dir, v["file"])):
+                    os.remove(os.path.join(out_dir, v["file"]))
+
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(built, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return built
+
+
+def fetch_background(assets_dir=ASSETS_DIR, url=BACKGROUND_URL):
+    import urllib.request
+
+    os.makedirs(assets_dir, exist_ok=True)
+    path = os.path.join(assets_dir, "background.jpg")
+    with urllib.request.urlopen(url, timeout=60) as response, open(path, "wb") as f:
+        f.write(response.read())
+    return path
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build optimized image variants into static/.")
+    parser.add_argument("--fetch-background", action="store_true", help="download the background photo into assets/ first")
+    args = parser.parse_args()
+    if args.fetch_background:
+        print(f"Fetched {fetch_background()}")
+    for name, entry in build().items():
+        sizes = ", ".join(
+            f"{width}px {fmt} {v['bytes'] // 1024} KiB" for fmt, variants in entry.items() for width, v in variants.items()
+        )
+        print(f"{name}: {sizes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# Page benchmark: drives every page through Streamlit's AppTest harness
+#
+#   python bench/bench_pages.py                      # run and print
+#   python bench/bench_pages.py --write-baseline     # run and save bench/baseline.json
+#   python bench/bench_pages.py --compare            # run and fail on regressions
+#
+# Every page of the sidebar navigation is visited once cold (first render
+# in this process) and then rerun --warm times. Quiz pages are answered,
+# and every button on the games page is clicked. Progress is kept in a
+# temporary directory, so the real progress.json is never touched.
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(APP_DIR, "bench", "baseline.json")
+SEED_XP = 500
+# Allowed growth of the bytes a rerun sends, as a fraction
+BYTES_TOLERANCE = 0.05
+
+
+# --- Harness ---
+def _setup(workdir):
+    os.chdir(workdir)
+    with open("progress.json", "w") as f:
+        json.dump({"xp": SEED_XP, "game_xp": 0, "completed_chapters": []}, f)
+    os.environ["PROGRESS_FILE"] = os.path.join(workdir, "progress.json")
+    # Every session is the seeded learner
+    os.environ["BOOK_IDENTITY"] = "shared"
+    # Only the flush at the end of each page writes, so write counts are stable
+    os.environ["PROGRESS_WRITE_WINDOW"] = "3600"
+    os.environ["BOOK_PERF"] = "1"
+    os.environ["BOOK_PERF_FILE"] = os.path.join(workdir, "perf_metrics.json")
+    # The games draw their puzzles from random; a fixed seed makes the same
+    # clicks win the same XP (and save progress) on every run
+    random.seed(0)
+    sys.path.insert(0, APP_DIR)
+
+
+def _timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def _count_elements(node):
+    children = getattr(node, "children", None)
+    if not children:
+        return 1
+    return sum(_count_elements(child) for child in children.values())
+
+
+# Bytes of element payload a rerun sends (the protos of every element on the
+# page, sidebar and event container included); blocks themselves are tiny
+def _delta_bytes(node):
+    children = getattr(node, "children", None)
+    if children:
+        return sum(_delta_bytes(child) for child in children.values())
+    proto = getattr(node, "proto", None)
+    return proto.ByteSize() if proto is not None else 0
+
+
+def _ms(summarize, samples):
+    return round(summarize(samples) * 1000, 2) if samples else None
+
+
+# AppTest.switch_page() only knows page files; st.navigation pages built
+# from callables are addressed by the md5 of their URL path (the page id).
+def _go_to(at, page_id):
+    from streamlit.util import calc_md5
+
+    at._page_hash = calc_md5(page_id)
+
+
+def _save_calls(at):
+    return at.session_state["progress_writes_this_rerun"] if "progress_writes_this_rerun" in at.session_state else 0
+
+
+# --- Interactions ---
+# Generators, so the caller can read each rerun's state before the next one
+def _answer_quiz(at, page):
+    from book import load_unit
+
+    for number, question in enumerate(load_unit(page.unit).QUIZ["questions"], start=1):
+        at.radio(key=f"c{page.chapter}_q{number}").set_value(question["answer"])
+        yield _timed_run(at)
+
+
+def _click_buttons(at):
+    labels = [button.label for button in at.main.button]
+    for label in labels:
+        button = next(b for b in at.main.button if b.label == label)
+        button.click()
+        yield _timed_run(at)
+
+
+INTERACTIONS = {"quiz": _answer_quiz, "games": lambda at, page: _click_buttons(at)}
+
+
+# --- Run ---
+def run(warm_runs):
+    from streamlit.testing.v1 import AppTest
+
+    import perf
+    from book import PAGES, PAGE_IDS
+    from learner_progress import get_progress_writer
+
+    writer = get_progress_writer()
+    at = AppTest.from_file(os.path.join(APP_DIR, "app.py"), default_timeout=120)
+    _timed_run(at)
+    writer.flush()
+
+    results = {}
+    for page_id in PAGE_IDS:
+        page = PAGES[page_id]
+        writes_before = writer.stats()["writes"]
+        save_calls = 0
+
+        _go_to(at, page_id)
+        cold = _timed_run(at)
+        save_calls += _save_calls(at)
+        warm = []
+        for _ in range(warm_runs):
+            warm.append(_timed_run(at))
+            save_calls += _save_calls(at)
+        elements = _count_elements(at.main) + _count_elements(at.sidebar)
+        delta_bytes = _delta_bytes(at._tree)
+
+        interact = INTERACTIONS.get(page.kind)
+        interactions = []
+        if interact is not None:
+            for elapsed in interact(at, page):
+                interactions.append(elapsed)
+                save_calls += _save_calls(at)
+
+        writer.flush()
+        phases = perf.stats.summary(page_id).get(page_id, {})
+        results[page_id] = {
+            "cold_ms": round(cold * 1000, 2),
+            "warm_min_ms": _ms(min, warm),
+            "warm_p50_ms": _ms(statistics.median, warm),
+            "warm_max_ms": _ms(max, warm),
+            "interactions": len(interactions),
+            "interaction_min_ms": _ms(min, interactions),
+            "interaction_p50_ms": _ms(statistics.median, interactions),
+            "elements": elements,
+            "delta_bytes": delta_bytes,
+            "save_calls": save_calls,
+            "progress_writes": writer.stats()["writes"] - writes_before,
+            "phases_p50_ms": {name: round(s["p50_ms"], 3) for name, s in sorted(phases.items())},
+        }
+        print(f"{page_id:28} cold {results[page_id]['cold_ms']:8.1f} ms  "
+              f"warm {results[page_id]['warm_p50_ms'] or 0:8.1f} ms  "
+              f"elements {elements:4}  bytes {delta_bytes:6}  writes {results[page_id]['progress_writes']}")
+    return results
+
+
+# --- Compare ---
+# A page regresses when its best warm rerun (or best interaction) is slower
+# by more than the tolerance and by more than `slack_ms`, or when it renders
+# more elements, sends more bytes per rerun or saves progress more often
+# than before. Best-of-N is used because medians of a few AppTest runs
+# swing too much with machine load, and the default slack covers the
+# ~10 ms jumps seen between identical runs.
+def compare(baseline, results, tolerance, slack_ms):
+    problems = []
+    for page_id, base in baseline["pages"].items():
+        current = results.get(page_id)
+        if current is None:
+            problems.append(f"{page_id}: page is gone")
+            continue
+        for field in ("warm_min_ms", "interaction_min_ms"):
+            old, new = base.get(field), current.get(field)
+            if old is not None and new is not None and new > old * (1 + tolerance) and new - old > slack_ms:
+                problems.append(f"{page_id}: {field} {old} -> {new}")
+        for field in ("elements", "progress_writes", "save_calls"):
+            if current[field] > base[field]:
+                problems.append(f"{page_id}: {field} {base[field]} -> {current[field]}")
+        # Widget ids and numbers shown on the page move the size by a few bytes
+        old, new = base.get("delta_bytes"), current["delta_bytes"]
+        if old is not None and new > old * (1 + BYTES_TOLERANCE):
+            problems.append(f"{page_id}: delta_bytes {old} -> {new}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every page of the app headlessly.")
+    parser.add_argument("--warm", type=int, default=5, help="warm reruns per page (default 5)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline file (default bench/baseline.json)")
+    parser.add_argument("--write-baseline", action="store_true", help="save the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline, exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown, as a fraction (default 0.5)")
+    parser.add_argument("--slack-ms", type=float, default=15.0, help="ignore slowdowns smaller than this (default 15)")
+    parser.add_argument("--out", help="also write the results to this file")
+    args = parser.parse_args()
+
+    baseline_path = os.path.abspath(args.baseline)
+    out_path = os.path.abspath(args.out) if args.out else None
+    with tempfile.TemporaryDirectory(prefix="book-bench-") as workdir:
+        _setup(workdir)
+        results = run(args.warm)
+        os.chdir(APP_DIR)
+
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "warm_runs": args.warm,
+        "pages": results,
+    }
+    if out_path:
+        with open(out_path, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.write_baseline:
+        with open(baseline_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {baseline_path}")
+    if args.compare:
+        with open(baseline_path) as f:
+            problems = compare(json.load(f), results, args.tolerance, args.slack_ms)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# Startup benchmark: process start to first render
+#
+#   python bench/bench_startup.py                 # 5 cold starts
+#   python bench/bench_startup.py --runs 10 --out startup.json
+#
+# Each run starts `streamlit run app.py` in a fresh temporary directory
+# (see loadtest.py) and times, from the moment the process is spawned:
+# the health check answering, Home finishing its first rerun for a new
+# websocket session, and the first chapter page after it. --serve starts
+# the app through serve.py instead, which warms every cache first. The
+# import time of Streamlit and of the app's own modules is measured in
+# separate interpreters, along with any heavy optional library they pull in.
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from loadtest import APP_DIR, Results, Session, _free_port, start_app
+
+FIELDS = ("streamlit_ms", "app_modules_ms", "healthy_ms", "first_render_ms", "first_chapter_ms", "ready_to_render_ms")
+APP_MODULES = ["achievements", "book", "learner_progress", "levels", "perf", "search", "styles"]
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "matplotlib", "plotly", "PIL", "sqlite3"]
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import streamlit
+streamlit_s = time.perf_counter() - start
+start = time.perf_counter()
+for name in sys.argv[1].split(","):
+    __import__(name)
+app_s = time.perf_counter() - start
+print(json.dumps({
+    "streamlit_ms": streamlit_s * 1000,
+    "app_modules_ms": app_s * 1000,
+    "heavy_modules": [name for name in sys.argv[2].split(",") if name in sys.modules],
+}))
+"""
+
+
+def import_times():
+    out = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE, ",".join(APP_MODULES), ",".join(HEAVY_MODULES)],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+async def _first_renders(url):
+    session = Session(url, Results())
+    await session.connect()
+    try:
+        await session.rerun("open")
+        home = time.perf_counter()
+        await session.go_to("chapter-1")
+        return home, time.perf_counter()
+    finally:
+        session.close()
+
+
+def cold_start(backend, warm):
+    port = _free_port()
+    with tempfile.TemporaryDirectory(prefix="book-startup-") as workdir:
+        start = time.perf_counter()
+        server = start_app(workdir, port, backend, poll=0.01, warm=warm)
+        try:
+            healthy = time.perf_counter()
+            home, chapter = asyncio.run(_first_renders(f"ws://127.0.0.1:{port}/_stcore/stream"))
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+    return {
+        "healthy_ms": (healthy - start) * 1000,
+        "first_render_ms": (home - start) * 1000,
+        "first_chapter_ms": (chapter - start) * 1000,
+        # What the first learner waits for once the health check says ready
+        "ready_to_render_ms": (home - healthy) * 1000,
+    }
+
+
+def _summary(samples):
+    return {"min": round(min(samples), 1), "p50": round(statistics.median(samples), 1), "max": round(max(samples), 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time app cold starts, from process start to first render.")
+    parser.add_argument("--runs", type=int, default=5, help="cold starts to time (default 5)")
+    parser.add_argument("--backend", choices=["journal", "sqlite"], default="journal", help="progress store")
+    parser.add_argument("--serve", action="store_true", help="start through serve.py, which warms up first")
+    parser.add_argument("--out", help="write the report to this JSON file")
+    args = parser.parse_args()
+
+    imports = [import_times() for _ in range(args.runs)]
+    starts = [cold_start(args.backend, args.serve) for _ in range(args.runs)]
+
+    report = {"runs": args.runs, "backend": args.backend, "serve": args.serve, "heavy_modules": imports[0]["heavy_modules"]}
+    for field in ("streamlit_ms", "app_modules_ms"):
+        report[field] = _summary([run[field] for run in imports])
+    for field in ("healthy_ms", "first_render_ms", "first_chapter_ms", "ready_to_render_ms"):
+        report[field] = _summary([run[field] for run in starts])
+
+    print(f"{args.runs} cold starts ({args.backend} store{', serve.py' if args.serve else ''})")
+    print(f"{'':18} {'min ms':>9} {'p50 ms':>9} {'max ms':>9}")
+    for field in FIELDS:
+        s = report[field]
+        print(f"{field[:-3]:18} {s['min']:9.1f} {s['p50']:9.1f} {s['max']:9.1f}")
+    print(f"heavy modules imported: {', '.join(report['heavy_modules']) or 'none'}")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
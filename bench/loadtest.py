@@ -0,0 +1,354 @@
+# Load test: N simulated learners against a local `streamlit run app.py`
+#
+#   python bench/loadtest.py --sessions 20 --duration 60
+#   python bench/loadtest.py --sessions 50 --backend sqlite --out load.json
+#
+# Starts the app in a temporary directory, opens one websocket per session
+# and speaks Streamlit's own protocol (BackMsg/ForwardMsg protobufs), the
+# way a browser tab does. Each session walks chapter -> quiz -> tasks for a
+# random chapter, with think time between steps, answering the quiz one
+# question at a time (quiz answers rerun only the quiz fragment, like in the
+# browser). Every session is its own learner, with a signed learner cookie
+# and progress of its own. Nothing leaves the machine.
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from hashlib import md5
+
+from tornado.httpclient import HTTPRequest
+from tornado.websocket import websocket_connect
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from book import PAGES, chapters_info, load_unit  # noqa: E402
+from identity import COOKIE_NAME, make_serializer  # noqa: E402
+from progress_record import ProgressRecord, to_mask  # noqa: E402
+from progress_store import JournalStore, SqliteStore  # noqa: E402
+
+SEED_XP = 500
+# Fixed, so the load test can sign the learner cookies the app accepts
+SECRET_KEY = "book-loadtest-" + "0" * 50
+_DONE = (
+    ForwardMsg.FINISHED_SUCCESSFULLY,
+    ForwardMsg.FINISHED_WITH_COMPILE_ERROR,
+    ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+)
+
+
+# --- App Server ---
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def learner_ids(sessions):
+    return [f"loadtest{n}" for n in range(sessions)]
+
+
+# The learner cookie a browser that already knows the app would send
+def learner_cookie(user_id):
+    return f"{COOKIE_NAME}={make_serializer(SECRET_KEY).dumps(user_id)}"
+
+
+# The seeded learners have every chapter completed, so no lesson stops at
+# a prerequisite lock and every walk step renders the real page. They are
+# written through the store the app will use, so both backends see them.
+def _seed(backend, env, user_ids):
+    if backend == "sqlite":
+        store = SqliteStore(env["PROGRESS_DB"])
+    else:
+        store = JournalStore(env["PROGRESS_FILE"])
+    for user_id in user_ids:
+        store.save(user_id, ProgressRecord(xp=SEED_XP, chapters=to_mask(chapters_info)))
+    if backend == "sqlite":
+        store.close()
+
+
+def start_app(workdir, port, backend, user_ids=(), poll=0.2, warm=False):
+    env = dict(
+        os.environ,
+        PROGRESS_BACKEND=backend,
+        BOOK_SECRET_KEY=SECRET_KEY,
+        PROGRESS_FILE=os.path.join(workdir, "progress.json"),
+        PROGRESS_DB=os.path.join(workdir, "progress.db"),
+        BOOK_PERF="1",
+        BOOK_PERF_FILE=os.path.join(workdir, "perf_metrics.json"),
+        BOOK_PERF_INTERVAL="1",
+    )
+    _seed(backend, env, user_ids)
+    # serve.py warms every cache before it starts listening
+    command = [sys.executable, os.path.join(APP_DIR, "serve.py")] if warm else [
+        sys.executable, "-m", "streamlit", "run", os.path.join(APP_DIR, "app.py"),
+    ]
+    server = subprocess.Popen(
+        [
+            *command,
+            "--server.headless", "true",
+            "--server.address", "127.0.0.1",
+            "--server.port", str(port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=workdir,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=open(os.path.join(workdir, "server.log"), "w"),
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"app exited with code {server.returncode}, see {workdir}/server.log")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            time.sleep(poll)
+    server.kill()
+    raise RuntimeError("app did not become healthy within 60s")
+
+
+# --- Simulated Session ---
+class Session:
+    """One browser tab: a websocket plus the widget values it would send.
+
+    ``cookie`` is sent with the websocket handshake, like a browser sends
+    its cookies; without one the app sees a new learner.
+    """
+
+    def __init__(self, url, results, cookie=None):
+        self.url = url
+        self.results = results
+        self.cookie = cookie
+        self.ws = None
+        self.widget_states = {}
+        self.radios = {}
+        self.page_hash = ""
+
+    async def connect(self):
+        headers = {"Cookie": self.cookie} if self.cookie else {}
+        self.ws = await websocket_connect(HTTPRequest(self.url, headers=headers), subprotocols=["streamlit"])
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    # Send one rerun and wait for the script to finish; records the latency
+    async def rerun(self, kind, fragment_id=""):
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = self.page_hash
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(self.widget_states.values())
+
+        start = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        errors = 0
+        while True:
+            raw = await self.ws.read_message()
+            if raw is None:
+                raise ConnectionError("websocket closed by the app")
+            forward = ForwardMsg()
+            forward.ParseFromString(raw)
+            kind_of = forward.WhichOneof("type")
+            if kind_of == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "radio":
+                    self.radios[element.radio.label] = (element.radio, forward.delta.fragment_id)
+                elif element_type == "exception":
+                    errors += 1
+            elif kind_of == "script_finished" and forward.script_finished in _DONE:
+                break
+        self.results.record(kind, time.perf_counter() - start, errors)
+
+    def _set_radio(self, label, index):
+        radio, fragment_id = self.radios[label]
+        state = self.widget_states.get(radio.id)
+        if state is None:
+            state = self.widget_states[radio.id] = WidgetState(id=radio.id)
+        state.int_value = index
+        return fragment_id
+
+    # Like clicking a sidebar link: st.navigation pages are addressed by the
+    # md5 of their URL path, and the old page's widgets are forgotten
+    async def go_to(self, page_id):
+        self.page_hash = md5(page_id.encode()).hexdigest()
+        self.radios = {}
+        self.widget_states = {}
+        await self.rerun("navigate")
+
+    async def answer(self, question):
+        fragment_id = self._set_radio(question["question"], question["options"].index(question["answer"]))
+        await self.rerun("answer", fragment_id)
+
+
+async def learner(url, results, deadline, think, rng, cookie):
+    session = Session(url, results, cookie)
+    try:
+        await session.connect()
+        await session.rerun("open")
+        while time.monotonic() < deadline:
+            chapter = rng.randint(1, 20)
+            await session.go_to(f"chapter-{chapter}")
+            await asyncio.sleep(rng.uniform(0.5, 1.5) * think)
+
+            quiz_page = PAGES[f"chapter-{chapter}-quiz"]
+            await session.go_to(quiz_page.id)
+            for question in load_unit(quiz_page.unit).QUIZ["questions"]:
+                await asyncio.sleep(rng.uniform(0.5, 1.5) * think)
+                await session.answer(question)
+
+            await asyncio.sleep(rng.uniform(0.5, 1.5) * think)
+            await session.go_to(f"chapter-{chapter}-tasks")
+            await asyncio.sleep(rng.uniform(0.5, 1.5) * think)
+    except (ConnectionError, OSError) as e:
+        results.failures.append(str(e))
+    finally:
+        session.close()
+
+
+# --- Results ---
+class Results:
+    def __init__(self):
+        self.samples = {}
+        self.errors = 0
+        self.failures = []
+
+    def record(self, kind, seconds, errors):
+        self.samples.setdefault(kind, []).append(seconds)
+        self.errors += errors
+
+    def summary(self, elapsed):
+        everything = sorted(s for samples in self.samples.values() for s in samples)
+        report = {
+            "reruns": len(everything),
+            "reruns_per_second": len(everything) / elapsed if elapsed else 0.0,
+            "script_errors": self.errors,
+            "session_failures": len(self.failures),
+            "latency_ms": {"all": _percentiles(everything)},
+        }
+        for kind, samples in sorted(self.samples.items()):
+            report["latency_ms"][kind] = _percentiles(sorted(samples))
+        return report
+
+
+def _percentiles(sorted_samples):
+    if not sorted_samples:
+        return {"count": 0}
+    def pick(pct):
+        return round(sorted_samples[max(1, math.ceil(pct / 100 * len(sorted_samples))) - 1] * 1000, 2)
+    return {"count": len(sorted_samples), "p50": pick(50), "p95": pick(95), "p99": pick(99), "max": pick(100)}
+
+
+# Progress store pressure, from the app's own perf metrics file
+def store_contention(metrics_path):
+    try:
+        with open(metrics_path) as f:
+            metrics = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    saves = [
+        phases["save_progress"]
+        for phases in metrics.get("pages", {}).values()
+        if "save_progress" in phases
+    ]
+    return {
+        "writer": metrics.get("progress_writes", {}),
+        "save_progress_p99_ms": max((s["p99_ms"] for s in saves), default=0.0),
+        "content_cache": metrics.get("content_cache", {}),
+    }
+
+
+def print_report(report):
+    print(f"\n{report['sessions']} sessions for {report['elapsed_s']:.1f}s "
+          f"({report['backend']} store): {report['reruns']} reruns, "
+          f"{report['reruns_per_second']:.1f} reruns/s")
+    print(f"{'kind':10} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for kind, p in report["latency_ms"].items():
+        if p["count"]:
+            print(f"{kind:10} {p['count']:7} {p['p50']:9.1f} {p['p95']:9.1f} {p['p99']:9.1f} {p['max']:9.1f}")
+    print(f"script errors: {report['script_errors']}, failed sessions: {report['session_failures']}")
+    store = report["store"]
+    if store:
+        writer = store["writer"]
+        print(f"progress store: {writer.get('save_calls', 0)} saves -> {writer.get('writes', 0)} writes, "
+              f"{writer.get('overflows', 0)} queue overflows, {writer.get('failures', 0)} failures, "
+              f"save_progress p99 {store['save_progress_p99_ms']:.2f} ms")
+
+
+async def run(url, sessions, duration, think, ramp, seed):
+    results = Results()
+    deadline = time.monotonic() + duration
+    tasks = []
+    for n, user_id in enumerate(learner_ids(sessions)):
+        rng = random.Random(seed + n)
+        tasks.append(asyncio.create_task(learner(url, results, deadline, think, rng, learner_cookie(user_id))))
+        if ramp:
+            await asyncio.sleep(ramp / sessions)
+    await asyncio.gather(*tasks)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent learners against a local app.")
+    parser.add_argument("--sessions", type=int, default=10, help="simulated learners (default 10)")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to run (default 30)")
+    parser.add_argument("--think", type=float, default=1.0, help="mean think time between steps, seconds (default 1)")
+    parser.add_argument("--ramp", type=float, default=5, help="seconds to spread session starts over (default 5)")
+    parser.add_argument("--backend", choices=["journal", "sqlite"], default="journal", help="progress store")
+    parser.add_argument("--port", type=int, help="port for the app (default: a free one)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for the walks")
+    parser.add_argument("--out", help="write the report to this JSON file")
+    args = parser.parse_args()
+
+    port = args.port or _free_port()
+    with tempfile.TemporaryDirectory(prefix="book-load-") as workdir:
+        server = start_app(workdir, port, args.backend, learner_ids(args.sessions))
+        try:
+            start = time.monotonic()
+            results = asyncio.run(run(
+                f"ws://127.0.0.1:{port}/_stcore/stream",
+                args.sessions, args.duration, args.think, args.ramp, args.seed,
+            ))
+            elapsed = time.monotonic() - start
+            time.sleep(1.5)  # let the app dump its metrics once more
+            store = store_contention(os.path.join(workdir, "perf_metrics.json"))
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    report = {
+        "sessions": args.sessions,
+        "elapsed_s": elapsed,
+        "backend": args.backend,
+        "think_s": args.think,
+        **results.summary(elapsed),
+        "store": store,
+    }
+    print_report(report)
+    for failure in results.failures[:5]:
+        print(f"session failed: {failure}")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+import hashlib
+import importlib
+import json
+import os
+from collections import namedtuple
+
+import streamlit as st
+
+from content_cache import cached
+from learner_progress import COMPLETED, LOADED, subscribe
+from levels import curve
+from quiz import quiz_page
+
+# Chapter details (auto dictionary)
+chapters_info = {
+    1: {"title": "Intro to Backend", "subtitle": "Frontend vs Backend – What’s the difference?", "emoji": "🌐"},
+    2: {"title": "Node.js Basics", "subtitle": "JavaScript outside the browser!", "emoji": "⚡"},
+    3: {"title": "Express.js", "subtitle": "Framework for building backend apps", "emoji": "🚀"},
+    4: {"title": "Databases & MongoDB", "subtitle": "Storing and retrieving data", "emoji": "🗄️"},
+    5: {"title": "REST APIs", "subtitle": "Connecting frontend & backend seamlessly", "emoji": "🔗"},
+    6: {"title": "Authentication & Security", "subtitle": "Keeping users safe", "emoji": "🔒"},
+    7: {"title": "REST APIs & CRUD (Deep)", "subtitle": "Create, Read, Update, Delete in depth", "emoji": "🛠️"},
+    8: {"title": "Deployment & Hosting", "subtitle": "How to put your app online", "emoji": "🌍"},
+    9: {"title": "Advanced Backend Concepts (Deep)", "subtitle": "Scaling and optimization", "emoji": "⚙️"},
+    10: {"title": "Microservices", "subtitle": "Breaking apps into smaller services", "emoji": "🔄"},
+    11: {"title": "Real-Time Backend & WebSockets", "subtitle": "Live chat & real-time apps", "emoji": "💬"},
+    12: {"title": "Testing & Debugging", "subtitle": "Making sure your backend works perfectly", "emoji": "🐞"},
+    13: {"title": "CI/CD & Automated Deployment", "subtitle": "Ship faster with automation", "emoji": "🤖"},
+    14: {"title": "Authentication & Security", "subtitle": "Hashing passwords, OAuth2 and JWTs", "emoji": "🔐"},
+    15: {"title": "Databases & SQL", "subtitle": "Relational databases and SQL queries", "emoji": "🗄️"},
+    16: {"title": "Containerization with Docker", "subtitle": "Portable backend apps", "emoji": "🐳"},
+    17: {"title": "Kubernetes & Orchestration", "subtitle": "Managing many containers", "emoji": "☸️"},
+    18: {"title": "Cloud Deployment (AWS/GCP/Azure)", "subtitle": "Hosting in the cloud", "emoji": "☁️"},
+    19: {"title": "CI/CD Pipelines", "subtitle": "Automating workflows", "emoji": "🛠️"},
+    20: {"title": "WebSockets", "subtitle": "Real-time connections", "emoji": "🔌"},
+    21: {"title": "Coding Games", "subtitle": "Learn through fun backend challenges", "emoji": "🎮"}
+}
+
+# Chapters that must be completed (quiz passed) before a chapter's lesson opens
+PREREQUISITES = {
+    1: (),
+    2: (1,),
+    3: (2,),
+    4: (1,),
+    5: (3,),
+    6: (5,),
+    7: (4, 5),
+    8: (3,),
+    9: (7,),
+    10: (9,),
+    11: (3,),
+    12: (5,),
+    13: (8, 12),
+    14: (6,),
+    15: (4,),
+    16: (8,),
+    17: (16,),
+    18: (16,),
+    19: (13,),
+    20: (11,),
+}
+
+# Level needed as well, as a floor under the prerequisites (levels.py);
+# chapters not listed need none
+UNLOCK_LEVELS = {
+    **{num: 2 for num in range(2, 17)},
+    17: 3,
+    18: 4,
+    19: 5,
+    20: 6,
+}
+
+
+# --- Page Registry ---
+# Every page in the book: Home, the progress dashboard, a lesson/quiz/tasks
+# page per chapter, the final project after chapter 7 and the coding games
+# (chapters_info[21]).
+# Content lives in chapters/<unit>.py as a function named after the page
+# kind (lesson(), tasks(), ...), or as QUIZ data for quiz pages, and is
+# imported the first time one of its pages is viewed.
+Page = namedtuple("Page", ["id", "label", "kind", "chapter", "unit"])
+
+LESSON, QUIZ, TASKS, PROJECT, GAMES, HOME = "lesson", "quiz", "tasks", "project", "games", "home"
+DASHBOARD = "dashboard"
+
+GAMES_CHAPTER = 21
+FINAL_PROJECT_AFTER = 7
+
+
+def _chapter_pages(num):
+    title = chapters_info[num]["title"]
+    unit = f"ch{num:02d}"
+    return [
+        Page(f"chapter-{num}", f"Chapter {num}: {title}", LESSON, num, unit),
+        Page(f"chapter-{num}-quiz", f"Chapter {num} Quiz", QUIZ, num, unit),
+        Page(f"chapter-{num}-tasks", f"Chapter {num} Tasks", TASKS, num, unit),
+    ]
+
+
+def build_pages():
+    pages = [
+        Page("home", "Home", HOME, None, None),
+        Page("dashboard", "Progress Dashboard", DASHBOARD, None, None),
+    ]
+    for num in sorted(chapters_info):
+        if num == GAMES_CHAPTER:
+            continue
+        pages.extend(_chapter_pages(num))
+        if num == FINAL_PROJECT_AFTER:
+            pages.append(Page("final-project-1-7", f"Final Project: Chapters 1–{num}", PROJECT, None, "final_project"))
+    pages.append(Page("coding-games", chapters_info[GAMES_CHAPTER]["title"], GAMES, GAMES_CHAPTER, "games"))
+    return pages
+
+
+def _section(p):
+    if p.kind in (HOME, DASHBOARD):
+        return "📘 Book"
+    chapter = FINAL_PROJECT_AFTER if p.kind == PROJECT else p.chapter
+    info = chapters_info[chapter]
+    return f"{info['emoji']} {info['title']}"
+
+
+# --- Page Index ---
+# content_compiler.py checks every page against its content and writes the
+# registry, sidebar sections included, to page_index.json. The app loads
+# that file instead of deriving the structure again; an index written for
+# different chapters_info (or no index at all) falls back to build_pages().
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_FILE = os.path.join(APP_DIR, "page_index.json")
+INDEX_VERSION = 1
+
+
+# Hash of everything build_pages() depends on
+def structure_fingerprint():
+    structure = [chapters_info, GAMES_CHAPTER, FINAL_PROJECT_AFTER]
+    return hashlib.sha256(json.dumps(structure, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def build_index(pages):
+    sections = {}
+    for p in pages:
+        sections.setdefault(_section(p), []).append(p.id)
+    return {
+        "version": INDEX_VERSION,
+        "fingerprint": structure_fingerprint(),
+        "pages": [list(p) for p in pages],
+        "sections": [[title, page_ids] for title, page_ids in sections.items()],
+    }
+
+
+# page_index.json, or the registry built here when the file is missing,
+# corrupt or written for another chapters_info
+def load_index(path=INDEX_FILE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            index = json.load(f)
+    except (FileNotFoundError, ValueError):
+        index = None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION or index.get("fingerprint") != structure_fingerprint():
+        index = build_index(build_pages())
+    return index
+
+
+_index = load_index()
+PAGES = {row[0]: Page(*row) for row in _index["pages"]}
+PAGE_IDS = list(PAGES)
+# Sidebar sections in order, as (section title, page ids)
+SECTIONS = [(title, page_ids) for title, page_ids in _index["sections"]]
+
+_renderers = {}
+_units = {}
+
+
+# Register a page's render function: @page(QUIZ, 5), @page(HOME).
+# Pages without a registered function are rendered from their unit.
+def page(kind, chapter=None):
+    page_id = _page_id(kind, chapter)
+
+    def decorator(render):
+        _renderers[page_id] = render
+        return render
+    return decorator
+
+
+def _page_id(kind, chapter):
+    for p in PAGES.values():
+        if p.kind == kind and p.chapter == chapter:
+            return p.id
+    raise KeyError(f"no {kind} page for chapter {chapter}")
+
+
+def page_label(page_id):
+    return PAGES[page_id].label
+
+
+# Import a content unit once per process and keep it for later reruns
+def load_unit(unit):
+    module = _units.get(unit)
+    if module is None:
+        module = importlib.import_module(f"chapters.{unit}")
+        _units[unit] = module
+    return module
+
+
+# A page's render function, resolved from its unit (and its quiz compiled)
+# the first time it is asked for
+def page_renderer(page_id):
+    render = _renderers.get(page_id)
+    if render is None:
+        p = PAGES[page_id]
+        unit = load_unit(p.unit)
+        if p.kind == QUIZ:
+            render = quiz_page(page_id, p.chapter, unit.QUIZ)
+        else:
+            render = getattr(unit, p.kind)
+        _renderers[page_id] = render
+    return render
+
+
+def render_page(page_id):
+    page_renderer(page_id)()
+
+
+# --- Navigation ---
+# One st.Page per registry entry, with the page id as its URL path, grouped
+# into the index's sidebar sections. The Page objects are built once per
+# session: st.navigation marks the chosen one on the object itself, so they
+# can't be shared between sessions, and building 64 of them every rerun
+# costs more than the rest of the shell.
+_NAV_KEY = "_nav_pages"
+
+
+def _runner(page_id):
+    def run():
+        render_page(page_id)
+    run.__name__ = run.__qualname__ = page_id.replace("-", "_")
+    return run
+
+
+def _nav_pages():
+    nav_pages = st.session_state.get(_NAV_KEY)
+    if nav_pages is None:
+        nav_pages = {
+            p.id: st.Page(_runner(p.id), title=p.label, url_path=p.id, default=p.kind == HOME)
+            for p in PAGES.values()
+        }
+        st.session_state[_NAV_KEY] = nav_pages
+    return nav_pages
+
+
+# The session's st.Page for a page id, e.g. for st.page_link()
+def nav_page(page_id):
+    return _nav_pages()[page_id]
+
+
+# Register the pages with st.navigation; returns (page id, st.Page) to run
+def navigate():
+    nav_pages = _nav_pages()
+    current = st.navigation({title: [nav_pages[page_id] for page_id in page_ids] for title, page_ids in SECTIONS})
+    page_id = next(page_id for page_id, nav_page in nav_pages.items() if nav_page is current)
+    return page_id, current
+
+
+# --- Chapter Unlocking ---
+# PREREQUISITES is checked to be a DAG over known chapters at import. Each
+# learner's unlocked chapters are a bitmask in session state: rebuilt when
+# progress is loaded, then updated on every completed chapter by looking
+# only at that chapter's dependents.
+_UNLOCKED_KEY = "chapters_unlocked"
+
+
+def _dependents(prerequisites):
+    dependents = {num: [] for num in prerequisites}
+    for num, needs in prerequisites.items():
+        for need in set(needs):
+            dependents[need].append(num)
+    return dependents
+
+
+def _check_prerequisites(prerequisites):
+    for num, needs in prerequisites.items():
+        unknown = [n for n in needs if n not in prerequisites]
+        if unknown:
+            raise ValueError(f"chapter {num} requires unknown chapters {unknown}")
+    # Kahn's algorithm: every chapter gets ordered unless there is a cycle
+    dependents = _dependents(prerequisites)
+    waiting = {num: len(set(needs)) for num, needs in prerequisites.items()}
+    ready = [num for num, count in waiting.items() if count == 0]
+    ordered = 0
+    while ready:
+        num = ready.pop()
+        ordered += 1
+        for dependent in dependents[num]:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                ready.append(dependent)
+    if ordered != len(prerequisites):
+        stuck = sorted(num for num, count in waiting.items() if count)
+        raise ValueError(f"chapter prerequisites have a cycle through {stuck}")
+
+
+_check_prerequisites(PREREQUISITES)
+_PREREQ_MASKS = {num: sum(1 << n for n in set(needs)) for num, needs in PREREQUISITES.items()}
+_DEPENDENTS = _dependents(PREREQUISITES)
+_OPEN_MASK = sum(1 << num for num, mask in _PREREQ_MASKS.items() if mask == 0)
+
+
+def _on_loaded(record, announce):
+    unlocked = _OPEN_MASK
+    for num, mask in _PREREQ_MASKS.items():
+        if record.chapters & mask == mask:
+            unlocked |= 1 << num
+    st.session_state[_UNLOCKED_KEY] = unlocked
+
+
+def _on_completed(chapter_num, announce):
+    done = st.session_state.chapters_done
+    unlocked = st.session_state.get(_UNLOCKED_KEY, _OPEN_MASK)
+    for dependent in _DEPENDENTS.get(chapter_num, ()):
+        mask = _PREREQ_MASKS[dependent]
+        if done & mask == mask:
+            unlocked |= 1 << dependent
+    st.session_state[_UNLOCKED_KEY] = unlocked
+
+
+subscribe(LOADED, _on_loaded)
+subscribe(COMPLETED, _on_completed)
+
+
+def is_unlocked(chapter_num):
+    if chapter_num not in _PREREQ_MASKS:
+        return True
+    return st.session_state.get(_UNLOCKED_KEY, _OPEN_MASK) >> chapter_num & 1 == 1
+
+
+# The level a chapter unlocks at, capped at the curve's top level so a short
+# BOOK_LEVEL_CURVE table can't lock a chapter for good
+def unlock_level(chapter_num, level_curve=None):
+    level_curve = level_curve or curve
+    return min(UNLOCK_LEVELS.get(chapter_num, 1), level_curve.max_level)
+
+
+# Lock a lesson until its prerequisites are completed and the learner
+# reaches its unlock level
+def chapter_lock(chapter_num):
+    if not is_unlocked(chapter_num):
+        needs = ", ".join(
+            f"Chapter {n}: {chapters_info[n]['title']}"
+            for n in PREREQUISITES[chapter_num]
+            if not st.session_state.chapters_done >> n & 1
+        )
+        st.warning(f"🔒 This chapter is locked! Complete {needs} first.")
+        st.stop()
+    level = unlock_level(chapter_num)
+    if curve.level(st.session_state.xp) < level:
+        st.warning(f"🔒 This chapter is locked! Earn {curve.xp_for(level)} XP to unlock.")
+        st.stop()
+
+
+# Function to display divider
+def chapter_divider(chapter_num):
+    st.markdown(divider_html(chapter_num), unsafe_allow_html=True)
+
+
+def divider_html(chapter_num):
+    return cached(("divider", chapter_num), lambda: _divider_html(chapter_num))
+
+
+def _divider_html(chapter_num):
+    info = chapters_info.get(chapter_num, {})
+    # Styled by .chapter-divider in the session stylesheet (styles.py)
+    return f"""
+        <div class="chapter-divider">
+            <h1>{info.get('emoji','📘')} Chapter {chapter_num}: {info.get('title','')}</h1>
+            <h3>{info.get('subtitle','')}</h3>
+        </div>
+    """
@@ -0,0 +1,90 @@
+# Chapter 1: Intro to Backend
+
+import streamlit as st
+
+from book import chapter_divider
+
+
+def lesson():
+    st.header("🌐 Chapter 1: Intro to Backend")
+    chapter_divider(1)
+
+    st.write("""
+    When you open a website or app, what you see and interact with is the **frontend**.  
+    But what happens behind the scenes — the part you don’t see — is the **backend**.
+
+    🔹 **What is Backend?**
+    - Backend is the "brain" of an application.  
+    - It handles requests, applies logic, connects with databases, and returns responses.  
+    - Without backend, the frontend would just be static pages.  
+
+    🔹 **Example**
+    Imagine logging into Facebook:  
+    - Frontend shows the login form.  
+    - Backend checks your username & password in the database.  
+    - If correct → backend sends "success", frontend shows your profile.  
+    - If wrong → backend sends "error", frontend shows a warning.  
+
+    🔹 **Main Roles of Backend**
+    1. **Logic** – Decides what happens (e.g., if a user clicks “Buy”, backend processes payment).  
+    2. **Database** – Stores and retrieves information (users, posts, messages, etc.).  
+    3. **Authentication** – Verifies identity (logins, permissions).  
+    4. **APIs** – Provides communication between frontend and backend.  
+
+    👉 In short: **Frontend is what users see, Backend is how everything works.**
+    """)
+
+    st.info("📖 After reading, go to **'Chapter 1 Quiz'** from the sidebar to test yourself!")
+    st.markdown("📺 **Learn More (Video in Hindi):** [Chai aur JavaScript - Backend Intro](https://www.youtube.com/playlist?list=PLu71SKxNbfoBGh_8p_NS-ZAh6v7HhYqHW)")
+
+
+QUIZ = {
+    "title": "🧩 Chapter 1 Quiz: Intro to Backend",
+    "intro": "Test your understanding of Chapter 1 before moving on 🚀",
+    "pass_score": 2,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1️⃣ Which of these is NOT part of the backend?",
+            "options": ["Database", "Server", "HTML", "API"],
+            "answer": "HTML",
+            "explanation": "✅ Correct! HTML is frontend.",
+            "wrong": "❌ Wrong, try again!",
+        },
+        {
+            "question": "2️⃣ What does the backend mainly handle?",
+            "options": ["Design & Layout", "Data & Logic", "Animations", "Colors"],
+            "answer": "Data & Logic",
+            "explanation": "✅ Correct! Backend handles logic and data.",
+            "wrong": "❌ Nope, that’s frontend stuff!",
+        },
+        {
+            "question": "3️⃣ When you log into Facebook, what part checks your password?",
+            "options": ["Frontend", "Backend", "Browser", "CSS"],
+            "answer": "Backend",
+            "explanation": "🎉 Perfect! Backend checks credentials.",
+            "wrong": "❌ Not correct.",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 1 Tasks: Intro to Backend")
+    st.write("""
+    These tasks will help you practice the fundamentals of backend concepts.
+    """)
+
+    st.subheader("✅ Coding Tasks")
+    st.markdown("""
+    1. Write a simple Python program that prints:
+       - `"This is Frontend"`  
+       - `"This is Backend"`  
+       (Helps you understand separation of concerns.)  
+
+    2. Create a Python dictionary called `server_response` that looks like JSON.
+
+    3. Simulate a **client request**:
+       - Input your name.  
+       - Print a message: `"Hello <name>, server received your request."`
+    """)
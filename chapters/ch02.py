@@ -0,0 +1,92 @@
+# Chapter 2: Node.js Basics
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("⚡ Chapter 2: Node.js Basics")
+    chapter_divider(2)
+    chapter_lock(2)
+    st.write("""
+    **Node.js** is a runtime that allows you to run **JavaScript outside the browser**.  
+    It is often used to build **backend servers**.
+
+    🔹 **Why Node.js?**
+    - Uses JavaScript (which you already know from frontend).  
+    - Non-blocking, event-driven → handles many requests efficiently.  
+    - Huge ecosystem (NPM packages).  
+
+    🔹 **Example: A Simple Server**
+    In Node.js, you can create a server in just a few lines:
+
+    ```javascript
+    const http = require('http');
+    const server = http.createServer((req, res) => {
+      res.write("Hello from Backend!");
+      res.end();
+    });
+    server.listen(3000);
+    ```
+
+    - `http` → built-in module for creating servers.  
+    - `createServer` → defines what happens when a request comes.  
+    - `listen(3000)` → runs server on port 3000.  
+
+    👉 This is the starting point of backend with Node.js.
+    """)
+
+    st.info("📖 After reading, go to **'Chapter 2 Quiz'** from the sidebar to test yourself!")
+    st.markdown("📺 **Learn More (Video in Hindi):** [CodeWithHarry - Node.js Playlist](https://www.youtube.com/playlist?list=PLu0W_9lII9ajyk081To1Cbt2eI5913SsL)")
+
+
+QUIZ = {
+    "title": "🧩 Chapter 2 Quiz: Node.js Basics",
+    "intro": "Test your knowledge of Node.js before moving forward 🚀",
+    "pass_score": 2,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1️⃣ What language does Node.js use?",
+            "options": ["Python", "Java", "JavaScript", "C++"],
+            "answer": "JavaScript",
+            "explanation": "✅ Correct! Node.js runs JavaScript.",
+            "wrong": "❌ Wrong, try again!",
+        },
+        {
+            "question": "2️⃣ Which command starts a Node.js server on port 3000?",
+            "options": ["server.start(3000)", "server.listen(3000)", "run server 3000", "server.open(3000)"],
+            "answer": "server.listen(3000)",
+            "explanation": "✅ Correct! `listen` is used to start the server.",
+            "wrong": "❌ Nope, check the code example again!",
+        },
+        {
+            "question": "3️⃣ What is Node.js mainly used for?",
+            "options": ["Frontend design", "Backend servers", "Making CSS prettier", "Image editing"],
+            "answer": "Backend servers",
+            "explanation": "🎉 Correct! Node.js is great for backend.",
+            "wrong": "❌ Wrong answer.",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 2 Tasks: Node.js Basics")
+    st.write("""
+    Practice Node.js by building small scripts.
+    """)
+
+    st.subheader("✅ Coding Tasks")
+    st.markdown("""
+    1. Write a Node.js script that prints `"Hello Backend World!"`.  
+
+    2. Create a program that prints current **date & time**.  
+
+    3. Build a simple calculator in Node.js that:
+       - Takes two numbers as input.  
+       - Prints their sum.  
+
+    4. Create a Node.js program that reads `data.txt` file and prints its content.
+    """)
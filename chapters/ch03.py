@@ -0,0 +1,110 @@
+# Chapter 3: Express.js
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("🚀 Chapter 3: Express.js Framework")
+    chapter_divider(3)
+    chapter_lock(3)
+    st.write("""
+    **Express.js** is a lightweight framework for **Node.js** that makes building backend servers much easier.  
+
+    🔹 **Why Express?**
+    - Node.js is powerful but writing servers with pure `http` module can get long and messy.  
+    - Express simplifies things by giving easy methods for routes, middleware, and APIs.  
+
+    🔹 **Hello World in Express**
+    ```javascript
+    const express = require('express');
+    const app = express();
+
+    app.get('/', (req, res) => {
+      res.send('Hello from Express!');
+    });
+
+    app.listen(3000, () => {
+      console.log("Server running on port 3000");
+    });
+    ```
+    - `express()` → creates an Express app  
+    - `app.get('/', ...)` → defines what happens at the homepage  
+    - `app.listen(3000)` → starts the server at **http://localhost:3000**
+
+    🔹 **Multiple Routes**
+    ```javascript
+    app.get('/about', (req, res) => {
+      res.send('This is the About Page');
+    });
+
+    app.get('/contact', (req, res) => {
+      res.send('Contact us at: hello@example.com');
+    });
+    ```
+    - `/about` → About page  
+    - `/contact` → Contact page  
+
+    👉 Express.js is the foundation for many big apps and APIs.
+    """)
+
+    st.info("📖 After reading, go to **'Chapter 3 Quiz'** from the sidebar to test yourself!")
+    st.markdown("📺 **Learn More (Video in Hindi):** [Chai aur Code - Express.js Tutorial](https://www.youtube.com/playlist?list=PLu71SKxNbfoC0jOwtjJCBn2VQOzjMUkfZ)")
+
+
+QUIZ = {
+    "title": "🧩 Chapter 3 Quiz: Express.js Basics",
+    "intro": "Let’s see how well you understood Express.js 🚀",
+    "pass_score": 2,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1️⃣ What is Express.js mainly used for?",
+            "options": [
+                "Designing Frontend",
+                "Building Backend Servers",
+                "Styling with CSS",
+                "Creating Databases",
+            ],
+            "answer": "Building Backend Servers",
+            "explanation": "✅ Correct! Express is a backend framework.",
+            "wrong": "❌ Wrong answer.",
+        },
+        {
+            "question": "2️⃣ In Express.js, which method is used to define a GET route?",
+            "options": ["app.route()", "app.fetch()", "app.get()", "app.start()"],
+            "answer": "app.get()",
+            "explanation": "✅ Correct! `app.get()` defines GET routes.",
+            "wrong": "❌ Nope, that’s not right.",
+        },
+        {
+            "question": "3️⃣ Which line starts the Express server on port 3000?",
+            "options": ["app.run(3000)", "app.open(3000)", "app.listen(3000)", "server.start(3000)"],
+            "answer": "app.listen(3000)",
+            "explanation": "🎉 Correct! That’s how you start the server.",
+            "wrong": "❌ Wrong, check the example code again!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 3 Tasks: Express.js Framework")
+    st.write("""
+    Practice Express.js by building small servers.
+    """)
+
+    st.subheader("✅ Coding Tasks")
+    st.markdown("""
+    1. Install Express.js and create a simple server.
+
+    2. Add two new routes:
+       - `/about` → returns `"This is About Page"`  
+       - `/contact` → returns `"This is Contact Page"`
+
+    3. Create middleware that logs every request method + URL.
+
+    4. Build a small **Quotes API**:
+       - `/quotes` → returns an array of 5 quotes in JSON.
+    """)
@@ -0,0 +1,122 @@
+# Chapter 4: Databases & MongoDB
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("💾 Chapter 4: Databases & MongoDB")
+    chapter_divider(4)
+    chapter_lock(4)
+    st.write("""
+    Databases are used to **store and organize data** so applications can use it later.  
+    Without databases, everything would be lost when the app restarts.
+
+    ### 🔹 Why Databases?
+    - Store user accounts, orders, products, messages.
+    - Keep data safe and persistent.
+    - Allow multiple users to access the same data.
+
+    ### 🔹 Types of Databases
+    1. **SQL (Relational Databases)** → store data in **tables** (MySQL, PostgreSQL).
+    2. **NoSQL (Document Databases)** → store data as **JSON-like documents** (MongoDB).
+
+    Example MongoDB Document:
+    ```json
+    {
+      "id": 1,
+      "name": "Alice",
+      "email": "alice@example.com",
+      "isAdmin": true
+    }
+    ```
+
+    ### 🔹 MongoDB Basics
+    - **Database** → Collection of data  
+    - **Collection** → Group of documents  
+    - **Document** → One JSON object (like a row in SQL)  
+
+    ### 🔹 CRUD Operations
+    - **Create** → Insert new data  
+    - **Read** → Get data from DB  
+    - **Update** → Change data  
+    - **Delete** → Remove data  
+
+    ### 🔹 Example: Node.js + MongoDB
+    ```javascript
+    const mongoose = require("mongoose");
+
+    // connect to DB
+    mongoose.connect("mongodb://localhost:27017/myapp");
+
+    // define schema
+    const UserSchema = new mongoose.Schema({
+      name: String,
+      email: String,
+      age: Number
+    });
+
+    const User = mongoose.model("User", UserSchema);
+
+    // create and save
+    const newUser = new User({ name: "Alice", email: "alice@example.com", age: 25 });
+    newUser.save().then(() => console.log("User saved!"));
+    ```
+    """)
+
+    st.markdown("📺 **Learn More (Video in Hindi):** [CodeWithHarry - MongoDB Tutorial](https://www.youtube.com/playlist?list=PLu0W_9lII9ah7DDtYtflgwMwpT3xmjXY9)")
+
+
+QUIZ = {
+    "title": "🧩 Chapter 4 Quiz: Databases & MongoDB",
+    "pass_score": 2,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. Which type of database stores data in tables?",
+            "options": ["MongoDB", "MySQL", "Firebase", "None"],
+            "answer": "MySQL",
+            "explanation": "✅ Correct! MySQL is a relational database.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "2. In MongoDB, data is stored as?",
+            "options": ["Tables", "Rows", "Documents", "Spreadsheets"],
+            "answer": "Documents",
+            "explanation": "✅ Correct! MongoDB stores data as JSON-like documents.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "3. What does CRUD stand for?",
+            "options": [
+                "Create, Read, Update, Delete",
+                "Copy, Run, Upload, Download",
+                "Connect, Render, Update, Debug",
+            ],
+            "answer": "Create, Read, Update, Delete",
+            "explanation": "✅ Correct! That's CRUD.",
+            "wrong": "❌ Try again!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 4 Tasks: Databases & MongoDB")
+    st.write("These tasks will help you practice CRUD and MongoDB concepts.")
+
+    st.subheader("✅ Coding Tasks")
+    st.markdown("""
+    1. Create a MongoDB document for a `book`:
+       - Fields: `title`, `author`, `year`.
+
+    2. Insert 3 user documents into a `users` collection:
+       - Example: `{ "name": "Ali", "email": "ali@example.com" }`
+
+    3. Write a query to **find all users** with `age > 20`.
+
+    4. Update a user's email from `old@example.com` to `new@example.com`.
+
+    5. Delete one document from the `users` collection.
+    """)
@@ -0,0 +1,142 @@
+# Chapter 5: REST APIs
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("🌐 Chapter 5: REST APIs (Representational State Transfer)")
+    chapter_divider(5)
+    chapter_lock(5)
+    st.write("""
+    REST API is a way for applications to **communicate over the web** using rules (HTTP methods).  
+    It’s how the frontend (React, Angular, etc.) talks to the backend (Node.js, Express, etc.).
+
+    ### 🔑 Key Concepts:
+    - **Client & Server** → Client (browser, app) sends requests, Server responds.
+    - **HTTP Methods**:
+        - `GET` → Fetch data  
+        - `POST` → Send new data  
+        - `PUT` → Update existing data  
+        - `DELETE` → Remove data  
+
+    - **Endpoints** → URLs used to access resources.  
+      Example:  
+      - `/users` → list all users  
+      - `/users/1` → get user with ID=1  
+
+    - **Request & Response**:
+        - **Request** contains → method, URL, body, headers  
+        - **Response** contains → status code, message, data  
+
+    - **CRUD Operations** map to HTTP:
+        - Create → `POST`
+        - Read → `GET`
+        - Update → `PUT`
+        - Delete → `DELETE`
+
+    ### 🚀 Example Use Case:
+    Imagine an **online shop**:  
+    - `GET /products` → Fetch all products  
+    - `POST /products` → Add new product  
+    - `PUT /products/2` → Update product with ID=2  
+    - `DELETE /products/3` → Remove product with ID=3  
+
+    ### 🧠 Why REST APIs?
+    - Frontend & backend stay separate.  
+    - APIs make apps **scalable** (can be used on mobile, web, IoT).  
+    - Standard communication method.
+    """)
+
+    st.subheader("📊 REST API Workflow Diagram")
+    st.markdown("""
+    ```
+    [ Client (Browser/Mobile) ] 
+               │
+               ▼
+        [ REST API (Server) ] 
+               │
+               ▼
+        [ Database (MongoDB/MySQL) ]
+    ```
+    """)
+
+    st.subheader("📺 Learn More (Hindi Tutorial)")
+    st.video("https://www.youtube.com/watch?v=mqm4QPEwtZQ")  # REST API Hindi tutorial
+
+
+QUIZ = {
+    "title": "🧩 Chapter 5 Quiz: REST APIs",
+    "pass_score": 3,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. Which HTTP method is used to fetch data from a server?",
+            "options": ["POST", "GET", "PUT", "DELETE"],
+            "answer": "GET",
+            "explanation": "✅ Correct! GET is used to retrieve data.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "2. Which HTTP method is used to update existing data?",
+            "options": ["POST", "PUT", "DELETE", "GET"],
+            "answer": "PUT",
+            "explanation": "✅ Correct! PUT updates data.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "3. What does an API endpoint represent?",
+            "options": ["A database table", "A file path", "A URL to access a resource", "A server password"],
+            "answer": "A URL to access a resource",
+            "explanation": "✅ Correct! Endpoints are URLs for accessing resources.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "4. Which status code means 'Success' in REST API?",
+            "options": ["200", "404", "500", "302"],
+            "answer": "200",
+            "explanation": "✅ Correct! 200 means success.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "5. CRUD operation 'Delete' is mapped to which HTTP method?",
+            "options": ["GET", "POST", "DELETE", "PUT"],
+            "answer": "DELETE",
+            "explanation": "✅ Correct! DELETE removes a resource.",
+            "wrong": "❌ Try again!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 5 Tasks: REST APIs")
+    st.write("""
+    These tasks will help you practice building and using REST APIs.
+    """)
+
+    st.subheader("✅ Coding Tasks")
+    st.markdown("""
+    1. Create a Node.js/Express API with one route:
+       - `GET /hello` → returns "Hello API World".
+
+    2. Add a new route:
+       - `GET /time` → returns the current server time in JSON format.
+
+    3. Build a small "To-Do API":
+       - `GET /todos` → returns a list of tasks (array).  
+       - `POST /todos` → allows adding a new task.  
+
+    4. Add error handling:
+       - If a wrong route is called, return a 404 JSON response:
+         ```json
+         { "error": "Route not found" }
+         ```
+
+    5. Bonus Challenge 🚀:
+       - Create a "Users API" with routes:
+         - `GET /users` → returns list of users.  
+         - `GET /users/:id` → returns user details by ID.  
+         - `POST /users` → adds a new user.  
+    """)
@@ -0,0 +1,150 @@
+# Chapter 6: Authentication & Security
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("🔐 Chapter 6: Authentication & Security")
+    chapter_divider(6)
+    chapter_lock(6)
+    st.write("""
+    In any backend system, **security** is extremely important.  
+    Authentication ensures that only the **right users** can access your application.  
+
+    ### 🔑 Key Concepts:
+    - **Authentication** → Verifying *who* the user is (e.g., login with username & password).  
+    - **Authorization** → Verifying *what* the user is allowed to do (e.g., admin vs normal user).  
+    - **Hashing Passwords** → Passwords should never be stored as plain text.  
+    - **JWT (JSON Web Tokens)** → A secure way to store user identity across requests.  
+
+    Example flow:
+    1. User logs in with username & password.  
+    2. Backend checks the password (hashed).  
+    3. If correct → backend creates a **JWT token** and sends it to the user.  
+    4. The user includes the token in every request → proves they are logged in.  
+    """)
+
+    st.subheader("🧑‍💻 Example Code: Hashing Passwords in Python")
+    st.code("""
+import hashlib
+
+# User signup → hash password before saving
+password = "mypassword123"
+hashed_pw = hashlib.sha256(password.encode()).hexdigest()
+print("Stored password (hashed):", hashed_pw)
+
+# User login → hash input again and compare
+login_input = "mypassword123"
+if hashlib.sha256(login_input.encode()).hexdigest() == hashed_pw:
+    print("✅ Login successful")
+else:
+    print("❌ Invalid password")
+""", language="python")
+
+    st.subheader("🧑‍💻 Example Code: Simple JWT in Node.js")
+    st.code("""
+const jwt = require("jsonwebtoken");
+
+// User object
+const user = { id: 1, username: "john_doe" };
+
+// Generate JWT
+const token = jwt.sign(user, "secretKey", { expiresIn: "1h" });
+console.log("Generated Token:", token);
+
+// Verify JWT
+jwt.verify(token, "secretKey", (err, decoded) => {
+    if (err) console.log("❌ Invalid token");
+    else console.log("✅ Verified user:", decoded);
+});
+""", language="javascript")
+    st.write("...your explanation content here...")
+    st.subheader("📺 Learn More (Coding in Hindi)")
+    st.video("https://www.youtube.com/watch?v=IWmIi6E1IAI") 
+     # JWT tutorial in Hindi
+
+
+QUIZ = {
+    "title": "🧩 Chapter 6 Quiz: Authentication & Security",
+    "pass_score": 3,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. What does authentication mean?",
+            "options": ["Verifying user identity", "Encrypting data", "Building APIs", "Managing servers"],
+            "answer": "Verifying user identity",
+            "explanation": "✅ Correct! Authentication is about verifying who the user is.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "2. Which of these is NOT an authentication method?",
+            "options": ["Password", "OAuth", "JWT", "CSS"],
+            "answer": "CSS",
+            "explanation": "✅ Correct! CSS is for styling, not authentication.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "3. What does JWT stand for?",
+            "options": ["Java Web Token", "JSON Web Token", "JavaScript With Token", "Join Web Transfer"],
+            "answer": "JSON Web Token",
+            "explanation": "✅ Correct! JWT = JSON Web Token.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "4. What is the main purpose of hashing passwords?",
+            "options": [
+                "To store them safely",
+                "To make them look fancy",
+                "To speed up login",
+                "To create tokens",
+            ],
+            "answer": "To store them safely",
+            "explanation": "✅ Correct! Hashing makes passwords secure in databases.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "5. In OAuth, which service is commonly used for login?",
+            "options": ["Facebook/Google", "VS Code", "Excel", "MongoDB"],
+            "answer": "Facebook/Google",
+            "explanation": "✅ Correct! OAuth allows login with Google, Facebook, etc.",
+            "wrong": "❌ Try again!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 6 Tasks: Authentication & Security")
+    st.write("Practice real authentication & security concepts with these tasks.")
+
+    st.subheader("✅ Coding Tasks")
+    st.markdown("""
+    1. Create a **Node.js login system** that:
+       - Takes a username & password as input.  
+       - Prints `"Login successful"` if correct, otherwise `"Login failed"`.  
+
+    2. Hash a password using **bcrypt**:
+       - Install bcrypt (`npm install bcrypt`).  
+       - Hash the password `"mypassword"`.  
+       - Print the hashed value.  
+
+    3. Generate a **JWT token**:
+       - Install `jsonwebtoken`.  
+       - Create a token with `{ user: "John" }`.  
+       - Print the token.  
+
+    4. Verify a **JWT token**:
+       - Decode and verify the token you generated.  
+       - Print `"Valid user"` if verified.  
+
+    5. Create a **middleware** in Express.js:
+       - It should check if a user provides a valid token in the request header.  
+       - If valid → allow access.  
+       - If not → return `"Access Denied"`.  
+
+    6. Build a **secure API endpoint** `/profile`:
+       - Only accessible if the user is logged in with a valid token.  
+       - Otherwise return an error.  
+    """)
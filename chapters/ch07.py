@@ -0,0 +1,257 @@
+# Chapter 7: REST APIs & CRUD (Deep)
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("🌐 Chapter 7: REST APIs & CRUD Operations (Deep Dive)")
+    chapter_divider(7)
+    chapter_lock(7)
+    st.write("""
+    Now that you know the basics of REST APIs, let’s go deeper:  
+
+    1. **REST Principles**  
+       - Stateless → Every request contains all the info (server does not remember state).  
+       - Resource-based → APIs expose "resources" like `/users`, `/products`.  
+       - Uses HTTP Methods:  
+         - `GET` → Read  
+         - `POST` → Create  
+         - `PUT` → Update  
+         - `DELETE` → Delete  
+
+    2. **Error Handling**  
+       APIs should return proper status codes like:  
+       - 200 → OK  
+       - 201 → Created  
+       - 400 → Bad Request  
+       - 404 → Not Found  
+       - 500 → Server Error  
+
+    3. **Using MongoDB with CRUD**  
+       Instead of keeping data in memory, let’s connect Express.js with MongoDB.
+    """)
+
+    st.subheader("💻 Example Code: Express.js + MongoDB CRUD API")
+
+    st.code("""
+    const express = require('express');
+    const mongoose = require('mongoose');
+    const app = express();
+    const port = 4000;
+
+    app.use(express.json());
+
+    // MongoDB connection
+    mongoose.connect('mongodb://localhost:27017/backend_course', {
+        useNewUrlParser: true,
+        useUnifiedTopology: true
+    }).then(() => console.log("✅ Connected to MongoDB"))
+      .catch(err => console.log("❌ DB Error:", err));
+
+    // Define Schema
+    const userSchema = new mongoose.Schema({
+        name: String,
+        email: String
+    });
+
+    const User = mongoose.model('User', userSchema);
+
+    // CREATE
+    app.post('/users', async (req, res) => {
+        try {
+            const user = new User(req.body);
+            await user.save();
+            res.status(201).json(user);
+        } catch (err) {
+            res.status(400).json({ error: err.message });
+        }
+    });
+
+    // READ all
+    app.get('/users', async (req, res) => {
+        const users = await User.find();
+        res.json(users);
+    });
+
+    // READ by ID
+    app.get('/users/:id', async (req, res) => {
+        try {
+            const user = await User.findById(req.params.id);
+            if (!user) return res.status(404).json({ message: "User not found" });
+            res.json(user);
+        } catch (err) {
+            res.status(400).json({ error: err.message });
+        }
+    });
+
+    // UPDATE
+    app.put('/users/:id', async (req, res) => {
+        try {
+            const user = await User.findByIdAndUpdate(req.params.id, req.body, { new: true });
+            if (!user) return res.status(404).json({ message: "User not found" });
+            res.json(user);
+        } catch (err) {
+            res.status(400).json({ error: err.message });
+        }
+    });
+
+    // DELETE
+    app.delete('/users/:id', async (req, res) => {
+        try {
+            const user = await User.findByIdAndDelete(req.params.id);
+            if (!user) return res.status(404).json({ message: "User not found" });
+            res.json({ message: "User deleted" });
+        } catch (err) {
+            res.status(400).json({ error: err.message });
+        }
+    });
+
+    app.listen(port, () => {
+        console.log(`🚀 API running at http://localhost:${port}`);
+    });
+    """, language="javascript")
+
+    st.success("👉 This version stores users in **MongoDB** instead of memory, making it more realistic!")
+    st.write("...your explanation content here...")
+    st.subheader("📺 Learn More (Coding in Hindi)")
+    st.video("https://www.youtube.com/watch?v=09_SDJ2au6E") 
+
+
+QUIZ = {
+    "title": "🧩 Chapter 7 Quiz: REST APIs & CRUD (Deep Dive)",
+    "pass_score": 4,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. What does CRUD stand for?",
+            "options": [
+                "Create, Read, Update, Delete",
+                "Connect, Run, Upload, Download",
+                "Copy, Reset, Undo, Drop",
+            ],
+            "answer": "Create, Read, Update, Delete",
+            "explanation": "✅ Correct! That’s the CRUD cycle.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "2. In REST API design, which HTTP method is used to update a resource?",
+            "options": ["GET", "POST", "PUT/PATCH", "DELETE"],
+            "answer": "PUT/PATCH",
+            "explanation": "✅ Correct! PUT/PATCH is used for updating resources.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "3. Which HTTP status code means 'Resource Created Successfully'?",
+            "options": ["200 OK", "201 Created", "404 Not Found", "500 Internal Server Error"],
+            "answer": "201 Created",
+            "explanation": "✅ Correct! 201 is returned when a resource is created.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "4. In REST, data is usually exchanged in which format?",
+            "options": ["CSV", "XML", "JSON", "Excel"],
+            "answer": "JSON",
+            "explanation": "✅ Correct! JSON is the most common format.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "5. Which of these routes is RESTful for getting a single user with id=5?",
+            "options": ["/getUser?id=5", "/users/5", "/fetch-user/5", "/find-user?id=5"],
+            "answer": "/users/5",
+            "explanation": "✅ Correct! That’s a RESTful way to design routes.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "6. Which tool is commonly used for testing REST APIs?",
+            "options": ["PowerPoint", "Photoshop", "Postman", "Notepad"],
+            "answer": "Postman",
+            "explanation": "✅ Correct! Postman is the most popular API testing tool.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "7. In MongoDB with Express, which function is used to find all documents?",
+            "options": ["find()", "findOne()", "getAll()", "search()"],
+            "answer": "find()",
+            "explanation": "✅ Correct! `find()` retrieves all documents.",
+            "wrong": "❌ Try again!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 7 Tasks: REST APIs & CRUD")
+
+    st.write("""
+    In this chapter, you’ll practice creating and testing REST APIs using Node.js + Express + MongoDB.  
+    Try solving these tasks step by step. Each builds on the previous one. 🚀
+    """)
+
+    task = st.radio("Choose a task to view:", 
+                    ["Task 1: Build a Simple API",
+                     "Task 2: Add CRUD Operations",
+                     "Task 3: Use RESTful Routes",
+                     "Task 4: Connect to MongoDB",
+                     "Task 5: Implement Error Handling",
+                     "Task 6: Bonus Challenge – User API"], index=None)
+
+    if task == "Task 1: Build a Simple API":
+        st.subheader("🚀 Task 1: Build a Simple API")
+        st.write("""
+        - Create a new Express.js project.
+        - Add a single route: `/` that returns `"Hello Backend!"`.
+        - Run the server and test it in your browser or Postman.
+        """)
+
+    elif task == "Task 2: Add CRUD Operations":
+        st.subheader("🛠️ Task 2: Add CRUD Operations")
+        st.write("""
+        - Create a new route `/books`.
+        - Add the following routes:
+          - `GET /books` → Return all books (array).
+          - `POST /books` → Add a new book.
+          - `PUT /books/:id` → Update a book by ID.
+          - `DELETE /books/:id` → Delete a book by ID.
+        """)
+
+    elif task == "Task 3: Use RESTful Routes":
+        st.subheader("📡 Task 3: Use RESTful Routes")
+        st.write("""
+        - Update your routes to follow REST conventions.
+        - Example:
+          - `GET /users` → Get all users
+          - `GET /users/:id` → Get one user
+          - `POST /users` → Add a user
+          - `PUT /users/:id` → Update a user
+          - `DELETE /users/:id` → Remove a user
+        """)
+
+    elif task == "Task 4: Connect to MongoDB":
+        st.subheader("💾 Task 4: Connect to MongoDB")
+        st.write("""
+        - Install `mongoose` (`npm install mongoose`).
+        - Connect your project to MongoDB (local or Atlas).
+        - Define a `Book` schema with title, author, year.
+        - Modify your `/books` routes to use MongoDB instead of arrays.
+        """)
+
+    elif task == "Task 5: Implement Error Handling":
+        st.subheader("⚠️ Task 5: Implement Error Handling")
+        st.write("""
+        - Add proper error handling for:
+          - Invalid IDs
+          - Missing data in POST
+          - Database errors
+        - Return correct HTTP status codes (400, 404, 500).
+        """)
+
+    elif task == "Task 6: Bonus Challenge – User API":
+        st.subheader("🏆 Task 6: Bonus Challenge – User API")
+        st.write("""
+        - Build a `User` API with fields: name, email, password.
+        - Add CRUD routes for users.
+        - Add validation: email must be unique.
+        - Optional: Add password hashing with `bcrypt`.
+        """)
@@ -0,0 +1,175 @@
+# Chapter 8: Deployment & Hosting
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("🚀 Chapter 8: Deployment & Hosting")
+    chapter_divider(8)
+    chapter_lock(8)
+    st.write("""
+    After building your backend, the next step is to **deploy it online** so others can access it.  
+
+    Common platforms:
+    - **Render** → Free & easy for Node.js apps
+    - **Railway** → Free plan, simple deployment
+    - **Heroku** → Popular, supports Node.js & MongoDB
+    - **Vercel** → Mainly for frontend but can deploy APIs
+    """)
+
+    st.subheader("💻 Example: Prepare Node.js App for Deployment")
+    st.code("""
+    // 1. Ensure you have a package.json with start script
+    "scripts": {
+        "start": "node index.js"
+    }
+
+    // 2. Use environment variables for sensitive info
+    const express = require('express');
+    const mongoose = require('mongoose');
+    require('dotenv').config();  // npm install dotenv
+
+    const app = express();
+    const port = process.env.PORT || 3000;
+
+    mongoose.connect(process.env.MONGO_URI, {
+        useNewUrlParser: true,
+        useUnifiedTopology: true
+    }).then(() => console.log("✅ Connected to MongoDB"))
+      .catch(err => console.log("❌ DB Error:", err));
+
+    app.get('/', (req, res) => {
+        res.send("Hello, deployed backend!");
+    });
+
+    app.listen(port, () => console.log(`Server running on port ${port}`));
+    """, language="javascript")
+
+    st.subheader("📦 Steps to Deploy on Render (Example)")
+    st.markdown("""
+    1. Push your project to **GitHub**.
+    2. Go to [Render](https://render.com) → New → Web Service.
+    3. Connect your GitHub repo.
+    4. Set build command: `npm install`.
+    5. Set start command: `npm start`.
+    6. Add **environment variables** (like `MONGO_URI`) in Render dashboard.
+    7. Click deploy → Your backend will be online!
+    """)
+
+    st.subheader("📺 Optional Video Tutorial (Hindi)")
+    st.video("https://www.youtube.com/watch?v=PKpF7nJ9Y1M")  # Example Render deployment tutorial
+
+
+QUIZ = {
+    "title": "🧩 Chapter 8 Quiz: Deployment & Hosting",
+    "pass_score": 3,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. Which command is commonly used to start a Node.js server in production?",
+            "options": ["node index.js", "npm install", "npm start", "npm run test"],
+            "answer": "npm start",
+            "explanation": "✅ Correct! `npm start` runs the start script in package.json.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "2. What is the purpose of environment variables in deployment?",
+            "options": [
+                "To store sensitive info like DB credentials",
+                "To store app styling",
+                "To increase server speed",
+                "To debug code",
+            ],
+            "answer": "To store sensitive info like DB credentials",
+            "explanation": "✅ Correct! Environment variables keep secrets safe.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "3. Which platform can you use to deploy Node.js apps for free?",
+            "options": ["Render", "Railway", "Heroku", "All of the above"],
+            "answer": "All of the above",
+            "explanation": "✅ Correct! All three offer free deployment options.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "4. What should you do if your app needs a database connection in deployment?",
+            "options": [
+                "Hardcode credentials",
+                "Use environment variables",
+                "Use local files only",
+                "Ignore",
+            ],
+            "answer": "Use environment variables",
+            "explanation": "✅ Correct! Never hardcode credentials.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "5. Which file usually contains the start command for Node.js apps?",
+            "options": ["package.json", "index.js", ".env", "README.md"],
+            "answer": "package.json",
+            "explanation": "✅ Correct! package.json has scripts including start.",
+            "wrong": "❌ Try again!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 8 Tasks: Deployment & Hosting")
+
+    st.write("""
+    Practice deploying your backend app with these tasks. Start simple, then advance. 🚀
+    """)
+
+    task = st.radio("Choose a deployment task:", 
+                    ["Task 1: Prepare Local Node.js App",
+                     "Task 2: Add Environment Variables",
+                     "Task 3: Deploy on Render",
+                     "Task 4: Deploy on Railway",
+                     "Task 5: Test Your Deployed API"], index=None)
+
+    if task == "Task 1: Prepare Local Node.js App":
+        st.subheader("🛠️ Task 1: Prepare Local Node.js App")
+        st.write("""
+        - Ensure your app has `package.json` with a start script.  
+        - Test your app locally: `npm install` → `npm start`.  
+        - Check all routes are working.  
+        """)
+
+    elif task == "Task 2: Add Environment Variables":
+        st.subheader("🔐 Task 2: Add Environment Variables")
+        st.write("""
+        - Create a `.env` file.  
+        - Add `PORT=3000` and `MONGO_URI=<your_mongo_url>`.  
+        - Use `process.env.PORT` and `process.env.MONGO_URI` in your code.  
+        - Test that the app works with the environment variables.  
+        """)
+
+    elif task == "Task 3: Deploy on Render":
+        st.subheader("🚀 Task 3: Deploy on Render")
+        st.write("""
+        - Push your project to **GitHub**.  
+        - Go to [Render](https://render.com) → New → Web Service.  
+        - Connect your GitHub repo, set build/start commands.  
+        - Add environment variables.  
+        - Deploy and test your API online.  
+        """)
+
+    elif task == "Task 4: Deploy on Railway":
+        st.subheader("🌐 Task 4: Deploy on Railway")
+        st.write("""
+        - Sign up on [Railway](https://railway.app).  
+        - Import your GitHub repo.  
+        - Set environment variables and deploy.  
+        - Test all routes of your API.  
+        """)
+
+    elif task == "Task 5: Test Your Deployed API":
+        st.subheader("✅ Task 5: Test Your Deployed API")
+        st.write("""
+        - Use **Postman** or **curl** to test all endpoints.  
+        - Verify CRUD operations or authentication work as expected.  
+        - Optional: Share your deployed API link with a friend to test it.  
+        """)
@@ -0,0 +1,225 @@
+# Chapter 9: Advanced Backend Concepts (Deep)
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("⚡ Chapter 9: Advanced Backend Concepts & Optimization (Deep Dive)")
+    chapter_divider(9)
+    chapter_lock(9)
+    st.write("""
+    In this chapter, you’ll learn advanced techniques to build **production-ready backends**:
+    - Middleware chaining & modularization  
+    - Advanced error handling  
+    - Caching with Redis  
+    - Logging with Winston  
+    - Performance & scalability tips  
+    - Environment-based configuration
+    """)
+
+    st.subheader("1️⃣ Modular Middleware")
+    st.write("""
+    Split middleware into modules for **clean code** and reusability.
+    """)
+    st.code("""
+    // authMiddleware.js
+    module.exports = (req, res, next) => {
+        if(!req.headers.authorization){
+            return res.status(401).json({ error: 'Unauthorized' });
+        }
+        next();
+    };
+
+    // index.js
+    const express = require('express');
+    const auth = require('./authMiddleware');
+    const app = express();
+
+    app.get('/protected', auth, (req, res) => {
+        res.send('You passed the auth middleware!');
+    });
+    """, language="javascript")
+
+    st.subheader("2️⃣ Advanced Caching with Redis")
+    st.write("""
+    Use **Redis** for caching API responses for fast access and scalability.
+    """)
+    st.code("""
+    const redis = require('redis');
+    const client = redis.createClient();
+
+    app.get('/data/:id', async (req, res) => {
+        const id = req.params.id;
+        client.get(id, async (err, cachedData) => {
+            if(cachedData) return res.json({ data: JSON.parse(cachedData), cached: true });
+
+            const dbData = { id: id, value: 'Fetched from DB' }; // Simulate DB
+            client.setex(id, 3600, JSON.stringify(dbData)); // Cache for 1 hour
+            res.json({ data: dbData, cached: false });
+        });
+    });
+    """, language="javascript")
+
+    st.subheader("3️⃣ Advanced Logging with Winston")
+    st.write("""
+    Use **Winston** to log info, warnings, and errors to files or external services.
+    """)
+    st.code("""
+    const winston = require('winston');
+
+    const logger = winston.createLogger({
+        level: 'info',
+        format: winston.format.json(),
+        transports: [
+            new winston.transports.File({ filename: 'error.log', level: 'error' }),
+            new winston.transports.File({ filename: 'combined.log' }),
+        ],
+    });
+
+    app.use((req, res, next) => {
+        logger.info(`${req.method} ${req.url}`);
+        next();
+    });
+    """, language="javascript")
+
+    st.subheader("4️⃣ Error Handling & Async Patterns")
+    st.write("""
+    Handle async routes gracefully and avoid crashing the server.
+    """)
+    st.code("""
+    const asyncHandler = require('express-async-handler');
+
+    app.get('/async-data', asyncHandler(async (req, res, next) => {
+        const data = await someAsyncFunction(); // May throw error
+        res.json(data);
+    }));
+
+    // Global error middleware
+    app.use((err, req, res, next) => {
+        console.error(err.stack);
+        res.status(500).json({ error: err.message || 'Internal Server Error' });
+    });
+    """, language="javascript")
+
+    st.subheader("5️⃣ Performance & Scalability Tips")
+    st.markdown("""
+    - Use **indexes** in MongoDB to speed up queries.  
+    - Avoid blocking code; use **async/await** everywhere.  
+    - Compress responses using **compression** middleware.  
+    - Limit request rate with **express-rate-limit**.  
+    - Deploy with **PM2** for clustering & monitoring.  
+    - Split routes into modules and use `router` for cleaner code.
+    """)
+
+
+QUIZ = {
+    "title": "🧩 Chapter 9 Quiz: Advanced Backend Concepts",
+    "pass_score": 3,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. What is the main purpose of authentication?",
+            "options": [
+                "To verify who the user is",
+                "To decide what resources a user can access",
+                "To encrypt database",
+                "To deploy applications",
+            ],
+            "answer": "To verify who the user is",
+            "explanation": "✅ Correct! Authentication checks identity (e.g., login).",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "2. Authorization is mainly about:",
+            "options": [
+                "Verifying user identity",
+                "Granting or denying access to resources",
+                "Encrypting API requests",
+                "Database optimization",
+            ],
+            "answer": "Granting or denying access to resources",
+            "explanation": "✅ Correct! Authorization controls access after authentication.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "3. Which standard is commonly used for secure authentication?",
+            "options": ["OAuth2", "CSS", "HTML", "Excel"],
+            "answer": "OAuth2",
+            "explanation": "✅ Correct! OAuth2 is widely used for secure authentication.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "4. What is JWT commonly used for?",
+            "options": ["Frontend styling", "User session tokens", "Database indexing", "File storage"],
+            "answer": "User session tokens",
+            "explanation": "✅ Correct! JWT stores user identity securely in tokens.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "5. Which one is an example of Multi-Factor Authentication (MFA)?",
+            "options": ["Password only", "Password + OTP", "Username only", "API key only"],
+            "answer": "Password + OTP",
+            "explanation": "✅ Correct! MFA combines multiple verification methods.",
+            "wrong": "❌ Try again!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 9 Tasks: Advanced Backend Concepts")
+
+    st.write("""
+    Practice advanced backend concepts with these tasks. Try implementing them step by step.
+    """)
+
+    task = st.radio("Choose a task:", 
+                    ["Task 1: Modular Middleware",
+                     "Task 2: Redis Caching",
+                     "Task 3: Winston Logging",
+                     "Task 4: Async Error Handling",
+                     "Task 5: Performance Optimization Challenge"], index=None)
+
+    if task == "Task 1: Modular Middleware":
+        st.subheader("🔧 Task 1: Modular Middleware")
+        st.write("""
+        - Create an `authMiddleware.js` to check headers for authorization.  
+        - Import it in your main app and protect `/protected` route.  
+        - Test that unauthorized requests get 401 status.  
+        """)
+
+    elif task == "Task 2: Redis Caching":
+        st.subheader("⚡ Task 2: Redis Caching")
+        st.write("""
+        - Install Redis and `redis` npm package.  
+        - Cache responses for `/data/:id` route for 1 hour.  
+        - Test that repeated requests return cached data (cached: true).  
+        """)
+
+    elif task == "Task 3: Winston Logging":
+        st.subheader("📄 Task 3: Winston Logging")
+        st.write("""
+        - Install Winston.  
+        - Log all incoming requests to `combined.log`.  
+        - Log only errors to `error.log`.  
+        - Test by making a route that throws an error.  
+        """)
+
+    elif task == "Task 4: Async Error Handling":
+        st.subheader("💥 Task 4: Async Error Handling")
+        st.write("""
+        - Wrap async routes using `express-async-handler`.  
+        - Create a route `/async-error` that throws an error asynchronously.  
+        - Verify the global error middleware catches it and returns 500.  
+        """)
+
+    elif task == "Task 5: Performance Optimization Challenge":
+        st.subheader("🚀 Task 5: Performance Optimization Challenge")
+        st.write("""
+        - Add **compression** middleware to compress responses.  
+        - Add **rate-limiting** middleware using `express-rate-limit`.  
+        - Ensure MongoDB queries use **indexes** for fast retrieval.  
+        - Test performance with Postman or Apache Bench (`ab`) tool.  
+        """)
@@ -0,0 +1,204 @@
+# Chapter 10: Microservices
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("⚡ Chapter 10: Microservices & Advanced Backend Architecture")
+    chapter_divider(10)
+    chapter_lock(10)
+    st.write("""
+    In large-scale applications, a **monolithic backend** becomes hard to manage.  
+    Microservices allow you to split your backend into **small, independent services** that communicate over APIs.  
+
+    Key concepts:
+    - Each service has its own database and API.
+    - Services communicate via **HTTP REST** or **message queues**.
+    - Easier to scale, deploy, and maintain.
+    """)
+
+    st.subheader("1️⃣ Simple Microservice Example")
+    st.write("""
+    Create **two services**: Users service and Orders service.  
+    Each service runs on a different port and communicates via HTTP requests.
+    """)
+
+    st.code("""
+    // users-service/index.js
+    const express = require('express');
+    const app = express();
+    const users = [{ id:1, name: 'Alice' }];
+
+    app.get('/users', (req, res) => res.json(users));
+
+    app.listen(3001, () => console.log('Users service running on port 3001'));
+    """, language="javascript")
+
+    st.code("""
+    // orders-service/index.js
+    const express = require('express');
+    const axios = require('axios');
+    const app = express();
+    const orders = [{ id:1, userId:1, item: 'Book' }];
+
+    app.get('/orders', async (req, res) => {
+        const users = await axios.get('http://localhost:3001/users');
+        const ordersWithUser = orders.map(order => {
+            const user = users.data.find(u => u.id === order.userId);
+            return { ...order, user: user.name };
+        });
+        res.json(ordersWithUser);
+    });
+
+    app.listen(3002, () => console.log('Orders service running on port 3002'));
+    """, language="javascript")
+
+    st.subheader("2️⃣ Service Communication")
+    st.markdown("""
+    - Orders service requests user info from Users service using **HTTP GET**.  
+    - In real-world, you might use **message queues** like RabbitMQ or Kafka for async communication.
+    """)
+
+    st.subheader("3️⃣ Environment & Configuration")
+    st.markdown("""
+    - Each service should use its **own `.env` file** for sensitive info.  
+    - Example:
+      - USERS_PORT=3001  
+      - ORDERS_PORT=3002  
+      - DATABASE_URL=<mongo_connection>
+    """)
+
+    st.subheader("4️⃣ Scaling Microservices")
+    st.markdown("""
+    - You can deploy each service independently.  
+    - Use **Docker** to containerize services.  
+    - Use **load balancers** to distribute traffic.  
+    - Monitor each service individually for performance.
+    """)
+
+
+QUIZ = {
+    "title": "🧩 Chapter 10 Quiz: Microservices & Advanced Backend Architecture",
+    "pass_score": 3,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. What is the main advantage of microservices over monolithic architecture?",
+            "options": [
+                "Easier scaling and maintenance",
+                "Faster frontend rendering",
+                "Less coding required",
+                "Automatic database backups",
+            ],
+            "answer": "Easier scaling and maintenance",
+            "explanation": "✅ Correct! Microservices allow independent scaling and deployment.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "2. How do microservices usually communicate?",
+            "options": [
+                "HTTP REST, message queues, gRPC",
+                "CSS and HTML",
+                "Direct DB file access",
+                "Static text files",
+            ],
+            "answer": "HTTP REST, message queues, gRPC",
+            "explanation": "✅ Correct! Services communicate over network protocols.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "3. Why should each microservice have its own database?",
+            "options": [
+                "To decouple services and avoid single point of failure",
+                "To use more storage",
+                "To make frontend faster",
+                "To confuse developers",
+            ],
+            "answer": "To decouple services and avoid single point of failure",
+            "explanation": "✅ Correct! Each service is independent.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "4. What tool is commonly used to containerize microservices?",
+            "options": ["Docker", "Redis", "Express", "Postman"],
+            "answer": "Docker",
+            "explanation": "✅ Correct! Docker helps deploy isolated containers.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "5. What is a common pattern for async communication between microservices?",
+            "options": [
+                "Message queues like RabbitMQ or Kafka",
+                "HTTP GET only",
+                "Direct DB writes",
+                "CSS animation",
+            ],
+            "answer": "Message queues like RabbitMQ or Kafka",
+            "explanation": "✅ Correct! Async queues decouple services.",
+            "wrong": "❌ Try again!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 10 Tasks: Microservices & Advanced Backend Architecture")
+
+    st.write("""
+    Practice building microservices and testing communication between them.  
+    Start small, then combine multiple services.
+    """)
+
+    task = st.radio("Choose a task:", 
+                    ["Task 1: Build Users Microservice",
+                     "Task 2: Build Orders Microservice",
+                     "Task 3: Service Communication",
+                     "Task 4: Environment Configuration",
+                     "Task 5: Containerize with Docker"], index=None)
+
+    if task == "Task 1: Build Users Microservice":
+        st.subheader("👤 Task 1: Build Users Microservice")
+        st.write("""
+        - Create a new Node.js project for Users service.  
+        - Add routes:  
+          - `GET /users` → Return a list of users  
+          - `POST /users` → Add a user  
+        - Run it on port 3001 and test locally.  
+        """)
+
+    elif task == "Task 2: Build Orders Microservice":
+        st.subheader("🛒 Task 2: Build Orders Microservice")
+        st.write("""
+        - Create a new Node.js project for Orders service.  
+        - Add routes:  
+          - `GET /orders` → Return a list of orders  
+          - `POST /orders` → Add an order  
+        - Run it on port 3002.  
+        """)
+
+    elif task == "Task 3: Service Communication":
+        st.subheader("🔗 Task 3: Service Communication")
+        st.write("""
+        - Make Orders service call Users service via HTTP to fetch user details.  
+        - Return orders with user info included.  
+        - Test that data from both services is combined correctly.  
+        """)
+
+    elif task == "Task 4: Environment Configuration":
+        st.subheader("⚙️ Task 4: Environment Configuration")
+        st.write("""
+        - Add `.env` files to both services with separate PORT and DATABASE_URL variables.  
+        - Use `process.env` in each service.  
+        - Ensure services run correctly with environment variables.  
+        """)
+
+    elif task == "Task 5: Containerize with Docker":
+        st.subheader("🐳 Task 5: Containerize with Docker")
+        st.write("""
+        - Write a `Dockerfile` for Users service and another for Orders service.  
+        - Build Docker images and run containers locally.  
+        - Test that services communicate even when running in containers.  
+        - Optional: Use Docker Compose to run both services together.  
+        """)
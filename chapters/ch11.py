@@ -0,0 +1,141 @@
+# Chapter 11: Real-Time Backend & WebSockets
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("⚡ Chapter 11: Real-Time Backend & WebSockets")
+    chapter_divider(11)
+    chapter_lock(11)
+    st.write("""
+    Real-time communication is essential for apps like **chat applications, live notifications, multiplayer games, and stock price updates**.  
+    Instead of the client asking the server again and again ("polling"), WebSockets allow a **two-way live connection** between client and server.  
+
+    - **HTTP**: One-way → Client sends request, server responds.  
+    - **WebSocket**: Two-way → Both client and server can send data anytime.  
+
+    Common use cases:  
+    - 💬 Chat applications  
+    - 🔔 Live notifications  
+    - 📈 Real-time dashboards  
+    - 🎮 Multiplayer games  
+    """)
+
+    st.subheader("📜 Example 1: Simple WebSocket Server (Node.js)")
+    st.code("""
+    // Install: npm install ws
+    const WebSocket = require('ws');
+
+    const server = new WebSocket.Server({ port: 8080 });
+
+    server.on('connection', socket => {
+        console.log('🔗 New client connected');
+
+        socket.on('message', message => {
+            console.log('Received:', message);
+            socket.send('Server echo: ' + message);
+        });
+
+        socket.on('close', () => {
+            console.log('❌ Client disconnected');
+        });
+    });
+
+    console.log('✅ WebSocket server running on ws://localhost:8080');
+    """, language="javascript")
+
+    st.subheader("📜 Example 2: Client Connecting to WebSocket")
+    st.code("""
+    const socket = new WebSocket("ws://localhost:8080");
+
+    socket.onopen = () => {
+        console.log("Connected to server ✅");
+        socket.send("Hello from client!");
+    };
+
+    socket.onmessage = (event) => {
+        console.log("Message from server:", event.data);
+    };
+
+    socket.onclose = () => {
+        console.log("Disconnected ❌");
+    };
+    """, language="javascript")
+
+    st.success("With WebSockets, your backend can handle **real-time events** like chat, notifications, and live updates!")
+
+    st.markdown("### 🎥 Learn More (Deep Explanation in Hindi)")
+    st.markdown("""
+    - [🔗 WebSockets Tutorial in Hindi (CodeWithHarry)](https://www.youtube.com/watch?v=8ARodQ4Wlf4)  
+    - [🔗 Real-Time Chat App with Node.js & WebSockets (Hindi)](https://www.youtube.com/watch?v=sj0p9O85AIg)  
+    """)
+
+
+QUIZ = {
+    "title": "🧩 Chapter 11 Quiz: Real-Time Backend & WebSockets",
+    "pass_score": 3,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. WebSockets allow communication that is:",
+            "options": [
+                "One-way (client → server only)",
+                "Two-way (client ↔ server)",
+                "Only server to client",
+            ],
+            "answer": "Two-way (client ↔ server)",
+            "explanation": "✅ Correct! WebSockets support two-way communication.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "2. Which protocol is WebSocket based on?",
+            "options": ["HTTP", "TCP", "UDP", "SMTP"],
+            "answer": "TCP",
+            "explanation": "✅ Correct! WebSockets use TCP for persistent connections.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "3. What is a common use case of WebSockets?",
+            "options": ["Static website hosting", "Real-time chat", "Image compression", "Database backups"],
+            "answer": "Real-time chat",
+            "explanation": "✅ Correct! WebSockets are widely used in chat apps.",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "4. In Node.js, which package is commonly used for WebSockets?",
+            "options": ["express", "ws", "axios", "mongodb"],
+            "answer": "ws",
+            "explanation": "✅ Correct! The `ws` package is a popular WebSocket library.",
+            "wrong": "❌ Try again!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 11 Tasks: Real-Time Backend & WebSockets")
+    st.write("Practice building **real-time features** with WebSockets.")
+
+    st.subheader("✅ Coding Tasks")
+    st.markdown("""
+    1. Create a simple WebSocket server in Node.js that:
+       - Accepts connections  
+       - Prints any message received from the client  
+       - Replies with `"Message received"`  
+
+    2. Build a **chat application**:
+       - Multiple clients can connect  
+       - Messages from one client are broadcast to all connected clients  
+
+    3. Add a **real-time counter**:
+       - Every time a new client connects, broadcast the total number of users online  
+
+    4. Create a **notification system**:
+       - When a client sends `"notify"`, all clients should receive `"🔔 New Notification!"`  
+
+    5. (Bonus) Build a **real-time stock price simulator**:
+       - Server randomly updates a stock price every 2 seconds  
+       - All connected clients see the updated price instantly
+    """)
@@ -0,0 +1,127 @@
+# Chapter 12: Testing & Debugging
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("🐞 Chapter 12: Testing & Debugging Backend")
+    chapter_divider(12)
+    chapter_lock(12)
+    st.write("""
+    Debugging and testing are essential for reliable backend development.  
+
+    **🔍 Debugging** → Finding and fixing errors in your code.  
+    **🧪 Testing** → Writing code that checks if your backend works correctly.  
+
+    Common Testing Types:  
+    - ✅ **Unit Tests**: Test individual functions or modules.  
+    - 🔗 **Integration Tests**: Test how different modules work together.  
+    - 🌐 **API Tests**: Ensure endpoints return the expected data.  
+
+    Popular Tools:  
+    - **Jest / Mocha** → JavaScript testing frameworks.  
+    - **Supertest** → For testing Express APIs.  
+    - **Postman / Thunder Client** → Manual API testing.  
+
+    Let's look at examples:
+    """)
+
+    st.subheader("📜 Example 1: Unit Test with Jest")
+    st.code("""
+    // math.js
+    function add(a, b) {
+        return a + b;
+    }
+    module.exports = add;
+
+    // math.test.js
+    const add = require('./math');
+
+    test('adds 2 + 3 to equal 5', () => {
+        expect(add(2, 3)).toBe(5);
+    });
+    """, language="javascript")
+
+    st.subheader("📜 Example 2: API Test with Supertest")
+    st.code("""
+    const request = require('supertest');
+    const app = require('./app'); // your Express app
+
+    describe('GET /', () => {
+      it('should return Hello World', async () => {
+        const res = await request(app).get('/');
+        expect(res.statusCode).toBe(200);
+        expect(res.text).toBe('Hello World');
+      });
+    });
+    """, language="javascript")
+
+    st.success("With testing & debugging, your backend becomes **more reliable and professional**!")
+
+    st.markdown("### 🎥 Learn More (Hindi Videos)")
+    st.markdown("""
+    - [🔗 Backend Testing with Jest (Hindi)](https://www.youtube.com/watch?v=MbJsvNYbMHo)  
+    - [🔗 Postman API Testing Tutorial (Hindi)](https://www.youtube.com/watch?v=vyu2xWbJ0PQ)  
+    """)
+
+
+QUIZ = {
+    "title": "🧩 Chapter 12 Quiz: Testing & Debugging",
+    "pass_score": 3,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. What is the purpose of unit testing?",
+            "options": [
+                "To test the whole application",
+                "To test individual functions or modules",
+                "To deploy applications",
+            ],
+            "answer": "To test individual functions or modules",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "2. Which tool is commonly used for API testing?",
+            "options": ["Excel", "Postman", "MongoDB", "React"],
+            "answer": "Postman",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "3. In Jest, which function is used to check results?",
+            "options": ["verify()", "check()", "expect()", "assert()"],
+            "answer": "expect()",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "4. What type of test checks how modules work together?",
+            "options": ["Unit Test", "Integration Test", "Security Test", "UI Test"],
+            "answer": "Integration Test",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 12 Tasks: Testing & Debugging")
+
+    st.subheader("✅ Coding Tasks")
+    st.markdown("""
+    1. Write a unit test in Jest for a function that multiplies two numbers.  
+
+    2. Create an Express app with a route `/hello` that returns `"Hello Backend"`.  
+       Write a Supertest case to check this response.  
+
+    3. Write a unit test for a function that checks if a number is even.  
+
+    4. Build an API with `/add?a=5&b=10` → returns the sum.  
+       Write an API test to confirm correct output.  
+
+    5. Intentionally add a bug in your code, run tests, and fix the error using debugging.
+    """)
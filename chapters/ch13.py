@@ -0,0 +1,120 @@
+# Chapter 13: CI/CD & Automated Deployment
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+def lesson():
+    st.header("⚙️ Chapter 13: CI/CD & Automated Deployment")
+    chapter_divider(13)
+    chapter_lock(13)
+    st.write("""
+    CI/CD stands for **Continuous Integration and Continuous Deployment**.  
+    It helps developers automatically test, build, and release their backend apps.  
+
+    - **CI (Continuous Integration)** → Code is automatically tested every time a developer pushes changes.  
+    - **CD (Continuous Deployment/Delivery)** → Code is automatically deployed to a server (like AWS, Heroku, Vercel).  
+
+    Benefits:  
+    - 🚀 Faster delivery  
+    - ✅ Fewer bugs in production  
+    - 🔄 Automated workflow  
+
+    Popular CI/CD Tools:  
+    - **GitHub Actions**  
+    - **Jenkins**  
+    - **GitLab CI**  
+    - **CircleCI**  
+    """)
+
+    st.subheader("📜 Example: GitHub Actions Workflow")
+    st.code("""
+    # .github/workflows/node.js.yml
+    name: Node.js CI
+
+    on:
+      push:
+        branches: [ "main" ]
+      pull_request:
+        branches: [ "main" ]
+
+    jobs:
+      build:
+        runs-on: ubuntu-latest
+
+        steps:
+        - name: Checkout code
+          uses: actions/checkout@v2
+
+        - name: Use Node.js
+          uses: actions/setup-node@v2
+          with:
+            node-version: '16'
+
+        - name: Install dependencies
+          run: npm install
+
+        - name: Run tests
+          run: npm test
+    """, language="yaml")
+
+    st.success("With CI/CD, your backend is tested and deployed automatically whenever you push code!")
+
+    st.markdown("### 🎥 Learn More (Hindi Videos)")
+    st.markdown("""
+    - [🔗 GitHub Actions CI/CD Tutorial (Hindi)](https://www.youtube.com/watch?v=fgbzTvF8ixs)  
+    - [🔗 Jenkins CI/CD Pipeline (Hindi)](https://www.youtube.com/watch?v=f-Id9kYQKfw)  
+    """)
+
+
+QUIZ = {
+    "title": "🧩 Chapter 13 Quiz: CI/CD & Automated Deployment",
+    "pass_score": 3,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. What does CI in CI/CD stand for?",
+            "options": ["Continuous Integration", "Continuous Improvement", "Code Injection"],
+            "answer": "Continuous Integration",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "2. Which tool is commonly used for CI/CD?",
+            "options": ["GitHub Actions", "MongoDB", "React", "VS Code"],
+            "answer": "GitHub Actions",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "3. What does CD stand for?",
+            "options": ["Continuous Design", "Continuous Deployment", "Continuous Debugging"],
+            "answer": "Continuous Deployment",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "4. What is one key benefit of CI/CD?",
+            "options": ["Manual deployment", "Faster and automated delivery", "More bugs in production"],
+            "answer": "Faster and automated delivery",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+    ],
+}
+
+
+def tasks():
+    st.header("📝 Chapter 13 Tasks: CI/CD & Automated Deployment")
+
+    st.subheader("✅ Coding Tasks")
+    st.markdown("""
+    1. Create a simple Node.js app with a single API endpoint.  
+    2. Write a test for the app using Jest.  
+    3. Push your project to GitHub.  
+    4. Add a `.github/workflows/node.js.yml` file to set up GitHub Actions.  
+    5. Ensure your workflow runs automatically on every push to `main`.  
+    6. Deploy your app to a platform (Heroku, Vercel, or Render).  
+    7. Automate deployment in CI/CD so pushing new code redeploys your app.
+    """)
@@ -0,0 +1,107 @@
+# Chapter 14: Authentication & Security
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+# ---------------- Chapter 14: Authentication & Security ----------------
+def lesson():
+    st.header("🔐 Chapter 14: Authentication & Security")
+    chapter_divider(14)
+
+    chapter_lock(14)
+
+    st.write("""
+    Security is **essential** for protecting user data and preventing unauthorized access.  
+
+    ### 🔹 Authentication vs Authorization
+    - **Authentication** → Verifying *who the user is* (e.g., login with username/password).  
+    - **Authorization** → Verifying *what the user can do* (e.g., admin vs normal user).  
+
+    ### 🔹 Common Authentication Methods
+    - **Passwords** (basic, but must be stored securely with hashing like `bcrypt`).  
+    - **OTP / Email Verification**.  
+    - **OAuth2** (Login with Google, GitHub, Facebook).  
+    - **JWT (JSON Web Tokens)** for API authentication.  
+
+    ### 🔹 Security Best Practices
+    - Hash + Salt passwords (never store plain text).  
+    - Use HTTPS for secure communication.  
+    - Apply **rate limiting** to stop brute-force attacks.  
+    - Keep sensitive data in **environment variables**, not in code.  
+
+    ### Example (Python: Password Hashing)
+    ```python
+    import bcrypt  
+
+    # Hash password
+    password = b"mypassword123"
+    hashed = bcrypt.hashpw(password, bcrypt.gensalt())
+
+    # Verify password
+    if bcrypt.checkpw(password, hashed):
+        print("✅ Password matches!")
+    else:
+        print("❌ Invalid password")
+    ```
+    """)
+
+    st.success("✅ Authentication + Security keeps your app safe and trustworthy!")
+
+    st.markdown("### 🎥 Learn More (Hindi Video)")
+    st.link_button("📺 Authentication & Security Basics", "https://www.youtube.com/watch?v=7Q17ubqLfaM")
+
+
+# ---------------- Chapter 14 Quiz ----------------
+QUIZ = {
+    "title": "🧩 Chapter 14 Quiz: Authentication & Security",
+    "pass_score": 2,
+    "xp": 20,
+    "questions": [
+        {
+            "question": "1. What does Authentication mean?",
+            "options": [
+                "Verifying who the user is",
+                "Verifying what the user can do",
+                "Encrypting data",
+                "Storing passwords",
+            ],
+            "answer": "Verifying who the user is",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "2. Which of these is a secure way to store passwords?",
+            "options": ["Plain text", "MD5 only", "Hashing with bcrypt", "Storing in a text file"],
+            "answer": "Hashing with bcrypt",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "3. Which protocol ensures secure communication over the web?",
+            "options": ["HTTP", "FTP", "SMTP", "HTTPS"],
+            "answer": "HTTPS",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+    ],
+}
+
+
+# ---------------- Chapter 14 Tasks ----------------
+def tasks():
+    st.header("📝 Chapter 14 Tasks: Authentication & Security")
+    st.markdown("""
+    ✅ Hands-on Practice Challenges:  
+
+    1. Implement a **login system** with username and password.  
+
+    2. Use `bcrypt` in Python to **hash passwords** before storing them.  
+
+    3. Add a feature → login fails after **3 wrong attempts**.  
+
+    4. Implement a simple **JWT token-based authentication** for an API.  
+
+    5. Bonus → Integrate **Google OAuth2 Login** using a library like `authlib`.  
+    """)
@@ -0,0 +1,103 @@
+# Chapter 15: Databases & SQL
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+# ---------------- Chapter 15: Databases & SQL ----------------
+def lesson():
+    st.header("🗄️ Chapter 15: Databases & SQL")
+    chapter_divider(15)
+
+    chapter_lock(15)
+
+    st.write("""
+    Databases are used to **store, organize, and manage data** efficiently.  
+    SQL (**Structured Query Language**) is the standard language to interact with databases.  
+
+    ### 🔹 Types of Databases
+    - **Relational (SQL)** → MySQL, PostgreSQL, SQLite (tables with rows & columns).  
+    - **NoSQL** → MongoDB, Firebase (document-based, key-value, graph).  
+
+    ### 🔹 Why Databases?
+    - 📂 Store large amounts of data  
+    - 🔍 Fast search & filtering  
+    - 🔒 Secure and consistent  
+    - 🤝 Multiple users can access simultaneously  
+
+    ### 🔹 Common SQL Commands
+    - `CREATE TABLE` → Make a new table  
+    - `INSERT INTO` → Add new data  
+    - `SELECT` → Retrieve data  
+    - `UPDATE` → Modify existing data  
+    - `DELETE` → Remove data  
+
+    ### Example:
+    ```sql
+    CREATE TABLE Students (
+        id INT PRIMARY KEY,
+        name TEXT,
+        age INT
+    );
+
+    INSERT INTO Students VALUES (1, 'Ali', 21);
+    SELECT * FROM Students;
+    ```
+    """)
+
+    st.success("✅ Databases are the backbone of almost every app — from small websites to enterprise systems!")
+
+    st.markdown("### 🎥 Learn More (Hindi Video)")
+    st.link_button("📺 SQL Database Tutorial", "https://www.youtube.com/watch?v=HXV3zeQKqGY")
+
+
+# ---------------- Chapter 15 Quiz ----------------
+QUIZ = {
+    "title": "🧩 Chapter 15 Quiz: Databases & SQL",
+    "pass_score": 2,
+    "xp": 20,
+    "questions": [
+        {
+            "question": "1. Which language is used to interact with relational databases?",
+            "options": ["Python", "C++", "SQL", "HTML"],
+            "answer": "SQL",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "2. Which SQL command is used to retrieve data?",
+            "options": ["INSERT", "SELECT", "DELETE", "UPDATE"],
+            "answer": "SELECT",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "3. Which of these is a NoSQL database?",
+            "options": ["PostgreSQL", "MySQL", "MongoDB", "SQLite"],
+            "answer": "MongoDB",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+    ],
+}
+
+
+# ---------------- Chapter 15 Tasks ----------------
+def tasks():
+    st.header("📝 Chapter 15 Tasks: Databases & SQL")
+    st.markdown("""
+    ✅ Hands-on Practice Challenges:  
+
+    1. Install SQLite (or use an online SQL editor).  
+
+    2. Create a **Students** table with columns: `id`, `name`, `age`.  
+
+    3. Insert at least **5 students** into the table.  
+
+    4. Write a query to **fetch all students older than 20 years**.  
+
+    5. Update one student’s name and delete another student’s record.  
+
+    6. Bonus → Try creating a second table (e.g., Courses) and use a **JOIN** query.  
+    """)
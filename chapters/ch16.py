@@ -0,0 +1,109 @@
+# Chapter 16: Containerization with Docker
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+# ---------------- Chapter 16: Containerization with Docker ----------------
+def lesson():
+    st.header("🐳 Chapter 16: Containerization with Docker")
+    chapter_divider(16)
+
+    chapter_lock(16)
+
+    st.write("""
+    Docker allows developers to **package applications** and all their dependencies into **containers**,  
+    making them portable, consistent, and easy to run anywhere.  
+
+    ### 🔹 Why Docker?
+    - 🏗️ **Consistency** → Same environment everywhere (no "works on my machine" issues).  
+    - ⚡ **Lightweight** → Uses fewer resources than Virtual Machines.  
+    - 🚀 **Scalability** → Easy to run multiple containers.  
+    - 🔄 **Portability** → Works across Windows, Linux, Mac, and cloud.  
+
+    ### 🔹 Key Concepts:
+    - **Image** → Blueprint of your application.  
+    - **Container** → Running instance of an image.  
+    - **Dockerfile** → Script with instructions to build images.  
+    - **Docker Hub** → Public registry to share images.  
+
+    ### 🔹 Docker vs Virtual Machine
+    - VM → Heavy (needs OS for each instance).  
+    - Docker → Lightweight (shares host OS, only adds what’s needed).  
+    """)
+
+    st.subheader("🖥️ Example: Dockerfile for Node.js App")
+    st.code("""
+    # Dockerfile
+    FROM node:16
+    WORKDIR /app
+    COPY package*.json ./
+    RUN npm install
+    COPY . .
+    EXPOSE 3000
+    CMD ["node", "server.js"]
+    """, language="dockerfile")
+
+    st.success("✅ With Docker, you can run your app anywhere — local, server, or cloud!")
+
+    st.markdown("### 🎥 Learn More (Hindi Video)")
+    st.link_button("📺 Docker Tutorial in Hindi", "https://www.youtube.com/watch?v=ns9tmyuF65k")
+
+
+# ---------------- Chapter 16 Quiz ----------------
+QUIZ = {
+    "title": "🧩 Chapter 16 Quiz: Containerization with Docker",
+    "pass_score": 2,
+    "xp": 20,
+    "questions": [
+        {
+            "question": "1. What does Docker package an app into?",
+            "options": ["Virtual Machine", "Container", "Library", "Script"],
+            "answer": "Container",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "2. What is a Dockerfile used for?",
+            "options": [
+                "To run containers",
+                "To build Docker images",
+                "To store passwords",
+                "To install Node.js",
+            ],
+            "answer": "To build Docker images",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "3. Which is lighter: Docker containers or Virtual Machines?",
+            "options": ["Containers", "Virtual Machines", "Both same", "None"],
+            "answer": "Containers",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+    ],
+}
+
+
+# ---------------- Chapter 16 Tasks ----------------
+def tasks():
+    st.header("📝 Chapter 16 Tasks: Containerization with Docker")
+    st.markdown("""
+    ✅ Hands-on Practice Challenges:  
+
+    1. Install Docker and run the command:  
+       ```bash
+       docker run hello-world
+       ```
+       to verify installation.  
+
+    2. Create a **Dockerfile** for a Node.js app and build the image.  
+
+    3. Run your app inside a container and test in the browser.  
+
+    4. Push your Docker image to **Docker Hub**.  
+
+    5. Compare the performance of running an app **with Docker** vs **without Docker**.  
+    """)
@@ -0,0 +1,121 @@
+# Chapter 17: Kubernetes & Orchestration
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+# ---------------- Chapter 17: Kubernetes & Orchestration ----------------
+def lesson():
+    st.header("☸️ Chapter 17: Kubernetes & Orchestration")
+    chapter_divider(17)
+
+    chapter_lock(17)
+
+    st.write("""
+    Kubernetes (often called **K8s**) is a powerful system for **orchestrating containers**.  
+    Imagine you have multiple Docker containers (your app, database, cache, etc.) —  
+    Kubernetes helps you manage them all **automatically**.  
+
+    ### 🔹 Why Kubernetes?
+    - 🚀 **Scalability** → Automatically increase or decrease containers depending on traffic.  
+    - ⚡ **Self-Healing** → If a container crashes, Kubernetes restarts it.  
+    - 🌍 **Load Balancing** → Distributes traffic across containers evenly.  
+    - 🔄 **Rolling Updates** → Update your app without downtime.  
+
+    ### 🔹 Key Concepts in Kubernetes:
+    - **Cluster** → A group of machines (nodes) where Kubernetes runs.  
+    - **Node** → A single machine (VM/Server) inside the cluster.  
+    - **Pod** → The smallest unit in Kubernetes (can contain one or more containers).  
+    - **Deployment** → Ensures the right number of Pods are running at all times.  
+    - **Service** → Exposes Pods so users or other apps can access them.  
+    - **Ingress** → Manages external traffic (like a gateway + load balancer).  
+
+    ### 🔹 Workflow
+    1. Developer writes a **Dockerfile** → builds an image.  
+    2. Push image to **Docker Hub** (or any registry).  
+    3. Create a **Kubernetes Deployment** (YAML file).  
+    4. Apply it with `kubectl apply -f deployment.yaml`.  
+    5. Kubernetes schedules pods, ensures scaling, and keeps everything running.  
+    """)
+
+    st.subheader("🖥️ Example: Kubernetes Deployment (YAML)")
+    st.code("""
+    apiVersion: apps/v1
+    kind: Deployment
+    metadata:
+      name: node-app
+    spec:
+      replicas: 3        # Run 3 copies of the app
+      selector:
+        matchLabels:
+          app: node
+      template:
+        metadata:
+          labels:
+            app: node
+        spec:
+          containers:
+          - name: node
+            image: my-node-app:1.0
+            ports:
+            - containerPort: 3000
+    """, language="yaml")
+
+    st.success("✅ Kubernetes makes apps **scalable, resilient, and production-ready**!")
+
+    # 🎥 YouTube Video Section
+    st.markdown("### 🎥 Learn More with Video Tutorials (Hindi)")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.link_button("📺 Kubernetes in Hindi (Complete Guide)", 
+                       "https://www.youtube.com/watch?v=Jt0zVxgkGcQ")
+
+    with col2:
+        st.link_button("📺 Kubernetes Deployment Tutorial", 
+                       "https://www.youtube.com/watch?v=VnvRFRk_51k")
+
+
+# ---------------- Chapter 17 Quiz ----------------
+QUIZ = {
+    "title": "🧩 Chapter 17 Quiz: Kubernetes & Orchestration",
+    "pass_score": 2,
+    "xp": 10,
+    "questions": [
+        {
+            "question": "1. What is the smallest unit in Kubernetes?",
+            "options": ["Pod", "Deployment", "Service"],
+            "answer": "Pod",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "2. Which object ensures the desired number of pods?",
+            "options": ["Ingress", "Deployment", "ReplicaSet"],
+            "answer": "Deployment",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "3. Which component exposes pods to the network?",
+            "options": ["Service", "ConfigMap", "Pod"],
+            "answer": "Service",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Try again!",
+        },
+    ],
+}
+
+
+# ---------------- Chapter 17 Tasks ----------------
+def tasks():
+    st.header("📝 Chapter 17 Tasks: Kubernetes & Orchestration")
+    st.subheader("✅ Practical Tasks")
+    st.markdown("""
+    1. Install Minikube or use a Kubernetes cluster.  
+    2. Deploy a Node.js app using a Deployment YAML file.  
+    3. Expose it using a Service of type NodePort.  
+    4. Scale your deployment from 2 pods to 5 pods.  
+    5. Add an Ingress rule to route traffic to your service.  
+    """)
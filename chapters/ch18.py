@@ -0,0 +1,92 @@
+# Chapter 18: Cloud Deployment (AWS/GCP/Azure)
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+# ---------------- Chapter 18: Cloud Deployment ----------------
+def lesson():
+    st.header("☁️ Chapter 18: Cloud Deployment (AWS/GCP/Azure)")
+    chapter_divider(18)
+
+    chapter_lock(18)
+
+    st.write("""
+    Cloud platforms allow developers to **deploy apps globally** without setting up their own hardware.  
+    Instead of buying and maintaining servers, you can **rent computing power** from cloud providers.
+
+    ### 🔹 Why Cloud?
+    - 🌍 Deploy apps for worldwide access.  
+    - ⚡ Auto-scale when traffic increases.  
+    - 💰 Pay only for what you use.  
+    - 🔒 Secure & reliable infrastructure.  
+
+    ### 🔹 Popular Providers:
+    - **AWS (Amazon Web Services)** → EC2, S3, Lambda, ECS, RDS  
+    - **GCP (Google Cloud Platform)** → Compute Engine, GKE, Cloud Functions  
+    - **Azure (Microsoft)** → Azure VM, AKS, Azure Functions  
+
+    ### 🔹 Deployment Options:
+    1. **Virtual Machines (IaaS)**  
+       - Example: AWS EC2, GCP Compute Engine  
+       - Gives you full control (like renting a server).  
+
+    2. **Containers (CaaS)**  
+       - Example: AWS ECS, GCP GKE, Azure AKS  
+       - Run Docker/Kubernetes apps easily.  
+
+    3. **Serverless (FaaS)**  
+       - Example: AWS Lambda, GCP Cloud Functions  
+       - No servers to manage → just upload your code!  
+
+    👉 Cloud = Flexibility, Scalability, and Global Reach 🚀
+    """)
+
+    st.markdown("### 🎥 Learn More (Hindi Video)")
+    st.link_button("📺 Cloud Computing Basics in Hindi", "https://www.youtube.com/watch?v=2LaAJq1lB1Q")
+
+
+# ---------------- Chapter 18 Quiz ----------------
+QUIZ = {
+    "title": "🧩 Chapter 18 Quiz: Cloud Deployment",
+    "pass_score": 2,
+    "xp": 15,
+    "questions": [
+        {
+            "question": "1. Which of these is NOT a cloud provider?",
+            "options": ["AWS", "GCP", "Azure", "Photoshop"],
+            "answer": "Photoshop",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "2. What does 'Serverless' mean?",
+            "options": ["No servers exist", "Cloud manages servers for you", "Only frontend apps"],
+            "answer": "Cloud manages servers for you",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Try again!",
+        },
+        {
+            "question": "3. Which service is 'Infrastructure as a Service (IaaS)'?",
+            "options": ["AWS EC2", "AWS Lambda", "Firebase", "Google Docs"],
+            "answer": "AWS EC2",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Nope!",
+        },
+    ],
+}
+
+
+# ---------------- Chapter 18 Tasks ----------------
+def tasks():
+    st.header("📝 Chapter 18 Tasks: Cloud Deployment")
+    st.markdown("""
+    ✅ Practice Challenges:  
+
+    1. Deploy a simple Node.js or Python app on **Heroku or Render** (free tier).  
+    2. Try AWS Free Tier → Launch an EC2 instance and install Node.js.  
+    3. Deploy a Docker container on **Google Kubernetes Engine (GKE)**.  
+    4. Create a serverless function in AWS Lambda that returns `"Hello Cloud"`.  
+    5. Compare pricing between **AWS, GCP, and Azure** for hosting a small app.  
+    """)
@@ -0,0 +1,87 @@
+# Chapter 19: CI/CD Pipelines
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+# ---------------- Chapter 19: CI/CD Pipelines ----------------
+def lesson():
+    st.header("⚙️ Chapter 19: CI/CD Pipelines")
+    chapter_divider(19)
+
+    chapter_lock(19)
+
+    st.write("""
+    CI/CD stands for **Continuous Integration** and **Continuous Deployment/Delivery**.  
+    It helps developers **automate testing, building, and deployment** → making development faster and safer.  
+
+    ### 🔹 CI (Continuous Integration)
+    - Developers push code frequently (daily or multiple times a day).  
+    - Each push triggers automated tests & build pipeline.  
+    - Ensures **new code doesn’t break existing code**.  
+
+    ### 🔹 CD (Continuous Deployment/Delivery)
+    - **Continuous Delivery** → Code is automatically tested and ready for manual deployment.  
+    - **Continuous Deployment** → Code is automatically deployed to servers after passing all tests.  
+
+    ### 🔹 Benefits of CI/CD
+    - 🚀 Faster releases  
+    - ✅ Fewer bugs in production  
+    - 🔁 Automated testing saves time  
+    - ⚡ Scalable development for teams  
+
+    ### 🔹 Popular CI/CD Tools:
+    - **GitHub Actions**  
+    - **GitLab CI/CD**  
+    - **Jenkins**  
+    - **CircleCI**  
+    """)
+
+    st.markdown("### 🎥 Learn More (Hindi Video)")
+    st.link_button("📺 CI/CD Explained in Hindi", "https://www.youtube.com/watch?v=R8_veQiYBjI")
+
+
+# ---------------- Chapter 19 Quiz ----------------
+QUIZ = {
+    "title": "🧩 Chapter 19 Quiz: CI/CD Pipelines",
+    "pass_score": 2,
+    "xp": 15,
+    "questions": [
+        {
+            "question": "1. What does CI stand for?",
+            "options": ["Continuous Integration", "Cloud Infrastructure", "Centralized Information"],
+            "answer": "Continuous Integration",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "2. Which tool is commonly used for CI/CD?",
+            "options": ["GitHub Actions", "MS Word", "Excel", "Figma"],
+            "answer": "GitHub Actions",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "3. What is the main advantage of CI/CD?",
+            "options": ["Slower releases", "Fewer bugs & faster deployment", "No testing needed"],
+            "answer": "Fewer bugs & faster deployment",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+    ],
+}
+
+
+# ---------------- Chapter 19 Tasks ----------------
+def tasks():
+    st.header("📝 Chapter 19 Tasks: CI/CD Pipelines")
+    st.markdown("""
+    ✅ Practice Challenges:  
+
+    1. Create a **GitHub Actions** workflow that runs tests when you push code.  
+    2. Use **GitLab CI/CD** to automatically deploy a small app to Heroku.  
+    3. Write a **Jenkins pipeline** that builds and tests your project.  
+    4. Automate deployment of a Node.js or Python app after every commit.  
+    5. Research → Compare GitHub Actions vs Jenkins (advantages & disadvantages).  
+    """)
@@ -0,0 +1,108 @@
+# Chapter 20: WebSockets
+
+import streamlit as st
+
+from book import chapter_divider, chapter_lock
+
+
+# ---------------- Chapter 20: WebSockets ----------------
+def lesson():
+    st.header("🔌 Chapter 20: WebSockets & Real-time Communication")
+    chapter_divider(20)
+
+    chapter_lock(20)
+
+    st.write("""
+    WebSockets enable **real-time two-way communication** between client and server.  
+    Unlike HTTP (request-response model), WebSockets keep a **persistent connection open**.  
+
+    ### 🔹 Why WebSockets?
+    - 📡 Real-time communication without constant HTTP requests.  
+    - ⚡ Faster & more efficient for frequent updates.  
+    - 🎮 Ideal for **chats, games, notifications, live dashboards**.  
+
+    ### 🔹 How WebSockets Work
+    1. Client sends a request to **upgrade** HTTP → WebSocket.  
+    2. Server accepts, and connection stays **open**.  
+    3. Both client & server can now **send/receive anytime**.  
+
+    ### 🔹 Common Use Cases
+    - 💬 **Chat apps**  
+    - 🎮 **Multiplayer games**  
+    - 📊 **Live dashboards (stocks, crypto, analytics)**  
+    - 🔔 **Push notifications**  
+    """)
+
+    st.subheader("🖥️ Example: WebSocket Server (Node.js)")
+    st.code("""
+    const WebSocket = require('ws');
+    const server = new WebSocket.Server({ port: 8080 });
+
+    server.on('connection', socket => {
+        console.log('Client connected');
+        socket.send('Welcome to WebSocket server!');
+
+        socket.on('message', msg => {
+            console.log('Message:', msg);
+            socket.send(`Echo: ${msg}`);
+        });
+    });
+    """, language="javascript")
+
+    st.success("✅ With WebSockets, your backend can handle **real-time data** easily!")
+
+    st.markdown("### 🎥 Learn More (Hindi Video)")
+    st.link_button("📺 WebSockets in Hindi", "https://www.youtube.com/watch?v=2Nt-ZrNP22A")
+
+
+# ---------------- Chapter 20 Quiz ----------------
+QUIZ = {
+    "title": "🧩 Chapter 20 Quiz: WebSockets",
+    "pass_score": 2,
+    "xp": 20,
+    "questions": [
+        {
+            "question": "1. What makes WebSockets different from HTTP?",
+            "options": [
+                "One-way request/response only",
+                "Two-way persistent communication",
+                "Slower than HTTP",
+            ],
+            "answer": "Two-way persistent communication",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "2. Which is NOT a common use case of WebSockets?",
+            "options": ["Chat apps", "Live dashboards", "Static websites", "Notifications"],
+            "answer": "Static websites",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+        {
+            "question": "3. Which Node.js library is often used for WebSockets?",
+            "options": ["Express", "WebSocket (ws)", "MongoDB", "Postman"],
+            "answer": "WebSocket (ws)",
+            "explanation": "✅ Correct!",
+            "wrong": "❌ Wrong!",
+        },
+    ],
+}
+
+
+# ---------------- Chapter 20 Tasks ----------------
+def tasks():
+    st.header("📝 Chapter 20 Tasks: WebSockets")
+    st.markdown("""
+    ✅ Hands-on Practice Challenges:  
+
+    1. Create a **Node.js WebSocket server** that echoes client messages.  
+
+    2. Build a **chat app** where multiple clients can talk in real-time.  
+
+    3. Make a **live counter** → track and show number of online users.  
+
+    4. Create a **real-time stock price dashboard** (simulate values updating every second).  
+
+    5. Compare **WebSockets vs REST APIs** in terms of speed & efficiency.  
+    """)
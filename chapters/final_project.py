@@ -0,0 +1,72 @@
+# Final Project: Chapters 1–7
+
+import streamlit as st
+
+
+def project():
+    st.header("🚀 Final Project: Backend from Scratch")
+
+    st.write("""
+    Now it’s time to put together everything you learned from **Chapter 1 → 7**.  
+    This will be your **capstone project**, covering backend concepts, Node.js, Express, MongoDB, REST APIs, and more.  
+
+    You don’t need to finish it all at once. Do it step by step. ✨
+    """)
+
+    project = st.radio("Choose a project challenge:", 
+                       ["Project 1: Book Management System",
+                        "Project 2: Notes API with Authentication",
+                        "Project 3: Student Management System",
+                        "Project 4: Blog Platform (Bonus)"], index=None)
+
+    if project == "Project 1: Book Management System":
+        st.subheader("📚 Project 1: Book Management System")
+        st.write("""
+        - Build a complete **Book API** using Node.js + Express + MongoDB.  
+        - Features:
+          - `POST /books` → Add a new book.
+          - `GET /books` → Get all books.
+          - `GET /books/:id` → Get one book.
+          - `PUT /books/:id` → Update book details.
+          - `DELETE /books/:id` → Delete a book.
+        - Extra: Add error handling, and return JSON responses with proper status codes.
+        """)
+
+    elif project == "Project 2: Notes API with Authentication":
+        st.subheader("📝 Project 2: Notes API with Authentication")
+        st.write("""
+        - Create a **Notes App Backend**.
+        - Features:
+          - Users can sign up and log in (`POST /signup`, `POST /login`).
+          - Use **JWT (JSON Web Token)** for authentication.
+          - Authenticated users can:
+            - `POST /notes` → Add a note.
+            - `GET /notes` → See all their notes.
+            - `PUT /notes/:id` → Edit their note.
+            - `DELETE /notes/:id` → Delete their note.
+        - Extra: Add password hashing using `bcrypt`.
+        """)
+
+    elif project == "Project 3: Student Management System":
+        st.subheader("🎓 Project 3: Student Management System")
+        st.write("""
+        - Create a backend for a **Student Management App**.
+        - Features:
+          - `POST /students` → Add new student (name, age, class).
+          - `GET /students` → List all students.
+          - `GET /students/:id` → Get one student.
+          - `PUT /students/:id` → Update student.
+          - `DELETE /students/:id` → Remove student.
+        - Extra: Add validations (e.g., age must be a number).
+        """)
+
+    elif project == "Project 4: Blog Platform (Bonus)":
+        st.subheader("✍️ Project 4: Blog Platform (Bonus)")
+        st.write("""
+        - Build a **Blog API** where users can:
+          - Register & log in.
+          - Create, read, update, and delete blog posts.
+          - Comment on blog posts.
+        - Use MongoDB for storing users, posts, and comments.
+        - Add authentication and error handling.
+        """)
@@ -0,0 +1,145 @@
+# Coding Games
+
+import random
+
+import streamlit as st
+
+from achievements import unlocked
+from learner_progress import GAME_XP, award_game_xp
+
+
+def games():
+
+
+    st.title("🎮 Coding Games Dashboard")
+    st.write("""
+    Sharpen your backend skills while having fun!  
+    Complete these mini-games to earn XP and unlock badges.
+    """)
+
+    # Initialize XP
+    if "game_xp" not in st.session_state:
+        st.session_state.game_xp = 0
+
+    st.markdown("---")
+    st.subheader(f"🏆 Total Game XP: {st.session_state.game_xp}")
+
+    # ---------------- Game 1: Guess the Number ----------------
+    st.subheader("1️⃣ Guess the Number (5 XP)")
+    if "guess_number" not in st.session_state:
+        st.session_state.guess_number = random.randint(1, 10)
+
+    guess = st.number_input("Enter your guess (1-10):", min_value=1, max_value=10, step=1, key="guess_input")
+    if st.button("Check Guess"):
+        if guess == st.session_state.guess_number:
+            st.success("🎉 Correct! +5 XP")
+            award_game_xp(5)
+            st.session_state.guess_number = random.randint(1, 10)
+        else:
+            st.warning("❌ Wrong! Try again.")
+
+    st.markdown("---")
+
+    # ---------------- Game 2: Quick Math Challenge ----------------
+    st.subheader("2️⃣ Quick Math Challenge (5 XP)")
+    if "num1" not in st.session_state:
+        st.session_state.num1 = random.randint(1, 20)
+        st.session_state.num2 = random.randint(1, 20)
+
+    answer = st.number_input(f"What is {st.session_state.num1} + {st.session_state.num2}?", key="math_input")
+    if st.button("Check Answer", key="math_btn"):
+        if answer == st.session_state.num1 + st.session_state.num2:
+            st.success("✅ Correct! +5 XP")
+            award_game_xp(5)
+            st.session_state.num1 = random.randint(1, 20)
+            st.session_state.num2 = random.randint(1, 20)
+        else:
+            st.warning("❌ Wrong! Try again.")
+
+    st.markdown("---")
+
+    # ---------------- Game 3: String Reversal ----------------
+    st.subheader("3️⃣ String Reversal Challenge (5 XP)")
+    sample_string = "Backend"
+    user_input = st.text_input(f"Reverse this string: {sample_string}", key="reverse_input")
+    if st.button("Check Reverse"):
+        if user_input == sample_string[::-1]:
+            st.success("🎉 Correct! +5 XP")
+            award_game_xp(5)
+        else:
+            st.warning("❌ Incorrect, try again.")
+
+    st.markdown("---")
+
+    # ---------------- Game 4: Memory Number Challenge ----------------
+    st.subheader("4️⃣ Memory Number Challenge (10 XP)")
+    if "memory_seq" not in st.session_state:
+        st.session_state.memory_seq = [random.randint(1, 9) for _ in range(5)]
+
+    # What st.write() would render for the list, minus its dataframe
+    # detection, which imports numpy and pandas on first use
+    st.write("💡 Memorize this sequence:")
+    st.json(st.session_state.memory_seq)
+    user_mem_input = st.text_input("Enter the sequence separated by commas:", key="memory_input")
+    if st.button("Check Sequence"):
+        try:
+            user_seq = [int(x.strip()) for x in user_mem_input.split(",")]
+            if user_seq == st.session_state.memory_seq:
+                st.success("🎉 Perfect! +10 XP")
+                award_game_xp(10)
+                st.session_state.memory_seq = [random.randint(1, 9) for _ in range(5)]
+            else:
+                st.warning("❌ Wrong sequence! Try again.")
+        except:
+            st.error("⚠️ Enter numbers separated by commas!")
+
+    st.markdown("---")
+
+    # ---------------- Game 5: FizzBuzz Challenge ----------------
+    st.subheader("5️⃣ FizzBuzz Challenge (10 XP)")
+    user_fizzbuzz = st.text_area("Enter numbers 1-15, replacing multiples of 3 with 'Fizz', 5 with 'Buzz', 3&5 with 'FizzBuzz', separated by commas:", key="fizzbuzz_input")
+    if st.button("Check FizzBuzz"):
+        correct = []
+        for i in range(1, 16):
+            if i % 3 == 0 and i % 5 == 0:
+                correct.append("FizzBuzz")
+            elif i % 3 == 0:
+                correct.append("Fizz")
+            elif i % 5 == 0:
+                correct.append("Buzz")
+            else:
+                correct.append(str(i))
+        if user_fizzbuzz.split(",") == correct:
+            st.success("🎉 Correct! +10 XP")
+            award_game_xp(10)
+        else:
+            st.warning("❌ Not quite right, check multiples of 3 and 5.")
+
+    st.markdown("---")
+
+    # ---------------- Game 6: Mini Backend Quiz ----------------
+    st.subheader("6️⃣ Mini Backend Quiz (5 XP per correct answer)")
+    questions = {
+        "What HTTP status code means 'Not Found'?": "404",
+        "Which database is NoSQL?": "MongoDB",
+        "Which HTTP method is used to delete a resource?": "DELETE"
+    }
+
+    for q, ans in questions.items():
+        user_ans = st.text_input(q, key=f"quiz_{q}")
+        if st.button(f"Check Answer for '{q}'"):
+            if user_ans.strip().upper() == ans.upper():
+                st.success("✅ Correct! +5 XP")
+                award_game_xp(5)
+            else:
+                st.error(f"❌ Wrong! Correct answer: {ans}")
+
+    st.markdown("---")
+
+    # ---------------- Badges ----------------
+    st.subheader("🏅 Badges Earned")
+    badges = unlocked(GAME_XP)
+    if badges:
+        st.write("You have earned these badges:", ", ".join(b.name for b in badges))
+    else:
+        st.write("No badges yet. Keep playing!")
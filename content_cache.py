@@ -0,0 +1,87 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+
+def _size_of(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_size_of(k) + _size_of(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_size_of(item) for item in value)
+    return size
+
+
+# --- Shared Content Cache ---
+class ContentCache:
+    """LRU cache for built page content, shared by every session.
+
+    Entries are sized with sys.getsizeof (recursively for containers) and
+    the least recently used ones are evicted once the total passes
+    ``max_bytes``. A value bigger than the whole budget is returned but
+    not kept.
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key, build):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        # Built outside the lock; two sessions racing on a cold key both
+        # build it and the second one simply replaces the first.
+        value = build()
+        size = _size_of(value)
+        if size > self.max_bytes:
+            return value
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+        return value
+
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+# One cache per process; CONTENT_CACHE_BYTES sets its budget
+content_cache = ContentCache(int(os.environ.get("CONTENT_CACHE_BYTES", str(8 * 1024 * 1024))))
+
+
+def cached(key, build):
+    return content_cache.get(key, build)
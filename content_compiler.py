@@ -0,0 +1,205 @@
+# Content compiler: checks the page registry against the content and
+# writes page_index.json
+#
+#   python content_compiler.py           # check and write the index
+#   python content_compiler.py --check   # check only; also fail if the index is stale
+#
+# Chapter units are read with ast, never imported, so a broken chapter is
+# reported instead of crashing the check. Every page must find its content
+# (a function named after its kind, QUIZ data for quizzes, or a @page
+# renderer in app.py), its headings must name its own chapter, and every
+# unit and page function must be reachable from some page.
+
+import argparse
+import ast
+import json
+import os
+import re
+import sys
+
+from book import (
+    APP_DIR, GAMES_CHAPTER, INDEX_FILE, PREREQUISITES, QUIZ, UNLOCK_LEVELS,
+    build_index, build_pages, chapters_info,
+)
+
+CHAPTERS_DIR = os.path.join(APP_DIR, "chapters")
+APP_FILE = os.path.join(APP_DIR, "app.py")
+
+_CHAPTER_REF = re.compile(r"Chapter (\d+)\b[^:]*:\s*(.*)")
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+# --- Source Reading ---
+class Unit:
+    """What a content unit defines, read from its source."""
+
+    def __init__(self, path):
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        self.functions = {
+            node.name: node for node in tree.body
+            if isinstance(node, ast.FunctionDef) and not node.name.startswith("_")
+        }
+        self.quiz = None
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "QUIZ" for t in node.targets):
+                self.quiz = ast.literal_eval(node.value)
+
+
+# First st.header()/st.title() text in a page function
+def _heading(function):
+    for node in ast.walk(function):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in ("header", "title")
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+        ):
+            return node.args[0].value
+    return None
+
+
+# Page kinds app.py registers renderers for with @page(KIND)
+def _shell_kinds(path=APP_FILE):
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    kinds = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            for decorator in node.decorator_list:
+                if isinstance(decorator, ast.Call) and getattr(decorator.func, "id", None) == "page":
+                    kinds.add(getattr(decorator.args[0], "id", None))
+    return {kind.lower() for kind in kinds if kind}
+
+
+# --- Checks ---
+def _words(text):
+    return set(_WORD.findall(text.lower()))
+
+
+# A heading like "🔐 Chapter 14: Authentication & Security" must name the
+# page's chapter and share at least half the words of its registry title
+# (parenthesized notes like "(Deep)" aside)
+def _check_heading(p, heading, where, problems):
+    if heading is None:
+        problems.append(f"{p.id}: {where} has no heading")
+        return
+    match = _CHAPTER_REF.search(heading)
+    if match is None:
+        problems.append(f"{p.id}: {where} heading {heading!r} names no chapter")
+        return
+    if int(match.group(1)) != p.chapter:
+        problems.append(f"{p.id}: {where} heading {heading!r} is for chapter {match.group(1)}")
+        return
+    title = _words(re.sub(r"\(.*?\)", "", chapters_info[p.chapter]["title"]))
+    if len(title & _words(match.group(2))) * 2 < len(title):
+        problems.append(
+            f"{p.id}: {where} heading {heading!r} doesn't match "
+            f"chapters_info title {chapters_info[p.chapter]['title']!r}"
+        )
+
+
+def _check_quiz(p, quiz, problems):
+    if quiz is None:
+        problems.append(f"{p.id}: chapters/{p.unit}.py has no QUIZ")
+        return
+    _check_heading(p, quiz.get("title"), "QUIZ title", problems)
+    questions = quiz.get("questions") or []
+    if not questions:
+        problems.append(f"{p.id}: QUIZ has no questions")
+    for number, question in enumerate(questions, start=1):
+        if question.get("answer") not in question.get("options", ()):
+            problems.append(f"{p.id}: question {number} answer is not one of its options")
+    if not 0 < quiz.get("pass_score", 0) <= len(questions):
+        problems.append(f"{p.id}: QUIZ pass_score must be between 1 and {len(questions)}")
+
+
+def check(pages):
+    problems = []
+    shell_kinds = _shell_kinds()
+    units = {}
+    used = {}
+
+    ids = [p.id for p in pages]
+    for page_id in sorted({page_id for page_id in ids if ids.count(page_id) > 1}):
+        problems.append(f"{page_id}: page id is used twice")
+
+    for p in pages:
+        if p.unit is None:
+            if p.kind not in shell_kinds:
+                problems.append(f"{p.id}: no unit and no @page({p.kind.upper()}) renderer in app.py")
+            continue
+        if p.unit not in units:
+            path = os.path.join(CHAPTERS_DIR, f"{p.unit}.py")
+            if not os.path.exists(path):
+                problems.append(f"{p.id}: chapters/{p.unit}.py does not exist")
+                units[p.unit] = None
+                continue
+            units[p.unit] = Unit(path)
+        unit = units[p.unit]
+        if unit is None:
+            continue
+        if p.kind == QUIZ:
+            _check_quiz(p, unit.quiz, problems)
+            continue
+        function = unit.functions.get(p.kind)
+        if function is None:
+            problems.append(f"{p.id}: chapters/{p.unit}.py has no {p.kind}()")
+            continue
+        used.setdefault(p.unit, set()).add(p.kind)
+        if p.chapter is not None and p.chapter != GAMES_CHAPTER:
+            _check_heading(p, _heading(function), f"{p.kind}()", problems)
+
+    # Content nothing points at
+    for filename in sorted(os.listdir(CHAPTERS_DIR)):
+        unit, ext = os.path.splitext(filename)
+        if ext == ".py" and unit != "__init__" and unit not in units:
+            problems.append(f"chapters/{filename}: no page uses this unit")
+    for unit_name, unit in units.items():
+        for name in sorted(set(unit.functions) - used.get(unit_name, set()) if unit else ()):
+            problems.append(f"chapters/{unit_name}.py: {name}() is not a page")
+
+    chapters = {p.chapter for p in pages if p.chapter is not None}
+    for num in sorted(set(chapters_info) - chapters):
+        problems.append(f"chapters_info[{num}] has no pages")
+    for num in sorted((set(PREREQUISITES) | set(UNLOCK_LEVELS)) - chapters):
+        problems.append(f"chapter {num} has unlock rules but no pages")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the book's pages and write page_index.json.")
+    parser.add_argument("--check", action="store_true", help="don't write; fail if the index is out of date")
+    args = parser.parse_args()
+
+    pages = build_pages()
+    problems = check(pages)
+    for problem in problems:
+        print(f"ERROR {problem}")
+    if problems:
+        sys.exit(1)
+
+    index = build_index(pages)
+    if args.check:
+        try:
+            with open(INDEX_FILE, encoding="utf-8") as f:
+                current = json.load(f)
+        except (FileNotFoundError, ValueError):
+            current = None
+        if current != index:
+            print(f"{os.path.basename(INDEX_FILE)} is out of date; run python content_compiler.py")
+            sys.exit(1)
+        print(f"{len(pages)} pages OK, index up to date.")
+        return
+
+    tmp_path = INDEX_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+    os.replace(tmp_path, INDEX_FILE)
+    print(f"{len(pages)} pages OK, wrote {os.path.basename(INDEX_FILE)}.")
+
+
+if __name__ == "__main__":
+    main()
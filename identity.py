@@ -0,0 +1,178 @@
+import logging
+import os
+import secrets
+import tempfile
+
+import streamlit as st
+import streamlit.components.v1 as components
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+from progress_store import DEFAULT_USER, check_user_id
+from styles import hidden_container, script_json
+
+# --- Learner Identity ---
+# A learner is a random user id kept in a signed cookie. Any app process
+# with the same BOOK_SECRET_KEY can check the signature and load that
+# learner's progress, with no session table and no sticky sessions, as
+# long as the processes share a store that each of them reads fresh:
+# PROGRESS_BACKEND=sqlite. The default journal store keeps every learner's
+# state in its own process and must only be used by one.
+# The cookie is re-signed on every new session, so it only expires after
+# BOOK_IDENTITY_MAX_AGE seconds (default one year) without a visit.
+#
+# BOOK_IDENTITY=shared turns identity off: every session is DEFAULT_USER
+# and shares progress.json, as before (one learner on their own machine,
+# and the benchmarks).
+COOKIE_NAME = "book_learner"
+SALT = "book-learner-id"
+MAX_AGE = int(os.environ.get("BOOK_IDENTITY_MAX_AGE", str(365 * 24 * 3600)))
+SECRET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".book_secret")
+MIN_KEY_LENGTH = 32
+# ?learner=<token> adopts that learner in this browser (see link_token())
+LINK_PARAM = "learner"
+
+logger = logging.getLogger(__name__)
+
+
+# BOOK_SECRET_KEY, or a key generated once into .book_secret for a single
+# node; several nodes must share BOOK_SECRET_KEY. Raises OSError when the
+# file can't be read or created, and ValueError for a key that is too short.
+def stored_secret_key():
+    key = os.environ.get("BOOK_SECRET_KEY")
+    if key is not None:
+        return _check_key(key, "BOOK_SECRET_KEY")
+    try:
+        with open(SECRET_FILE) as f:
+            return _check_key(f.read().strip(), f"the key in {SECRET_FILE}")
+    except FileNotFoundError:
+        pass
+    # The key is written to a temp file and hard-linked into place, so
+    # .book_secret never exists half written
+    key = secrets.token_hex(32)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(SECRET_FILE), prefix=".book_secret.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(key)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.link(tmp_path, SECRET_FILE)
+        except FileExistsError:
+            # Another process created it first; use theirs
+            with open(SECRET_FILE) as f:
+                return _check_key(f.read().strip(), f"the key in {SECRET_FILE}")
+    finally:
+        os.unlink(tmp_path)
+    return key
+
+
+# An empty or short key would make learner cookies forgeable
+def _check_key(key, source="the secret key"):
+    if not key or len(key) < MIN_KEY_LENGTH:
+        raise ValueError(f"{source} must be at least {MIN_KEY_LENGTH} characters long")
+    return key
+
+
+# On a read-only app directory without BOOK_SECRET_KEY, the app still runs
+# with a key of its own, but every cookie it issued dies with the process
+def _secret_key():
+    try:
+        return stored_secret_key()
+    except OSError as e:
+        logger.warning(
+            "BOOK_SECRET_KEY is not set and %s can't be read or created (%s). Using a key for this "
+            "process only: learners get new ids, and lose their progress, whenever it restarts. "
+            "Set BOOK_SECRET_KEY.",
+            SECRET_FILE, e,
+        )
+        return secrets.token_hex(32)
+
+
+def make_serializer(key):
+    return URLSafeTimedSerializer(_check_key(key), salt=SALT)
+
+
+@st.cache_resource
+def get_serializer():
+    return make_serializer(_secret_key())
+
+
+def new_user_id():
+    return secrets.token_hex(12)
+
+
+def issue_token(user_id):
+    return get_serializer().dumps(check_user_id(user_id))
+
+
+# The user id a token was signed for, or None if it is forged, expired or
+# malformed
+def verify_token(token):
+    try:
+        user_id = get_serializer().loads(token, max_age=MAX_AGE)
+    except BadSignature:
+        return None
+    try:
+        return check_user_id(user_id)
+    except (TypeError, ValueError):
+        return None
+
+
+_SET_COOKIE_SCRIPT = """<script>
+const secure = window.parent.location.protocol === "https:" ? "; Secure" : "";
+window.parent.document.cookie = %s + "=" + %s + "; Max-Age=%d; Path=/; SameSite=Lax" + secure;
+</script>"""
+
+
+def _set_cookie(token):
+    with hidden_container("identity"):
+        components.html(_SET_COOKIE_SCRIPT % (script_json(COOKIE_NAME), script_json(token), MAX_AGE), height=0)
+
+
+# Sets st.session_state.user_id once per session, from a ?learner= link,
+# the learner's cookie or as a new learner, before their progress is loaded
+def identify():
+    if "user_id" in st.session_state:
+        return st.session_state.user_id
+    if os.environ.get("BOOK_IDENTITY", "cookie") == "shared":
+        user_id = DEFAULT_USER
+    else:
+        user_id = None
+        if LINK_PARAM in st.query_params:
+            user_id = verify_token(st.query_params[LINK_PARAM])
+            del st.query_params[LINK_PARAM]
+        user_id = user_id or verify_token(st.context.cookies.get(COOKIE_NAME, "")) or new_user_id()
+        _set_cookie(issue_token(user_id))
+    st.session_state.user_id = user_id
+    return user_id
+
+
+# --- Learner Links ---
+# A link token is a signed user id, like the cookie. Opening the app with
+# ?learner=<token> makes this browser that learner: how progress saved
+# before learners had ids (the "default" learner, progress.json) is picked
+# up again, or a learner moves to another browser.
+#
+#   python identity.py            # link token for the default learner
+#   python identity.py USER_ID    # link token for another learner
+def link_token(user_id=DEFAULT_USER):
+    return make_serializer(stored_secret_key()).dumps(check_user_id(user_id))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Print a ?learner= link that adopts a learner in a browser.")
+    parser.add_argument("user_id", nargs="?", default=DEFAULT_USER, help=f"learner to link (default {DEFAULT_USER!r})")
+    args = parser.parse_args()
+    try:
+        token = link_token(args.user_id)
+    except OSError as e:
+        raise SystemExit(f"Can't read or create {SECRET_FILE} ({e}); set BOOK_SECRET_KEY to the app's key.")
+    except ValueError as e:
+        raise SystemExit(f"{e}; set BOOK_SECRET_KEY to the app's key.")
+    print(f"?{LINK_PARAM}={token}")
+
+
+if __name__ == "__main__":
+    main()
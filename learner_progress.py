@@ -0,0 +1,99 @@
+import os
+
+import streamlit as st
+
+from perf import phase
+from progress_record import ProgressRecord
+from progress_store import DEFAULT_USER, open_store
+from write_behind import WriteBehind
+
+
+# --- Progress Store ---
+# PROGRESS_BACKEND picks where progress lives: "journal" (progress.json plus
+# an append-only journal, the default) or "sqlite" (one row per user in
+# progress.db).
+@st.cache_resource
+def get_progress_store():
+    return open_store()
+
+# Saves are coalesced by a background writer: everything saved within
+# PROGRESS_WRITE_WINDOW seconds (one rerun, by default) is one write.
+@st.cache_resource
+def get_progress_writer():
+    return WriteBehind(
+        get_progress_store(),
+        window=float(os.environ.get("PROGRESS_WRITE_WINDOW", "0.5")),
+        max_queue=int(os.environ.get("PROGRESS_WRITE_QUEUE", "1024")),
+    )
+
+# --- Save Progress ---
+def save_progress():
+    progress = ProgressRecord(
+        xp=st.session_state.get("xp", 0),
+        game_xp=st.session_state.get("game_xp", 0),
+        chapters=st.session_state.get("chapters_done", 0),
+        quizzes=st.session_state.get("quizzes_done", 0),
+        achievements=st.session_state.get("achievements", 0),
+    )
+    user_id = st.session_state.get("user_id", DEFAULT_USER)
+    with phase("save_progress"):
+        scheduled = get_progress_writer().mark_dirty(user_id, progress)
+    if scheduled:
+        st.session_state.progress_writes_this_rerun = st.session_state.get("progress_writes_this_rerun", 0) + 1
+
+# --- Load Progress ---
+def load_progress():
+    data = get_progress_writer().load(st.session_state.get("user_id", DEFAULT_USER))
+    st.session_state.xp = data.xp
+    st.session_state.game_xp = data.game_xp
+    st.session_state.chapters_done = data.chapters
+    st.session_state.quizzes_done = data.quizzes
+    st.session_state.achievements = data.achievements
+    emit(LOADED, data, announce=False)
+    # Catch up on rules added since this progress was saved, without toasts
+    emit(XP, data.xp, announce=False)
+    emit(GAME_XP, data.game_xp, announce=False)
+    emit(CHAPTERS, data.chapters.bit_count(), announce=False)
+
+# --- Progress Events ---
+# Subscribers are called as handler(value, announce). The value is the new
+# total for XP, GAME_XP and CHAPTERS (see achievements.py), the chapter
+# number for COMPLETED and the loaded ProgressRecord for LOADED (see the
+# unlocked chapters in book.py).
+XP, GAME_XP, CHAPTERS = "xp", "game_xp", "chapters"
+COMPLETED, LOADED = "completed", "loaded"
+
+_subscribers = {}
+
+def subscribe(event, handler):
+    _subscribers.setdefault(event, []).append(handler)
+
+def emit(event, value, announce=True):
+    for handler in _subscribers.get(event, ()):
+        handler(value, announce)
+
+def award_xp(amount):
+    st.session_state.xp += amount
+    emit(XP, st.session_state.xp)
+
+def award_game_xp(amount):
+    st.session_state.game_xp += amount
+    emit(GAME_XP, st.session_state.game_xp)
+
+# --- Completion Flags ---
+# Bit n of chapters_done / quizzes_done is chapter n's completion / quiz XP flag
+def complete_chapter(chapter_num):
+    done = st.session_state.chapters_done
+    st.session_state.chapters_done = done | 1 << chapter_num
+    if st.session_state.chapters_done != done:
+        emit(COMPLETED, chapter_num)
+        emit(CHAPTERS, completed_count())
+
+def completed_count():
+    return st.session_state.chapters_done.bit_count()
+
+def is_quiz_done(chapter_num):
+    return (st.session_state.quizzes_done >> chapter_num) & 1 == 1
+
+def mark_quiz_done(chapter_num):
+    st.session_state.quizzes_done |= 1 << chapter_num
@@ -0,0 +1,68 @@
+import bisect
+import os
+
+MAX_LEVEL = 200
+
+
+# --- Level Curve ---
+class LevelCurve:
+    """XP thresholds for every level, precomputed and sorted.
+
+    ``thresholds[i]`` is the XP needed to reach level ``i + 1``, so level
+    lookup is a bisect and the first threshold is always 0. XP past the
+    last threshold stays at the top level.
+    """
+
+    def __init__(self, thresholds):
+        thresholds = [int(xp) for xp in thresholds]
+        if not thresholds or thresholds[0] != 0:
+            raise ValueError("a level curve starts at 0 XP")
+        if any(b <= a for a, b in zip(thresholds, thresholds[1:])):
+            raise ValueError("level thresholds must be strictly increasing")
+        self.thresholds = thresholds
+
+    @property
+    def max_level(self):
+        return len(self.thresholds)
+
+    def level(self, xp):
+        return max(1, bisect.bisect_right(self.thresholds, xp))
+
+    def xp_for(self, level):
+        return self.thresholds[min(level, self.max_level) - 1]
+
+    # Fraction of the way from the current level to the next one
+    def progress(self, xp):
+        level = self.level(xp)
+        if level == self.max_level:
+            return 1.0
+        start, end = self.thresholds[level - 1], self.thresholds[level]
+        return (xp - start) / (end - start)
+
+
+def linear(step, max_level=MAX_LEVEL):
+    return LevelCurve([step * n for n in range(max_level)])
+
+
+def quadratic(step, max_level=MAX_LEVEL):
+    return LevelCurve([step * n * n for n in range(max_level)])
+
+
+def table(thresholds):
+    return LevelCurve(thresholds)
+
+
+# BOOK_LEVEL_CURVE is "linear:50" (the default), "quadratic:25" or
+# "table:0,50,120,200,300"
+def parse_curve(spec):
+    kind, _, arg = spec.partition(":")
+    if kind == "linear":
+        return linear(int(arg or 50))
+    if kind == "quadratic":
+        return quadratic(int(arg or 25))
+    if kind == "table":
+        return table(arg.split(","))
+    raise ValueError(f"unknown level curve: {spec!r}")
+
+
+curve = parse_curve(os.environ.get("BOOK_LEVEL_CURVE", "linear:50"))
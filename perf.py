@@ -0,0 +1,181 @@
+import contextlib
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+
+import streamlit as st
+
+# BOOK_PERF=1 times every rerun. With BOOK_PERF_QUERY=1, ?perf=1 turns it
+# on for one session; off by default, since the panel shows internal
+# counters and any visitor could open it
+PERF_ENABLED = os.environ.get("BOOK_PERF", "") == "1"
+PERF_QUERY = os.environ.get("BOOK_PERF_QUERY", "") == "1"
+METRICS_FILE = os.environ.get("BOOK_PERF_FILE", "perf_metrics.json")
+METRICS_INTERVAL = float(os.environ.get("BOOK_PERF_INTERVAL", "10"))
+MAX_SAMPLES = 1000
+
+_NOOP = contextlib.nullcontext()
+_TIMER_KEY = "_perf_timer"
+
+
+# --- Rerun Timings ---
+class PhaseStats:
+    """Rolling timing samples (in seconds) for every page and phase."""
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.max_samples = max_samples
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def add(self, page_id, phase, seconds):
+        with self._lock:
+            samples = self._samples.get((page_id, phase))
+            if samples is None:
+                samples = self._samples[(page_id, phase)] = deque(maxlen=self.max_samples)
+            samples.append(seconds)
+
+    def summary(self, page_id=None):
+        with self._lock:
+            items = [(key, sorted(samples)) for key, samples in self._samples.items()]
+        pages = {}
+        for (sample_page, phase), samples in items:
+            if page_id is not None and sample_page != page_id:
+                continue
+            pages.setdefault(sample_page, {})[phase] = {
+                "count": len(samples),
+                "p50_ms": _percentile(samples, 50) * 1000,
+                "p95_ms": _percentile(samples, 95) * 1000,
+                "p99_ms": _percentile(samples, 99) * 1000,
+            }
+        return pages
+
+
+def _percentile(sorted_samples, pct):
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+class RerunTimer:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+
+stats = PhaseStats()
+_stats_sources = {}
+_last_dump = 0.0
+_dump_lock = threading.Lock()
+
+
+# Extra counters to show in the panel and the metrics file
+def add_stats_source(name, source):
+    _stats_sources[name] = source
+
+
+def is_enabled():
+    return PERF_ENABLED or (PERF_QUERY and st.query_params.get("perf") == "1")
+
+
+def begin_rerun():
+    if is_enabled():
+        st.session_state[_TIMER_KEY] = RerunTimer()
+    else:
+        st.session_state.pop(_TIMER_KEY, None)
+
+
+# Time a block of the current rerun; a shared no-op when timing is off
+def phase(name):
+    timer = st.session_state.get(_TIMER_KEY)
+    if timer is None:
+        return _NOOP
+    return timer.phase(name)
+
+
+def end_rerun(page_id):
+    timer = st.session_state.get(_TIMER_KEY)
+    if timer is None:
+        return
+    for name, seconds in timer.phases.items():
+        stats.add(page_id, name, seconds)
+    stats.add(page_id, "total", time.perf_counter() - timer.started)
+    _maybe_dump()
+
+
+# Time a fragment-only rerun, which skips begin_rerun()/end_rerun(). Its
+# phases go into a timer of its own, recorded when the fragment ends; the
+# last full rerun's timer was already recorded.
+@contextlib.contextmanager
+def fragment_rerun(page_id):
+    if not is_enabled():
+        yield
+        return
+    outer = st.session_state.get(_TIMER_KEY)
+    timer = st.session_state[_TIMER_KEY] = RerunTimer()
+    try:
+        yield
+    finally:
+        if outer is None:
+            st.session_state.pop(_TIMER_KEY, None)
+        else:
+            st.session_state[_TIMER_KEY] = outer
+        for name, seconds in timer.phases.items():
+            stats.add(page_id, name, seconds)
+        stats.add(page_id, "fragment", time.perf_counter() - timer.started)
+        _maybe_dump()
+
+
+def snapshot():
+    data = {"generated_at": time.time(), "pages": stats.summary()}
+    for name, source in _stats_sources.items():
+        data[name] = source()
+    return data
+
+
+def _maybe_dump():
+    global _last_dump
+    now = time.monotonic()
+    if now - _last_dump < METRICS_INTERVAL or not _dump_lock.acquire(blocking=False):
+        return
+    try:
+        _last_dump = now
+        write_metrics()
+    finally:
+        _dump_lock.release()
+
+
+def write_metrics(path=None):
+    path = path or METRICS_FILE
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(snapshot(), f, indent=2)
+    os.replace(tmp_path, path)
+
+
+# --- Debug Panel ---
+def render_panel(page_id):
+    if not is_enabled():
+        return
+    with st.sidebar.expander("🛠️ Rerun timings"):
+        phases = stats.summary(page_id).get(page_id, {})
+        if not phases:
+            st.caption("No finished reruns on this page yet.")
+        else:
+            rows = ["| phase | n | p50 ms | p95 ms | p99 ms |", "|---|---|---|---|---|"]
+            for name, s in sorted(phases.items()):
+                rows.append(f"| {name} | {s['count']} | {s['p50_ms']:.2f} | {s['p95_ms']:.2f} | {s['p99_ms']:.2f} |")
+            st.markdown("\n".join(rows))
+        for name, source in _stats_sources.items():
+            st.caption(name)
+            st.json(source(), expanded=False)
+        st.caption(f"Metrics file: {METRICS_FILE}")
@@ -0,0 +1,120 @@
+import struct
+from dataclasses import dataclass
+
+# version, xp, game_xp, chapters bitmask, quizzes bitmask, achievements bitmask
+_RECORD = struct.Struct("<BIIIII")
+RECORD_VERSION = 2
+RECORD_SIZE = _RECORD.size
+
+
+# --- Compact Progress Record ---
+@dataclass(slots=True)
+class ProgressRecord:
+    """One learner's progress in a handful of ints.
+
+    Bit ``n`` of ``chapters`` is set once chapter ``n`` is completed and
+    bit ``n`` of ``quizzes`` once the chapter ``n`` quiz has paid out its
+    XP, so completion checks are single bit tests. ``achievements`` holds
+    one bit per unlocked achievement (see achievements.py). ``to_bytes()``
+    packs a record into a fixed 21 bytes.
+    """
+
+    xp: int = 0
+    game_xp: int = 0
+    chapters: int = 0
+    quizzes: int = 0
+    achievements: int = 0
+
+    def is_completed(self, chapter):
+        return (self.chapters >> chapter) & 1 == 1
+
+    def complete(self, chapter):
+        self.chapters |= 1 << chapter
+
+    def is_quiz_done(self, chapter):
+        return (self.quizzes >> chapter) & 1 == 1
+
+    def mark_quiz_done(self, chapter):
+        self.quizzes |= 1 << chapter
+
+    def completed_count(self):
+        return self.chapters.bit_count()
+
+    def completed_chapters(self):
+        return set(_bits(self.chapters))
+
+    def copy(self):
+        return ProgressRecord(self.xp, self.game_xp, self.chapters, self.quizzes, self.achievements)
+
+    # --- Binary (fixed width) ---
+    def to_bytes(self):
+        return _RECORD.pack(
+            RECORD_VERSION, self.xp, self.game_xp, self.chapters, self.quizzes, self.achievements
+        )
+
+    @classmethod
+    def from_bytes(cls, data):
+        record, size = _unpack_from(data, 0)
+        if size != len(data):
+            raise ValueError(f"progress record is {len(data)} bytes, expected {size}")
+        return record
+
+    # --- JSON (progress.json layout) ---
+    def to_dict(self):
+        return {
+            "xp": self.xp,
+            "game_xp": self.game_xp,
+            "completed_chapters": sorted(_bits(self.chapters)),
+            "quizzes_done": sorted(_bits(self.quizzes)),
+            "achievements": sorted(_bits(self.achievements)),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            xp=int(data.get("xp", 0)),
+            game_xp=int(data.get("game_xp", 0)),
+            chapters=to_mask(data.get("completed_chapters", [])),
+            quizzes=to_mask(data.get("quizzes_done", [])),
+            achievements=to_mask(data.get("achievements", [])),
+        )
+
+
+def to_mask(numbers):
+    mask = 0
+    for n in numbers:
+        mask |= 1 << int(n)
+    return mask
+
+
+def _bits(mask):
+    n = 0
+    while mask:
+        if mask & 1:
+            yield n
+        mask >>= 1
+        n += 1
+
+
+# Many records in one bytes blob, e.g. for dashboards over every learner
+def pack_records(records):
+    return b"".join(record.to_bytes() for record in records)
+
+
+def unpack_records(data):
+    records = []
+    offset = 0
+    while offset < len(data):
+        record, size = _unpack_from(data, offset)
+        records.append(record)
+        offset += size
+    return records
+
+
+# One record at `offset`; returns (record, size)
+def _unpack_from(data, offset):
+    version = data[offset]
+    if version != RECORD_VERSION:
+        raise ValueError(f"unsupported progress record version: {version}")
+    _, *fields = _RECORD.unpack_from(data, offset)
+    return ProgressRecord(*fields), _RECORD.size
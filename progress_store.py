@@ -0,0 +1,360 @@
+import json
+import os
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from progress_record import ProgressRecord
+
+# Used until learners have their own identity
+DEFAULT_USER = "default"
+
+_USER_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def check_user_id(user_id):
+    if not _USER_ID_RE.match(user_id):
+        raise ValueError(f"invalid user id: {user_id!r}")
+    return user_id
+
+
+# --- Journaled Progress ---
+class ProgressJournal:
+    """Progress saved as a snapshot file plus an append-only change log.
+
+    Every save appends only what changed since the last save (one short
+    JSON line) instead of rewriting the whole snapshot. Once the log grows
+    past ``compact_every`` entries, a background thread folds it back into
+    the snapshot. Entries hold absolute XP values and completion bitmasks,
+    so replaying a log on top of a snapshot it was already folded into
+    gives the same state.
+    """
+
+    def __init__(self, snapshot_path="progress.json", log_path=None, compact_every=64):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path or os.path.splitext(snapshot_path)[0] + ".journal"
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        self._state = None
+        self._log_entries = 0
+        self._compacting = False
+
+    # Compacting or in the middle of a load or save
+    def busy(self):
+        return self._compacting or self._lock.locked()
+
+    # Rebuild state from the snapshot plus the log tail
+    def load(self):
+        with self._lock:
+            if self._state is None:
+                self._state = self._replay()
+            return self._state.copy()
+
+    def _replay(self):
+        state = ProgressRecord()
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r") as f:
+                try:
+                    state = ProgressRecord.from_dict(json.load(f))
+                except ValueError:
+                    pass
+
+        self._log_entries = 0
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "rb") as f:
+                data = f.read()
+            # A crash mid-append leaves a torn last entry. Cut it off, or the
+            # next append would be glued onto it and lost as well.
+            complete = data[:data.rfind(b"\n") + 1]
+            if len(complete) != len(data):
+                with open(self.log_path, "r+b") as f:
+                    f.truncate(len(complete))
+            for line in complete.splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                _apply(state, entry)
+                self._log_entries += 1
+        return state
+
+    # Append only the fields that changed since the last save
+    def save(self, record):
+        new_state = record.copy()
+        with self._lock:
+            if self._state is None:
+                self._state = self._replay()
+
+            entry = _diff(self._state, new_state)
+            if not entry:
+                return False
+
+            try:
+                with open(self.log_path, "a") as f:
+                    f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            except BaseException:
+                # The append may be half written; replay (and repair) first next time
+                self._state = None
+                raise
+            _apply(self._state, entry)
+            self._log_entries += 1
+
+            if self._log_entries >= self.compact_every and not self._compacting:
+                self._compacting = True
+                threading.Thread(target=self.compact, daemon=True).start()
+        return True
+
+    # Fold the log into a fresh snapshot and drop the folded entries
+    def compact(self):
+        try:
+            with self._lock:
+                if self._state is None:
+                    self._state = self._replay()
+                state = self._state.copy()
+                folded = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(state.to_dict(), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+
+            # The tail goes to a temp file first, so a crash leaves either
+            # the old log or the new one, never a truncated one
+            with self._lock:
+                tail = b""
+                if os.path.exists(self.log_path):
+                    with open(self.log_path, "rb") as f:
+                        f.seek(folded)
+                        tail = f.read()
+                tmp_path = self.log_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(tail)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.log_path)
+                self._log_entries = tail.count(b"\n")
+        finally:
+            self._compacting = False
+
+
+_JOURNAL_FIELDS = ("xp", "game_xp", "chapters", "quizzes", "achievements")
+
+
+def _diff(old, new):
+    return {field: getattr(new, field) for field in _JOURNAL_FIELDS if getattr(new, field) != getattr(old, field)}
+
+
+def _apply(state, entry):
+    for field in _JOURNAL_FIELDS:
+        if field in entry:
+            setattr(state, field, int(entry[field]))
+
+
+# --- Pluggable Stores ---
+class ProgressStore:
+    """Per-user progress storage behind save_progress()/load_progress().
+
+    Subclasses implement ``_read`` and ``_write``. Saves that change
+    nothing since the last save for that user are skipped. The last saved
+    record is remembered for the ``max_users`` most recently seen users
+    only; a user who was forgotten just gets one more write.
+    """
+
+    def __init__(self, max_users=1024):
+        self.max_users = max_users
+        self._last_saved = OrderedDict()
+        self._last_saved_lock = threading.Lock()
+
+    def load(self, user_id=DEFAULT_USER):
+        record = self._read(check_user_id(user_id))
+        with self._last_saved_lock:
+            self._remember(user_id, record)
+        return record
+
+    # Only a write that went through counts as saved, so a failed one is
+    # written again by the next save
+    def save(self, user_id, record):
+        with self._last_saved_lock:
+            if self._last_saved.get(user_id) == record:
+                return False
+        self._write(check_user_id(user_id), record)
+        with self._last_saved_lock:
+            self._remember(user_id, record)
+        return True
+
+    # Whether `record` is what was last loaded or saved for this user
+    def is_saved(self, user_id, record):
+        with self._last_saved_lock:
+            if user_id not in self._last_saved:
+                return False
+            self._last_saved.move_to_end(user_id)
+            return self._last_saved[user_id] == record
+
+    def _remember(self, user_id, record):
+        self._last_saved[user_id] = record.copy()
+        self._last_saved.move_to_end(user_id)
+        while len(self._last_saved) > self.max_users:
+            self._last_saved.popitem(last=False)
+
+    def _read(self, user_id):
+        raise NotImplementedError
+
+    def _write(self, user_id, record):
+        raise NotImplementedError
+
+
+class JournalStore(ProgressStore):
+    """One ProgressJournal per user.
+
+    The default user keeps ``progress.json``; other users get
+    ``progress.<user_id>.json`` next to it. A journal reads its files once
+    and then trusts its own state, so only one process may use them; to
+    run several app processes, use SqliteStore.
+
+    Open journals are kept for the ``max_users`` most recently seen users.
+    Older ones are dropped (and replayed from disk if that user comes
+    back), except while they are compacting or saving, so there is never
+    a second journal writing the same files.
+    """
+
+    def __init__(self, snapshot_path="progress.json", compact_every=64, max_users=1024):
+        super().__init__(max_users)
+        self.snapshot_path = snapshot_path
+        self.compact_every = compact_every
+        self._journals = OrderedDict()
+        self._journals_lock = threading.Lock()
+
+    def journal(self, user_id):
+        with self._journals_lock:
+            journal = self._journals.get(user_id)
+            if journal is None:
+                path = self.snapshot_path
+                if user_id != DEFAULT_USER:
+                    stem, ext = os.path.splitext(path)
+                    path = f"{stem}.{user_id}{ext}"
+                journal = self._journals[user_id] = ProgressJournal(path, compact_every=self.compact_every)
+                self._evict_journals(keep=user_id)
+            self._journals.move_to_end(user_id)
+            return journal
+
+    # Called with _journals_lock held
+    def _evict_journals(self, keep):
+        excess = len(self._journals) - self.max_users
+        if excess <= 0:
+            return
+        idle = [
+            user_id for user_id, journal in self._journals.items()
+            if user_id != keep and not journal.busy()
+        ]
+        for user_id in idle[:excess]:
+            del self._journals[user_id]
+
+    def _read(self, user_id):
+        return self.journal(user_id).load()
+
+    def _write(self, user_id, record):
+        self.journal(user_id).save(record)
+
+
+# Statements are module constants so every pooled connection's statement
+# cache compiles each of them once and reuses it.
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS learner_progress (
+        user_id TEXT PRIMARY KEY,
+        record BLOB NOT NULL,
+        updated_at REAL NOT NULL
+    ) WITHOUT ROWID
+"""
+_SELECT_SQL = "SELECT record FROM learner_progress WHERE user_id = ?"
+_UPSERT_SQL = """
+    INSERT INTO learner_progress (user_id, record, updated_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT (user_id) DO UPDATE SET
+        record = excluded.record,
+        updated_at = excluded.updated_at
+"""
+
+
+class SqliteStore(ProgressStore):
+    """Progress rows keyed by user in a SQLite database in WAL mode.
+
+    WAL lets readers run alongside the single writer, and each save only
+    touches its own user's row. Rows hold the fixed-width binary form of
+    a ProgressRecord. Connections come from a small pool so concurrent
+    sessions don't open a connection per call.
+    """
+
+    def __init__(self, path="progress.db", pool_size=4, busy_timeout=5.0, max_users=1024):
+        super().__init__(max_users)
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        with self._connection() as conn:
+            conn.execute(_CREATE_TABLE_SQL)
+
+    def _connect(self):
+        # Imported here: only the SQLite backend needs it
+        import sqlite3
+
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            isolation_level=None,  # autocommit; each upsert is its own transaction
+            check_same_thread=False,
+            cached_statements=16,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self):
+        return _PooledConnection(self._pool)
+
+    def _read(self, user_id):
+        with self._connection() as conn:
+            row = conn.execute(_SELECT_SQL, (user_id,)).fetchone()
+        if row is None:
+            return ProgressRecord()
+        return ProgressRecord.from_bytes(row[0])
+
+    def _write(self, user_id, record):
+        with self._connection() as conn:
+            conn.execute(_UPSERT_SQL, (user_id, record.to_bytes(), time.time()))
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+
+class _PooledConnection:
+    def __init__(self, pool):
+        self._pool = pool
+
+    def __enter__(self):
+        self._conn = self._pool.get()
+        return self._conn
+
+    def __exit__(self, *exc):
+        self._pool.put(self._conn)
+        return False
+
+
+# Pick the backend from PROGRESS_BACKEND ("journal" or "sqlite")
+def open_store(backend=None):
+    backend = backend or os.environ.get("PROGRESS_BACKEND", "journal")
+    max_users = int(os.environ.get("PROGRESS_CACHE_USERS", "1024"))
+    if backend == "sqlite":
+        return SqliteStore(
+            os.environ.get("PROGRESS_DB", "progress.db"),
+            pool_size=int(os.environ.get("PROGRESS_DB_POOL", "4")),
+            max_users=max_users,
+        )
+    if backend == "journal":
+        return JournalStore(os.environ.get("PROGRESS_FILE", "progress.json"), max_users=max_users)
+    raise ValueError(f"unknown progress backend: {backend!r}")
@@ -0,0 +1,142 @@
+import functools
+from collections import namedtuple
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from learner_progress import award_xp, complete_chapter, is_quiz_done, mark_quiz_done, save_progress
+from perf import fragment_rerun
+
+
+def _progress_snapshot():
+    state = st.session_state
+    return (
+        state.get("xp", 0),
+        state.get("game_xp", 0),
+        state.get("chapters_done", 0),
+        state.get("quizzes_done", 0),
+    )
+
+
+def _is_fragment_rerun():
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
+
+
+# --- Quiz Fragment ---
+# Runs a quiz page as a fragment, so picking an answer reruns only the quiz
+# and not the background, sidebar, theme and tracker. If the answer changed
+# XP or completion, the whole app reruns once so the sidebar catches up.
+def quiz_fragment(page_id, render):
+    @functools.wraps(render)
+    def run_quiz():
+        before = _progress_snapshot()
+        if _is_fragment_rerun():
+            with fragment_rerun(page_id):
+                render()
+        else:
+            render()
+        if _is_fragment_rerun() and _progress_snapshot() != before:
+            st.rerun(scope="app")
+
+    return st.fragment(run_quiz)
+
+
+# --- Quiz Engine ---
+# A quiz is data in its chapter unit (QUIZ = {...}): title, optional intro,
+# pass_score, xp and questions with question, options, answer, explanation
+# and an optional "wrong" message. compile_quiz() turns it into a table of
+# (widget key, correct answer) pairs once, when the unit is loaded.
+CompiledQuiz = namedtuple("CompiledQuiz", ["chapter", "spec", "answer_key"])
+
+_quiz_pages = {}
+
+
+def compile_quiz(chapter, spec):
+    questions = spec["questions"]
+    for number, question in enumerate(questions, start=1):
+        if question["answer"] not in question["options"]:
+            raise ValueError(f"chapter {chapter} quiz question {number}: answer is not one of the options")
+    if not 0 < spec["pass_score"] <= len(questions):
+        raise ValueError(f"chapter {chapter} quiz: pass_score must be between 1 and {len(questions)}")
+    answer_key = tuple(
+        (f"c{chapter}_q{number}", question["answer"])
+        for number, question in enumerate(questions, start=1)
+    )
+    return CompiledQuiz(chapter, spec, answer_key)
+
+
+# One pass over the answers; None until every question has an answer
+def grade(compiled, answers):
+    score = 0
+    for key, correct in compiled.answer_key:
+        choice = answers.get(key)
+        if choice is None:
+            return None
+        score += choice == correct
+    return score
+
+
+# Pay the quiz XP and complete the chapter, once per learner
+def award_quiz(chapter, xp):
+    if is_quiz_done(chapter):
+        return False
+    award_xp(xp)
+    mark_quiz_done(chapter)
+    complete_chapter(chapter)
+    save_progress()
+    return True
+
+
+def render_quiz(compiled):
+    spec = compiled.spec
+    st.header(spec["title"])
+    if spec.get("intro"):
+        st.write(spec["intro"])
+
+    for question, (key, correct) in zip(spec["questions"], compiled.answer_key):
+        choice = st.radio(question["question"], question["options"], index=None, key=key)
+        if choice is not None:
+            if choice == correct:
+                st.success(question["explanation"])
+            else:
+                st.error(question.get("wrong", "❌ Try again!"))
+        st.markdown("---")
+
+    score = grade(compiled, st.session_state)
+    if score is None:
+        return
+
+    total = len(compiled.answer_key)
+    st.session_state.score = score
+    st.session_state.total_questions = total
+
+    st.subheader(f"📊 Score: {score}/{total}")
+    if score < spec["pass_score"]:
+        st.warning(f"💡 Keep practicing, you need at least {spec['pass_score']} correct to earn XP.")
+        return
+
+    if score == total:
+        st.success("🌟 Excellent! You’re ready for the next chapter.")
+    else:
+        st.info("👍 Good job! Review once more for full confidence.")
+
+    if award_quiz(compiled.chapter, spec["xp"]):
+        st.balloons()
+    st.success(f"🏆 You earned +{spec['xp']} XP!")
+
+
+# The quiz page for a chapter, compiled and wrapped in a fragment once;
+# `page_id` is the page its fragment reruns are timed under
+def quiz_page(page_id, chapter, spec):
+    page = _quiz_pages.get(chapter)
+    if page is None:
+        compiled = compile_quiz(chapter, spec)
+
+        def render():
+            render_quiz(compiled)
+
+        render.__name__ = render.__qualname__ = f"chapter_{chapter}_quiz"
+        page = quiz_fragment(page_id, render)
+        _quiz_pages[chapter] = page
+    return page
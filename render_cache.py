@@ -0,0 +1,67 @@
+import hashlib
+import json
+import os
+
+from content_cache import cached
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CHAPTERS_DIR = os.path.join(APP_DIR, "chapters")
+CACHE_DIR = os.environ.get("RENDER_CACHE_DIR", os.path.join(APP_DIR, ".render_cache"))
+
+
+# --- Compiled Units ---
+# What a compiler derives from one chapter unit's source is kept in two
+# layers: the process-wide content cache, and a JSON file per unit named
+# after a hash of the source (and the compiler's version). A new process
+# reads those files instead of parsing every chapter again, and editing a
+# chapter only changes its own hash, so only its entry is rebuilt. Files
+# left behind by older sources are removed when the new one is written.
+def source_hash(unit, version):
+    digest = hashlib.sha256(f"{version}\0".encode())
+    with open(os.path.join(CHAPTERS_DIR, f"{unit}.py"), "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def _cache_path(name, unit, digest):
+    return os.path.join(CACHE_DIR, f"{name}-{unit}.{digest}.json")
+
+
+def _remove_stale(name, unit, keep):
+    prefix = f"{name}-{unit}."
+    for filename in os.listdir(CACHE_DIR):
+        if filename.startswith(prefix) and filename != keep:
+            try:
+                os.remove(os.path.join(CACHE_DIR, filename))
+            except FileNotFoundError:
+                pass
+
+
+def _load_or_compile(name, unit, digest, compile_source):
+    path = _cache_path(name, unit, digest)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        pass
+
+    with open(os.path.join(CHAPTERS_DIR, f"{unit}.py"), encoding="utf-8") as f:
+        value = compile_source(f.read())
+    # A read-only checkout still works, it just compiles every time
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        _remove_stale(name, unit, os.path.basename(path))
+    except OSError:
+        pass
+    return value
+
+
+# `compile_source(source)` must return JSON-serializable data; bump
+# `version` whenever its output changes for the same source
+def compiled(name, unit, compile_source, version=1):
+    digest = source_hash(unit, version)
+    return cached(("compiled", name, unit, digest), lambda: _load_or_compile(name, unit, digest, compile_source))
@@ -0,0 +1,239 @@
+import ast
+import bisect
+import heapq
+import math
+import re
+from collections import Counter
+
+import streamlit as st
+
+from book import PAGES, QUIZ
+from render_cache import compiled
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Title words count this many times over
+TITLE_WEIGHT = 3
+# Fuzzy matching: candidates sharing fewer trigrams than this are dropped
+# before any edit distance is computed, and at most SHORTLIST survive
+MIN_TRIGRAM_SIMILARITY = 0.3
+SHORTLIST = 20
+
+# "app.listen(3000)" -> "app.listen", "app", "listen", "3000"
+_WORD = re.compile(r"[a-z0-9]+(?:[._][a-z0-9]+)*")
+_PART = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    tokens = []
+    for word in _WORD.findall(text.lower()):
+        tokens.append(word)
+        if "." in word or "_" in word:
+            tokens.extend(_PART.findall(word))
+    return tokens
+
+
+# --- Page Text ---
+# Read straight from the chapter sources with ast, so building the index
+# never imports (or runs) a content unit: every string in a page function
+# (prose, code samples, task lists) and every string in the QUIZ data.
+# Each unit's text is compiled once and kept on disk by render_cache, so
+# only edited chapters are parsed again in a new process.
+TEXT_VERSION = 1
+
+
+def _strings(node):
+    for child in ast.walk(node):
+        if isinstance(child, ast.Constant) and isinstance(child.value, str):
+            yield child.value
+
+
+def _quiz_strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _quiz_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _quiz_strings(item)
+
+
+# Text of every page function in a unit by name, plus its QUIZ under "quiz"
+def unit_texts(source):
+    texts = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.FunctionDef):
+            texts[node.name] = "\n".join(_strings(node))
+        elif isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "QUIZ" for t in node.targets):
+            texts[QUIZ] = "\n".join(_quiz_strings(ast.literal_eval(node.value)))
+    return texts
+
+
+def page_texts():
+    texts = {}
+    for p in PAGES.values():
+        if p.unit is None:
+            continue
+        text = compiled("search-text", p.unit, unit_texts, TEXT_VERSION).get(p.kind)
+        if text is not None:
+            texts[p.id] = text
+    return texts
+
+
+# --- Inverted Index ---
+class SearchIndex:
+    """BM25 inverted index over every page of the book.
+
+    ``postings`` maps a token to ``(page index, term frequency)`` pairs and
+    each token's IDF is computed once, so a query only touches the
+    postings of its own tokens.
+    """
+
+    def __init__(self, texts):
+        self.page_ids = list(texts)
+        self.texts = [texts[page_id] for page_id in self.page_ids]
+        self._docs = {page_id: doc for doc, page_id in enumerate(self.page_ids)}
+        self.postings = {}
+        lengths = []
+        for doc, page_id in enumerate(self.page_ids):
+            tokens = tokenize(self.texts[doc]) + tokenize(PAGES[page_id].label) * TITLE_WEIGHT
+            lengths.append(len(tokens))
+            for token, tf in Counter(tokens).items():
+                self.postings.setdefault(token, []).append((doc, tf))
+
+        count = len(self.page_ids)
+        avg_length = sum(lengths) / count if count else 0.0
+        self._norms = [K1 * (1 - B + B * length / avg_length) for length in lengths]
+        self._idf = {
+            token: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for token, postings in self.postings.items()
+        }
+        # Plain words only; numbers and dotted names aren't worth correcting
+        self.vocabulary = TrigramIndex({
+            token: len(postings)
+            for token, postings in self.postings.items()
+            if token.isalpha() and len(token) >= 3
+        })
+
+    # Best `limit` pages as (page id, score), highest first
+    def search(self, query, limit=10):
+        scores = {}
+        for token in set(tokenize(query)):
+            idf = self._idf.get(token)
+            if idf is None:
+                continue
+            for doc, tf in self.postings[token]:
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (K1 + 1) / (tf + self._norms[doc])
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(self.page_ids[doc], score) for doc, score in best]
+
+    # The query with unknown words replaced by their closest known word,
+    # or None when every word is known or nothing is close enough
+    def correct(self, query):
+        words = _WORD.findall(query.lower())
+        corrected = []
+        for word in words:
+            if word not in self._idf and word.isalpha():
+                matches = self.vocabulary.fuzzy(word, limit=1)
+                if matches:
+                    word = matches[0]
+            corrected.append(word)
+        return " ".join(corrected) if corrected != words else None
+
+    # Completions for the word being typed (the last one), falling back
+    # to close matches when nothing starts with it
+    def suggest(self, query, limit=5):
+        words = _WORD.findall(query.lower())
+        if not words or not words[-1].isalpha():
+            return []
+        last = words[-1]
+        options = [word for word in self.vocabulary.complete(last, limit + 1) if word != last]
+        if not options and last not in self._idf:
+            options = self.vocabulary.fuzzy(last, limit)
+        head = " ".join(words[:-1])
+        return [f"{head} {word}".strip() for word in options[:limit]]
+
+    # A line of the page around the first query word it contains (whole
+    # words like "app.listen" are tried before their parts)
+    def snippet(self, page_id, query, width=90):
+        text = self.texts[self._docs[page_id]]
+        lowered = text.lower()
+        for word in tokenize(query):
+            hit = lowered.find(word)
+            if hit >= 0:
+                start = text.rfind(" ", 0, max(0, hit - width // 3)) + 1
+                return " ".join(text[start:start + width].split())
+        return ""
+
+
+# --- Fuzzy Matching ---
+def trigrams(word):
+    padded = f"${word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# Levenshtein distance, or limit + 1 as soon as it must exceed `limit`
+def edit_distance(a, b, limit):
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class TrigramIndex:
+    """Character trigram index over the search vocabulary.
+
+    A misspelled word first collects candidates through the postings of
+    its own trigrams; only the best ``SHORTLIST`` of those, by trigram
+    overlap, get an edit distance. Words are also kept sorted, so prefix
+    completion is two bisects.
+    """
+
+    def __init__(self, word_counts):
+        self.words = sorted(word_counts)
+        self.counts = word_counts
+        self._grams = [trigrams(word) for word in self.words]
+        self.postings = {}
+        for index, grams in enumerate(self._grams):
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(index)
+
+    # Closest known words, best first: fewest edits, then most common
+    def fuzzy(self, word, limit=3):
+        grams = trigrams(word)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+        # Jaccard similarity of the trigram sets
+        similar = ((count / len(grams | self._grams[index]), index) for index, count in shared.items())
+        shortlist = heapq.nlargest(
+            SHORTLIST, (item for item in similar if item[0] >= MIN_TRIGRAM_SIMILARITY)
+        )
+        max_edits = 1 if len(word) <= 5 else 2
+        matches = []
+        for _, index in shortlist:
+            candidate = self.words[index]
+            distance = edit_distance(word, candidate, max_edits)
+            if distance <= max_edits:
+                matches.append((distance, -self.counts[candidate], candidate))
+        return [candidate for _, _, candidate in sorted(matches)[:limit]]
+
+    # Known words starting with `prefix`, most common first
+    def complete(self, prefix, limit=5):
+        start = bisect.bisect_left(self.words, prefix)
+        end = bisect.bisect_left(self.words, prefix + "\uffff")
+        return heapq.nlargest(limit, self.words[start:end], key=self.counts.__getitem__)
+
+
+@st.cache_resource(show_spinner=False)
+def get_search_index():
+    return SearchIndex(page_texts())
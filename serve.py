@@ -0,0 +1,26 @@
+# Production entry point: warm every cache, then serve the app
+#
+#   python serve.py                        # like `streamlit run app.py`
+#   python serve.py --server.port 8080     # takes any `streamlit run` option
+#
+# The warm-up (warmup.py) runs in this process before Streamlit starts
+# listening, so the health check (/_stcore/health) only answers once it is
+# done, and the caches it filled are the ones every session then uses.
+
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    import warmup
+    from streamlit.web import cli
+
+    warmup.print_report(warmup.warm_up())
+    sys.stdout.flush()
+    cli.main(["run", os.path.join(APP_DIR, "app.py"), *sys.argv[1:]], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    main()
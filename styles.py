@@ -0,0 +1,191 @@
+import json
+import re
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from assets import BACKGROUND_URL, variant_urls
+from content_cache import cached
+
+# Set background image with CSS
+BACKGROUND_CSS = """
+<style>
+[data-testid="stAppViewContainer"] {
+    background-size: cover;
+    background-repeat: no-repeat;
+    background-attachment: fixed;
+    color: white;
+}
+[data-testid="stHeader"] {
+    background: rgba(0,0,0,0);
+}
+.block-container {
+    background: rgba(0,0,0,0.7);
+    padding: 80px;
+    border-radius: 15px;
+    max-width: 1000px;            /* ✅ Limit width so it looks like a "page" */
+    box-shadow: 0px 0px 25px rgba(0,0,0,0.8); /* ✅ Nice shadow */
+}
+h1, h2, h3, h4, h5, h6 {
+    color: Yellow !important;       /* ✅ All headings red */
+    font-size: 36px !important;  /* ✅ Bigger headings */
+    font-weight: bold !important;
+}
+
+/* Paragraph text */
+p, li, span, label {
+    font-size: 22px !important;
+}
+</style>
+"""
+
+# Dark theme overrides
+DARK_THEME_CSS = """
+<style>
+body {
+    background-color: #121212;
+    color: #ffffff;
+}
+.stButton button {
+    background-color: #333333;
+    color: white;
+}
+</style>
+"""
+
+
+# Chapter title banner (book.chapter_divider)
+DIVIDER_CSS = """
+<style>
+.chapter-divider {
+    background: rgba(0, 0, 128, 0.5);
+    padding: 90px;
+    border-radius: 25px;
+    text-align: center;
+    margin-bottom: 40px;
+    box-shadow: 0px 6px 20px rgba(0,0,0,0.6);
+}
+.chapter-divider h1 {
+    color: #FFD700;
+    font-size: 70px;
+    font-family: Georgia, serif;
+}
+.chapter-divider h3 {
+    color: white;
+    font-size: 28px;
+    font-family: Trebuchet MS, sans-serif;
+    opacity: 0.95;
+}
+</style>
+"""
+
+# Overrides per theme; the light theme is the base stylesheet as is
+THEMES = {"light": "", "dark": DARK_THEME_CSS}
+
+# Sidebar containers whose key starts with this are hidden (they hold
+# zero-height components that only run a script, see hidden_container())
+HIDDEN_KEY_PREFIX = "book_hidden_"
+
+
+# Drop comments and the whitespace the browser doesn't need
+def minify_css(css):
+    css = re.sub(r"</?style>", "", css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+# Background image rules: the local variants from assets.py, the widest one
+# by default and narrower ones for narrower screens, WebP where supported.
+# Falls back to the remote photo until `python assets.py` has built them.
+_BACKGROUND_TARGET = '[data-testid="stAppViewContainer"]'
+
+
+def background_image_css():
+    webp, jpeg = variant_urls("background", "webp"), variant_urls("background", "jpeg")
+    if not jpeg:
+        return f'{_BACKGROUND_TARGET} {{ background-image: url("{BACKGROUND_URL}"); }}'
+
+    def rule(width):
+        image = f'url("{jpeg[width]}")'
+        if width in webp:
+            image_set = f'image-set(url("{webp[width]}") type("image/webp"), {image} type("image/jpeg"))'
+            return f"{_BACKGROUND_TARGET} {{ background-image: {image}; background-image: {image_set}; }}"
+        return f"{_BACKGROUND_TARGET} {{ background-image: {image}; }}"
+
+    widths = sorted(jpeg, reverse=True)
+    rules = [rule(widths[0])]
+    rules += [f"@media (max-width: {width}px) {{ {rule(width)} }}" for width in widths[1:]]
+    return "\n".join(rules)
+
+
+# --- Themes ---
+# The theme radio sits in a container keyed theme_key(theme), which
+# Streamlit renders as the class st-key-book_theme_<theme>. Each theme's
+# rules only apply while that class is on the page, so every theme lives in
+# the one stylesheet and switching themes sends no CSS at all.
+def theme_key(theme):
+    return f"book_theme_{theme}"
+
+
+def _scope_selector(selector, theme):
+    marker = f":has(.st-key-{theme_key(theme)})"
+    if selector == "body" or selector.startswith("body "):
+        return f"body{marker}{selector[4:]}"
+    return f"body{marker} {selector}"
+
+
+# Flat rule lists only (no @media blocks), which is all the themes use
+def scope_css(css, theme):
+    def scope_rule(match):
+        selectors = ",".join(_scope_selector(s, theme) for s in match.group(1).split(","))
+        return f"{selectors}{{{match.group(2)}}}"
+
+    return re.sub(r"([^{}]+)\{([^{}]*)\}", scope_rule, minify_css(css))
+
+
+# --- Stylesheet ---
+def _stylesheet():
+    hidden = f'[class*="st-key-{HIDDEN_KEY_PREFIX}"] {{ display: none; }}'
+    base = BACKGROUND_CSS + background_image_css() + DIVIDER_CSS + hidden
+    themes = [scope_css(css, theme) for theme, css in THEMES.items() if css]
+    return "".join([minify_css(base)] + themes)
+
+
+def stylesheet():
+    return cached("css:stylesheet", _stylesheet)
+
+
+# The page's <head> outlives reruns and page switches, so the stylesheet is
+# sent once per session: a hidden component copies it into the parent
+# document (replacing an older copy after a reconnect) and later reruns
+# skip it. Components share the app's origin, which makes this possible.
+_INSTALL_SCRIPT = """<script>
+const doc = window.parent.document;
+let style = doc.getElementById("book-stylesheet");
+if (!style) {
+    style = doc.createElement("style");
+    style.id = "book-stylesheet";
+    doc.head.appendChild(style);
+}
+style.textContent = %s;
+</script>"""
+
+
+# A sidebar container the stylesheet hides, for script-only components
+def hidden_container(name):
+    return st.sidebar.container(key=HIDDEN_KEY_PREFIX + name)
+
+
+# JSON for a <script> block (no "</script>" can end it early)
+def script_json(value):
+    return json.dumps(value).replace("</", "<\\/")
+
+
+def inject_stylesheet():
+    if st.session_state.get("stylesheet_injected"):
+        return
+    with hidden_container("stylesheet"):
+        components.html(_INSTALL_SCRIPT % script_json(stylesheet()), height=0)
+    st.session_state.stylesheet_injected = True
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The app's modules live at the repository root, not in a package; put it
+# on the path so a bare `pytest`, from any directory, can import them
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,26 @@
+import pytest
+
+from book import PREREQUISITES, _check_prerequisites
+
+
+def test_book_prerequisites_are_a_dag():
+    _check_prerequisites(PREREQUISITES)
+
+
+def test_diamond_and_repeated_prerequisites_are_accepted():
+    _check_prerequisites({1: (), 2: (1,), 3: (1, 1), 4: (2, 3)})
+
+
+def test_cycle_is_rejected():
+    with pytest.raises(ValueError, match=r"cycle through \[2, 3, 4\]"):
+        _check_prerequisites({1: (), 2: (1, 4), 3: (2,), 4: (3,)})
+
+
+def test_chapter_requiring_itself_is_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        _check_prerequisites({1: (1,)})
+
+
+def test_unknown_prerequisite_is_rejected():
+    with pytest.raises(ValueError, match=r"chapter 2 requires unknown chapters \[7\]"):
+        _check_prerequisites({1: (), 2: (1, 7)})
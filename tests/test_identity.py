@@ -0,0 +1,63 @@
+import pytest
+from itsdangerous import URLSafeTimedSerializer
+
+import identity
+
+KEY = "k" * 64
+
+
+@pytest.fixture
+def serializer(monkeypatch):
+    serializer = identity.make_serializer(KEY)
+    monkeypatch.setattr(identity, "get_serializer", lambda: serializer)
+    return serializer
+
+
+def test_verify_token_accepts_its_own_tokens(serializer):
+    assert identity.verify_token(identity.issue_token("learner")) == "learner"
+
+
+def test_verify_token_rejects_a_token_signed_with_another_key(serializer):
+    token = identity.make_serializer("x" * 64).dumps("learner")
+    assert identity.verify_token(token) is None
+
+
+def test_verify_token_rejects_a_token_signed_with_an_empty_key(serializer):
+    token = URLSafeTimedSerializer("", salt=identity.SALT).dumps("learner")
+    assert identity.verify_token(token) is None
+
+
+def test_verify_token_rejects_garbage_and_invalid_ids(serializer):
+    assert identity.verify_token("") is None
+    assert identity.verify_token("not-a-token") is None
+    assert identity.verify_token(serializer.dumps("../progress")) is None
+
+
+@pytest.mark.parametrize("key", [None, "", "short"])
+def test_no_serializer_from_an_empty_or_short_key(key):
+    with pytest.raises(ValueError):
+        identity.make_serializer(key)
+
+
+def test_secret_file_is_created_once_and_reused(tmp_path, monkeypatch):
+    monkeypatch.delenv("BOOK_SECRET_KEY", raising=False)
+    monkeypatch.setattr(identity, "SECRET_FILE", str(tmp_path / ".book_secret"))
+    key = identity.stored_secret_key()
+    assert len(key) >= identity.MIN_KEY_LENGTH
+    assert identity.stored_secret_key() == key
+    assert [p.name for p in tmp_path.iterdir()] == [".book_secret"]
+
+
+@pytest.mark.parametrize("contents", ["", "short\n"])
+def test_empty_or_short_secret_file_is_refused(tmp_path, monkeypatch, contents):
+    monkeypatch.delenv("BOOK_SECRET_KEY", raising=False)
+    monkeypatch.setattr(identity, "SECRET_FILE", str(tmp_path / ".book_secret"))
+    (tmp_path / ".book_secret").write_text(contents)
+    with pytest.raises(ValueError):
+        identity.stored_secret_key()
+
+
+def test_short_book_secret_key_is_refused(monkeypatch):
+    monkeypatch.setenv("BOOK_SECRET_KEY", "short")
+    with pytest.raises(ValueError):
+        identity.stored_secret_key()
@@ -0,0 +1,53 @@
+import pytest
+
+from book import UNLOCK_LEVELS, unlock_level
+from levels import LevelCurve, parse_curve
+
+
+def test_level_is_the_last_threshold_reached():
+    curve = LevelCurve([0, 50, 120, 200])
+    assert [curve.level(xp) for xp in (0, 49, 50, 119, 120, 200, 10000)] == [1, 1, 2, 2, 3, 4, 4]
+    assert curve.level(-5) == 1
+
+
+def test_xp_for_is_the_threshold_of_that_level():
+    curve = LevelCurve([0, 50, 120, 200])
+    assert [curve.xp_for(level) for level in (1, 2, 3, 4)] == [0, 50, 120, 200]
+    assert curve.xp_for(9) == 200
+    assert all(curve.level(curve.xp_for(level)) == level for level in range(1, curve.max_level + 1))
+
+
+def test_progress_within_a_level():
+    curve = LevelCurve([0, 50, 150])
+    assert curve.progress(0) == 0.0
+    assert curve.progress(100) == 0.5
+    assert curve.progress(150) == 1.0
+    assert curve.progress(1000) == 1.0
+
+
+def test_parsed_curves():
+    assert parse_curve("linear:50").thresholds[:4] == [0, 50, 100, 150]
+    assert parse_curve("quadratic:25").thresholds[:4] == [0, 25, 100, 225]
+    assert parse_curve("linear:50").max_level == 200
+
+
+@pytest.mark.parametrize("spec", ["table:10,50", "table:0,50,50", "table:", "cubic:3"])
+def test_bad_curves_are_rejected(spec):
+    with pytest.raises(ValueError):
+        parse_curve(spec)
+
+
+def test_short_table_curve_still_unlocks_every_chapter():
+    curve = parse_curve("table:0,50,120,200,300")
+    assert curve.max_level == 5
+    assert max(UNLOCK_LEVELS.values()) > curve.max_level
+    assert unlock_level(20, curve) == 5
+    assert curve.xp_for(unlock_level(20, curve)) == 300
+    assert curve.level(10000) >= unlock_level(20, curve)
+    assert unlock_level(17, curve) == 3
+
+
+def test_unlock_levels_within_the_curve_are_unchanged():
+    curve = parse_curve("linear:50")
+    assert all(unlock_level(num, curve) == level for num, level in UNLOCK_LEVELS.items())
+    assert unlock_level(1, curve) == 1
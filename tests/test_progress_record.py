@@ -0,0 +1,42 @@
+import struct
+
+import pytest
+
+from progress_record import RECORD_SIZE, ProgressRecord, pack_records, unpack_records
+
+MAX_FIELD = 2**32 - 1
+
+
+def test_round_trip():
+    record = ProgressRecord(xp=510, game_xp=25, chapters=0b1010, quizzes=0b10, achievements=0b111)
+    data = record.to_bytes()
+    assert len(data) == RECORD_SIZE == 21
+    assert ProgressRecord.from_bytes(data) == record
+
+
+def test_round_trip_at_the_widest_values():
+    record = ProgressRecord(MAX_FIELD, MAX_FIELD, MAX_FIELD, MAX_FIELD, MAX_FIELD)
+    assert ProgressRecord.from_bytes(record.to_bytes()) == record
+    # Chapter 31 is the highest bit a 32-bit mask can hold
+    record = ProgressRecord(chapters=1 << 31)
+    assert ProgressRecord.from_bytes(record.to_bytes()).is_completed(31)
+
+
+def test_values_past_the_field_width_are_rejected():
+    with pytest.raises(struct.error):
+        ProgressRecord(xp=MAX_FIELD + 1).to_bytes()
+    with pytest.raises(struct.error):
+        ProgressRecord(chapters=1 << 32).to_bytes()
+
+
+def test_unknown_version_and_wrong_size_are_rejected():
+    data = ProgressRecord(xp=1).to_bytes()
+    with pytest.raises(ValueError):
+        ProgressRecord.from_bytes(b"\x01" + data[1:])
+    with pytest.raises(ValueError):
+        ProgressRecord.from_bytes(data + b"\x00")
+
+
+def test_many_records_in_one_blob():
+    records = [ProgressRecord(xp=n, chapters=1 << n) for n in range(5)]
+    assert unpack_records(pack_records(records)) == records
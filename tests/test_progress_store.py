@@ -0,0 +1,138 @@
+import time
+
+import pytest
+
+from progress_record import ProgressRecord
+from progress_store import JournalStore, ProgressJournal, ProgressStore
+from write_behind import WriteBehind
+
+
+class FlakyStore(ProgressStore):
+    """In-memory store whose first ``failures`` writes raise."""
+
+    def __init__(self, failures=0):
+        super().__init__()
+        self.failures = failures
+        self.rows = {}
+
+    def _read(self, user_id):
+        return self.rows.get(user_id, ProgressRecord()).copy()
+
+    def _write(self, user_id, record):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk full")
+        self.rows[user_id] = record.copy()
+
+
+def test_failed_save_is_written_by_the_next_save():
+    store = FlakyStore(failures=1)
+    record = ProgressRecord(xp=100)
+    with pytest.raises(OSError):
+        store.save("learner", record)
+    assert store.save("learner", record) is True
+    assert store.rows["learner"] == record
+
+
+def test_write_behind_retries_a_failed_save():
+    store = FlakyStore(failures=1)
+    # A long window keeps the writer thread asleep; flush() drains here
+    writer = WriteBehind(store, window=60)
+    writer.mark_dirty("learner", ProgressRecord(xp=100))
+    writer.flush()
+    assert "learner" not in store.rows
+    writer.flush()
+    assert store.rows["learner"] == ProgressRecord(xp=100)
+    assert writer.stats()["failures"] == 1
+    assert writer.stats()["pending"] == 0
+
+
+def test_journal_store_reloads_what_it_saved(tmp_path):
+    store = JournalStore(str(tmp_path / "progress.json"))
+    store.save("learner", ProgressRecord(xp=100, chapters=0b110))
+    assert JournalStore(str(tmp_path / "progress.json")).load("learner") == ProgressRecord(xp=100, chapters=0b110)
+
+
+def test_unchanged_progress_is_not_scheduled():
+    store = FlakyStore()
+    store.rows["learner"] = ProgressRecord(xp=100)
+    writer = WriteBehind(store, window=60)
+    writer.load("learner")
+    assert writer.mark_dirty("learner", ProgressRecord(xp=100)) is False
+    assert writer.stats()["pending"] == 0
+    assert writer.stats()["queue_depth"] == 0
+    assert writer.mark_dirty("learner", ProgressRecord(xp=150)) is True
+
+
+def test_writes_count_only_saves_that_wrote():
+    store = FlakyStore()
+    writer = WriteBehind(store, window=60)
+    writer.load("learner")
+    writer.mark_dirty("learner", ProgressRecord(xp=100))
+    writer.mark_dirty("learner", ProgressRecord())  # back to what was loaded
+    writer.flush()
+    assert writer.stats()["writes"] == 0
+    writer.mark_dirty("learner", ProgressRecord(xp=100))
+    writer.flush()
+    assert writer.stats()["writes"] == 1
+
+
+def test_writer_empties_the_queue_on_each_drain():
+    store = FlakyStore()
+    writer = WriteBehind(store, window=0.01, max_queue=256)
+    for xp in range(1, 21):
+        for n in range(200):
+            writer.mark_dirty(f"learner{n}", ProgressRecord(xp=xp))
+        deadline = time.monotonic() + 5
+        while writer.stats()["pending"]:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+    writer.flush()
+    stats = writer.stats()
+    assert stats["overflows"] == 0
+    assert stats["writes"] == 4000
+
+
+def test_journal_store_keeps_only_recent_users(tmp_path):
+    store = JournalStore(str(tmp_path / "progress.json"), max_users=2)
+    for n in range(5):
+        store.save(f"learner{n}", ProgressRecord(xp=n + 1))
+    assert list(store._journals) == ["learner3", "learner4"]
+    assert list(store._last_saved) == ["learner3", "learner4"]
+    # A forgotten learner is replayed from disk
+    assert store.load("learner0") == ProgressRecord(xp=1)
+
+
+def test_journal_repairs_a_torn_tail(tmp_path):
+    path = str(tmp_path / "progress.json")
+    journal = ProgressJournal(path)
+    journal.save(ProgressRecord(xp=10))
+    with open(journal.log_path, "a") as f:
+        f.write('{"xp":2')  # crash in the middle of an append
+    journal = ProgressJournal(path)
+    assert journal.load() == ProgressRecord(xp=10)
+    journal.save(ProgressRecord(xp=20, chapters=0b10))
+    assert ProgressJournal(path).load() == ProgressRecord(xp=20, chapters=0b10)
+
+
+def test_failing_store_is_reported_and_backs_off(caplog):
+    store = FlakyStore(failures=1000)
+    writer = WriteBehind(store, window=0.01, max_retries=3, retry_delay=0.05)
+    writer.mark_dirty("learner", ProgressRecord(xp=100))
+    # 0.05 + 0.1 + 0.2 s of backoff: every retry is spent well within a second
+    deadline = time.monotonic() + 2
+    while writer.stats()["dropped"] == 0:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    time.sleep(0.1)
+    stats = writer.stats()
+    assert stats["failures"] == 4
+    assert stats["pending"] == 0
+    assert "Saving progress for learner failed" in caplog.text
+    assert "Gave up saving progress for learner" in caplog.text
+
+
+def test_journal_reads_the_original_progress_json(tmp_path):
+    path = tmp_path / "progress.json"
+    path.write_text('{"xp": 120, "game_xp": 15, "completed_chapters": [1, 2, 4]}')
+    assert ProgressJournal(str(path)).load() == ProgressRecord(xp=120, game_xp=15, chapters=0b10110)
@@ -0,0 +1,101 @@
+# Startup warm-up: builds every shared cache before the first learner arrives
+#
+#   python warmup.py   # warm up in this process and print what each step cost
+#
+# serve.py runs warm_up() before it starts the server, so the health check
+# only answers once everything is built, and the first visit to any page
+# pays for none of it. Every step fills a per-process cache that all
+# sessions share: imported content units, compiled quiz answer tables,
+# chapter banners and the stylesheet in the content cache, each chapter's
+# compiled search text (render_cache, on disk as well) and the search index.
+
+import time
+
+from book import PAGES, PAGE_IDS, QUIZ, chapters_info, divider_html, load_unit, page_renderer
+from content_cache import content_cache
+from perf import add_stats_source
+
+# What the last warm_up() did: (step, milliseconds, what it built)
+last_report = []
+
+
+def _content_units():
+    units = sorted({p.unit for p in PAGES.values() if p.unit is not None})
+    for unit in units:
+        load_unit(unit)
+    return f"{len(units)} units"
+
+
+def _quiz_tables():
+    quiz_pages = [page_id for page_id in PAGE_IDS if PAGES[page_id].kind == QUIZ]
+    for page_id in quiz_pages:
+        page_renderer(page_id)
+    return f"{len(quiz_pages)} quizzes"
+
+
+def _page_renderers():
+    pages = [page_id for page_id in PAGE_IDS if PAGES[page_id].unit is not None and PAGES[page_id].kind != QUIZ]
+    for page_id in pages:
+        page_renderer(page_id)
+    return f"{len(pages)} pages"
+
+
+def _dividers():
+    for num in chapters_info:
+        divider_html(num)
+    return f"{len(chapters_info)} banners"
+
+
+def _stylesheet():
+    from styles import stylesheet
+
+    return f"{len(stylesheet())} bytes"
+
+
+def _render_cache():
+    from search import page_texts
+
+    return f"{len(page_texts())} pages"
+
+
+def _search_index():
+    from search import get_search_index
+
+    index = get_search_index()
+    return f"{len(index.postings)} terms, {len(index.vocabulary.words)} words"
+
+
+STEPS = [
+    ("content units", _content_units),
+    ("quiz answer tables", _quiz_tables),
+    ("page renderers", _page_renderers),
+    ("chapter banners", _dividers),
+    ("stylesheet", _stylesheet),
+    ("render cache", _render_cache),
+    ("search index", _search_index),
+]
+
+
+def warm_up():
+    report = []
+    for name, step in STEPS:
+        start = time.perf_counter()
+        detail = step()
+        report.append((name, (time.perf_counter() - start) * 1000, detail))
+    last_report[:] = report
+    return report
+
+
+def print_report(report):
+    for name, ms, detail in report:
+        print(f"warm-up {name:20} {ms:8.1f} ms  {detail}")
+    cache = content_cache.stats()
+    print(f"warm-up {'total':20} {sum(ms for _, ms, _ in report):8.1f} ms  "
+          f"content cache {cache['entries']} entries, {cache['bytes'] // 1024} KiB")
+
+
+add_stats_source("warmup", lambda: {name: {"ms": round(ms, 2), "built": detail} for name, ms, detail in last_report})
+
+
+if __name__ == "__main__":
+    print_report(warm_up())
@@ -0,0 +1,186 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# --- Write-Behind Progress Writer ---
+class WriteBehind:
+    """Coalescing write-behind in front of a ProgressStore.
+
+    ``mark_dirty()`` only records the latest progress for a user and, if
+    that user wasn't already waiting, queues them for the writer thread.
+    Progress equal to what the store last loaded or saved (a rerun that
+    changed nothing) is not scheduled at all.
+    The writer waits ``window`` seconds before writing so every save made
+    in the meantime (all the save_progress() calls of one rerun, for a
+    window longer than a rerun) lands in a single durable write. The
+    Streamlit script thread never touches the disk.
+
+    A failed write is logged and retried after ``retry_delay`` seconds,
+    doubling each time, up to ``max_retries`` times; then that pending
+    record is dropped. Records hold a learner's whole progress, so their
+    next save writes everything again.
+    """
+
+    def __init__(self, store, window=0.5, max_queue=1024, max_retries=5, retry_delay=1.0):
+        self.store = store
+        self.window = window
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._attempts = {}
+        self._retry_at = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._writing = 0
+        self._in_flight = {}
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stats = {
+            "save_calls": 0,
+            "unchanged": 0,
+            "scheduled_writes": 0,
+            "writes": 0,
+            "overflows": 0,
+            "failures": 0,
+            "dropped": 0,
+        }
+        self._thread = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    # Returns True when this call scheduled a new durable write
+    def mark_dirty(self, user_id, progress):
+        with self._lock:
+            self._stats["save_calls"] += 1
+            if (
+                user_id not in self._pending
+                and user_id not in self._in_flight
+                and self.store.is_saved(user_id, progress)
+            ):
+                self._stats["unchanged"] += 1
+                return False
+            scheduled = user_id not in self._pending
+            self._pending[user_id] = progress.copy()
+            if not scheduled:
+                return False
+            self._stats["scheduled_writes"] += 1
+        try:
+            self._queue.put_nowait(user_id)
+        except queue.Full:
+            # Still pending; the next drain writes it with everyone else.
+            with self._lock:
+                self._stats["overflows"] += 1
+        return True
+
+    # Read-your-writes: pending progress wins over what is on disk
+    def load(self, user_id):
+        with self._lock:
+            if user_id in self._pending:
+                return self._pending[user_id].copy()
+        return self.store.load(user_id)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        stats["queue_depth"] = self._queue.qsize()
+        return stats
+
+    # Write everything pending now, on the calling thread, retries included
+    def flush(self):
+        self._drain(force=True)
+        with self._lock:
+            while self._writing:
+                self._idle.wait()
+
+    def _run(self):
+        while True:
+            self._queue.get()
+            if self.window:
+                time.sleep(self.window)
+            # One drain writes everyone queued so far
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._drain()
+
+    # Users waiting out a retry delay stay pending unless `force`
+    def _drain(self, force=False):
+        with self._lock:
+            now = time.monotonic()
+            if force:
+                batch, self._pending = self._pending, {}
+            else:
+                batch = {
+                    user_id: progress for user_id, progress in self._pending.items()
+                    if self._retry_at.get(user_id, 0) <= now
+                }
+                for user_id in batch:
+                    del self._pending[user_id]
+            self._writing += 1
+            for user_id in batch:
+                self._in_flight[user_id] = self._in_flight.get(user_id, 0) + 1
+        try:
+            for user_id, progress in batch.items():
+                try:
+                    written = self.store.save(user_id, progress)
+                except Exception:
+                    with self._lock:
+                        attempts = self._attempts.get(user_id, 0) + 1
+                    logger.exception("Saving progress for %s failed (attempt %d)", user_id, attempts)
+                    with self._lock:
+                        self._done(user_id)
+                        self._stats["failures"] += 1
+                        delay = self._retry_later(user_id, progress, attempts)
+                    if delay is not None:
+                        timer = threading.Timer(delay, self._wake, [user_id])
+                        timer.daemon = True
+                        timer.start()
+                else:
+                    with self._lock:
+                        self._done(user_id)
+                        self._attempts.pop(user_id, None)
+                        self._retry_at.pop(user_id, None)
+                        # False: nothing changed since the last write
+                        if written:
+                            self._stats["writes"] += 1
+        finally:
+            with self._lock:
+                self._writing -= 1
+                self._idle.notify_all()
+
+    # Called with the lock held after a failed write; returns the retry
+    # delay, or None once the user has run out of retries
+    def _retry_later(self, user_id, progress, attempts):
+        if attempts > self.max_retries:
+            self._attempts.pop(user_id, None)
+            self._retry_at.pop(user_id, None)
+            self._stats["dropped"] += 1
+            logger.error("Gave up saving progress for %s after %d attempts", user_id, attempts)
+            return None
+        delay = self.retry_delay * 2 ** (attempts - 1)
+        self._attempts[user_id] = attempts
+        self._retry_at[user_id] = time.monotonic() + delay
+        # A newer save made meanwhile is already pending and wins
+        self._pending.setdefault(user_id, progress)
+        return delay
+
+    def _wake(self, user_id):
+        try:
+            self._queue.put_nowait(user_id)
+        except queue.Full:
+            pass
+
+    # Called with the lock held once a user's write has finished
+    def _done(self, user_id):
+        if self._in_flight[user_id] == 1:
+            del self._in_flight[user_id]
+        else:
+            self._in_flight[user_id] -= 1
+